@@ -2,118 +2,161 @@
 # Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
-# API of the pyiron_base module - in alphabetical order
 # Internal init
+import importlib
+
 import pyiron_base._version
-from pyiron_base.interfaces.factory import PyironFactory
-from pyiron_base.interfaces.has_groups import HasGroups
-from pyiron_base.interfaces.has_hdf import HasHDF
-from pyiron_base.interfaces.object import HasDatabase, HasStorage, PyironObject
-from pyiron_base.jobs.datamining import PyironTable, TableJob
-from pyiron_base.jobs.dynamic import warn_dynamic_job_classes
-from pyiron_base.jobs.flex.factory import create_job_factory
-from pyiron_base.jobs.job.extension.executable import Executable
-from pyiron_base.jobs.job.extension.jobstatus import (
-    JobStatus,
-    job_status_finished_lst,
-    job_status_lst,
-    job_status_successful_lst,
-)
-from pyiron_base.jobs.job.extension.server.queuestatus import validate_que_request
-from pyiron_base.jobs.job.factory import JobFactoryCore
-from pyiron_base.jobs.job.generic import GenericJob
-from pyiron_base.jobs.job.interactive import InteractiveBase
-from pyiron_base.jobs.job.jobtype import JOB_CLASS_DICT, JobType, JobTypeChoice
-from pyiron_base.jobs.job.template import PythonTemplateJob, TemplateJob
-from pyiron_base.jobs.job.toolkit import BaseTools, Toolkit
-from pyiron_base.jobs.master.flexible import FlexibleMaster
-from pyiron_base.jobs.master.generic import GenericMaster, get_function_from_string
-from pyiron_base.jobs.master.interactivewrapper import InteractiveWrapper
-from pyiron_base.jobs.master.list import ListMaster
-from pyiron_base.jobs.master.parallel import JobGenerator, ParallelMaster
-from pyiron_base.maintenance.generic import (
-    LocalMaintenance,
-    Maintenance,
-    add_module_conversion,
-)
-from pyiron_base.project.decorator import job
-from pyiron_base.project.external import Notebook, dump, load
-from pyiron_base.project.generic import Creator, Project
 from pyiron_base.state import state
-from pyiron_base.state.install import install_dialog
-from pyiron_base.state.settings import Settings
-from pyiron_base.storage.datacontainer import DataContainer
-from pyiron_base.storage.filedata import FileData, FileDataTemplate, load_file
-from pyiron_base.storage.flattenedstorage import FlattenedStorage
-from pyiron_base.storage.has_stored_traits import HasStoredTraits
-from pyiron_base.storage.hdfio import FileHDFio, ProjectHDFio
-from pyiron_base.storage.inputlist import InputList
-from pyiron_base.storage.parameters import GenericParameters
-from pyiron_base.utils.parser import Logstatus, extract_data_from_file
 
-Project.register_tools("base", BaseTools)
+# API of the pyiron_base module - in alphabetical order
+# The API is imported lazily on first access (PEP 562), so that importing pyiron_base, e.g. in the job wrapper started
+# on compute nodes, only loads the modules that are actually used.
+_lazy_imports = {
+    "PyironFactory": "pyiron_base.interfaces.factory",
+    "HasGroups": "pyiron_base.interfaces.has_groups",
+    "HasHDF": "pyiron_base.interfaces.has_hdf",
+    "HasDatabase": "pyiron_base.interfaces.object",
+    "HasStorage": "pyiron_base.interfaces.object",
+    "PyironObject": "pyiron_base.interfaces.object",
+    "PyironTable": "pyiron_base.jobs.datamining",
+    "TableJob": "pyiron_base.jobs.datamining",
+    "warn_dynamic_job_classes": "pyiron_base.jobs.dynamic",
+    "create_job_factory": "pyiron_base.jobs.flex.factory",
+    "Executable": "pyiron_base.jobs.job.extension.executable",
+    "JobStatus": "pyiron_base.jobs.job.extension.jobstatus",
+    "job_status_finished_lst": "pyiron_base.jobs.job.extension.jobstatus",
+    "job_status_lst": "pyiron_base.jobs.job.extension.jobstatus",
+    "job_status_successful_lst": "pyiron_base.jobs.job.extension.jobstatus",
+    "validate_que_request": "pyiron_base.jobs.job.extension.server.queuestatus",
+    "JobFactoryCore": "pyiron_base.jobs.job.factory",
+    "GenericJob": "pyiron_base.jobs.job.generic",
+    "InteractiveBase": "pyiron_base.jobs.job.interactive",
+    "JOB_CLASS_DICT": "pyiron_base.jobs.job.jobtype",
+    "JobType": "pyiron_base.jobs.job.jobtype",
+    "JobTypeChoice": "pyiron_base.jobs.job.jobtype",
+    "PythonTemplateJob": "pyiron_base.jobs.job.template",
+    "TemplateJob": "pyiron_base.jobs.job.template",
+    "BaseTools": "pyiron_base.jobs.job.toolkit",
+    "Toolkit": "pyiron_base.jobs.job.toolkit",
+    "FlexibleMaster": "pyiron_base.jobs.master.flexible",
+    "GenericMaster": "pyiron_base.jobs.master.generic",
+    "get_function_from_string": "pyiron_base.jobs.master.generic",
+    "InteractiveWrapper": "pyiron_base.jobs.master.interactivewrapper",
+    "ListMaster": "pyiron_base.jobs.master.list",
+    "JobGenerator": "pyiron_base.jobs.master.parallel",
+    "ParallelMaster": "pyiron_base.jobs.master.parallel",
+    "LocalMaintenance": "pyiron_base.maintenance.generic",
+    "Maintenance": "pyiron_base.maintenance.generic",
+    "add_module_conversion": "pyiron_base.maintenance.generic",
+    "job": "pyiron_base.project.decorator",
+    "Notebook": "pyiron_base.project.external",
+    "dump": "pyiron_base.project.external",
+    "load": "pyiron_base.project.external",
+    "Creator": "pyiron_base.project.generic",
+    "Project": "pyiron_base.project.generic",
+    "install_dialog": "pyiron_base.state.install",
+    "Settings": "pyiron_base.state.settings",
+    "DataContainer": "pyiron_base.storage.datacontainer",
+    "FileData": "pyiron_base.storage.filedata",
+    "FileDataTemplate": "pyiron_base.storage.filedata",
+    "load_file": "pyiron_base.storage.filedata",
+    "FlattenedStorage": "pyiron_base.storage.flattenedstorage",
+    "HasStoredTraits": "pyiron_base.storage.has_stored_traits",
+    "FileHDFio": "pyiron_base.storage.hdfio",
+    "JobContainerPolicy": "pyiron_base.storage.hdfio",
+    "ProjectHDFio": "pyiron_base.storage.hdfio",
+    "StoragePolicy": "pyiron_base.storage.hdfio",
+    "InputList": "pyiron_base.storage.inputlist",
+    "GenericParameters": "pyiron_base.storage.parameters",
+    "Logstatus": "pyiron_base.utils.parser",
+    "extract_data_from_file": "pyiron_base.utils.parser",
+}
 
 # Set version of pyiron_base
 __version__ = pyiron_base._version.__version__
 
-# Dynamic job class definition is no longer supported in pyiron_base >=0.7.0
-warn_dynamic_job_classes(
-    resource_folder_lst=state.settings.resource_paths,
-    logger=state.logger,
-)
+
+def __getattr__(name: str):
+    """
+    Import the public API of pyiron_base on first access.
+
+    Args:
+        name (str): name of the object or sub module
+
+    Returns:
+        object: the requested object
+    """
+    if name in _lazy_imports:
+        value = getattr(importlib.import_module(_lazy_imports[name]), name)
+        globals()[name] = value
+        return value
+    try:
+        # sub modules used to be available as attributes after importing pyiron_base, since everything was imported
+        return importlib.import_module(f"{__name__}.{name}")
+    except ModuleNotFoundError as e:
+        if e.name != f"{__name__}.{name}":
+            raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_lazy_imports))
+
 
 __all__ = [
-    PyironFactory,
-    FlattenedStorage,
-    FileHDFio,
-    ProjectHDFio,
-    DataContainer,
-    HasStoredTraits,
-    InputList,
-    GenericParameters,
-    Executable,
-    Notebook,
-    load,
-    dump,
-    create_job_factory,
-    validate_que_request,
-    GenericJob,
-    InteractiveBase,
-    JobStatus,
-    job,
-    job_status_successful_lst,
-    job_status_finished_lst,
-    job_status_lst,
-    JOB_CLASS_DICT,
-    JobType,
-    JobTypeChoice,
-    TemplateJob,
-    PythonTemplateJob,
-    JobFactoryCore,
-    FlexibleMaster,
-    GenericMaster,
-    get_function_from_string,
-    InteractiveWrapper,
-    ListMaster,
-    ParallelMaster,
-    JobGenerator,
-    Creator,
-    Logstatus,
-    extract_data_from_file,
-    Settings,
-    install_dialog,
-    PyironTable,
-    TableJob,
-    HasDatabase,
-    HasStorage,
-    PyironObject,
-    HasGroups,
-    HasHDF,
-    Toolkit,
-    add_module_conversion,
-    LocalMaintenance,
-    Maintenance,
-    load_file,
-    FileDataTemplate,
-    FileData,
+    "PyironFactory",
+    "FlattenedStorage",
+    "FileHDFio",
+    "ProjectHDFio",
+    "StoragePolicy",
+    "JobContainerPolicy",
+    "DataContainer",
+    "HasStoredTraits",
+    "InputList",
+    "GenericParameters",
+    "Executable",
+    "Notebook",
+    "load",
+    "dump",
+    "create_job_factory",
+    "validate_que_request",
+    "GenericJob",
+    "InteractiveBase",
+    "JobStatus",
+    "job",
+    "job_status_successful_lst",
+    "job_status_finished_lst",
+    "job_status_lst",
+    "JOB_CLASS_DICT",
+    "JobType",
+    "JobTypeChoice",
+    "TemplateJob",
+    "PythonTemplateJob",
+    "JobFactoryCore",
+    "FlexibleMaster",
+    "GenericMaster",
+    "get_function_from_string",
+    "InteractiveWrapper",
+    "ListMaster",
+    "ParallelMaster",
+    "JobGenerator",
+    "Creator",
+    "Logstatus",
+    "extract_data_from_file",
+    "Settings",
+    "install_dialog",
+    "PyironTable",
+    "TableJob",
+    "HasDatabase",
+    "HasStorage",
+    "PyironObject",
+    "HasGroups",
+    "HasHDF",
+    "Toolkit",
+    "add_module_conversion",
+    "LocalMaintenance",
+    "Maintenance",
+    "load_file",
+    "FileDataTemplate",
+    "FileData",
 ]
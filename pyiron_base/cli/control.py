@@ -5,11 +5,11 @@ CLI for various pyiron utilities.
 """
 
 import argparse
+import importlib
 import os
+import sys
 import warnings
 
-from pyiron_base.cli import cp, install, ls, mv, reloadfile, rm, wrapper
-
 __author__ = "Marvin Poul"
 __copyright__ = (
     "Copyright 2020, Max-Planck-Institut für Eisenforschung GmbH - "
@@ -21,15 +21,43 @@ __email__ = "poul@mpie.de"
 __status__ = "development"
 __date__ = "26 Jun, 2020"
 
-cli_modules = {
-    "cp": cp,
-    "ls": ls,
-    "mv": mv,
-    "rm": rm,
-    "install": install,
-    "reloadfile": reloadfile,
-    "wrapper": wrapper,
-}
+_cli_module_names = ("cp", "ls", "mv", "rm", "install", "reloadfile", "wrapper")
+
+
+def _import_cli_module(name: str):
+    return importlib.import_module("pyiron_base.cli." + name)
+
+
+def __getattr__(name: str):
+    # the sub command modules import most of pyiron_base, so they are only loaded on first access
+    if name == "cli_modules":
+        modules = {n: _import_cli_module(n) for n in _cli_module_names}
+        globals()["cli_modules"] = modules
+        return modules
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _get_cli_modules(argv: list) -> dict:
+    """
+    Select the sub command modules to register for the given command line.
+
+    If a known sub command is given, only its module is imported, so that e.g. `pyiron wrapper` does not pay for
+    importing the dependencies of all other sub commands.
+
+    Args:
+        argv (list): command line arguments without the program name
+
+    Returns:
+        dict: sub command names mapped to their modules
+    """
+    command = next((arg for arg in argv if not arg.startswith("-")), None)
+    modules = globals().get("cli_modules")
+    if command in _cli_module_names:
+        if modules is None:
+            return {command: _import_cli_module(command)}
+        elif command in modules:
+            return {command: modules[command]}
+    return __getattr__("cli_modules") if modules is None else modules
 
 
 def main() -> None:
@@ -41,7 +69,7 @@ def main() -> None:
 
     parser.set_defaults(cli=lambda _: parser.error("no sub command given"))
 
-    for name, mod in cli_modules.items():
+    for name, mod in _get_cli_modules(sys.argv[1:]).items():
         try:
             sub_parser = subs.add_parser(
                 name,
@@ -9,11 +9,11 @@ import datetime
 import os
 from abc import ABCMeta
 from collections.abc import Iterable
-from typing import List, Optional, Union
+from typing import List, Optional, Set, Tuple, Union
 
 import numpy as np
 import pandas
-from h5io_browser.base import _read_hdf, _write_hdf
+from h5io_browser.base import _read_hdf
 from pyfileindex import PyFileIndex
 
 from pyiron_base.database.interface import IsDatabase
@@ -164,6 +164,7 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
             self._job_table = self._job_table[
                 self._job_table.id != item_id
             ].reset_index(drop=True)
+            self._status_epoch += 1
         else:
             raise ValueError
 
@@ -188,6 +189,7 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
             self._job_table = df[np.array(self._columns)]
         else:
             self._job_table = pandas.DataFrame({k: [] for k in self._columns})
+        self._status_epoch += 1
 
     def get_child_ids(
         self,
@@ -428,6 +430,19 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
         """
         return self._job_table[self._job_table.id == job_id].status.values[0]
 
+    def get_job_status_dict(self, job_ids: List[int]) -> dict:
+        """
+        Get the status of multiple jobs selected by their job IDs
+
+        Args:
+            job_ids (list): job IDs as integers
+
+        Returns:
+            dict: status of the jobs by job ID, job IDs not found in the table are omitted
+        """
+        df = self._job_table[self._job_table.id.isin(job_ids)]
+        return {int(job_id): status for job_id, status in zip(df.id, df.status)}
+
     def get_job_working_directory(self, job_id: int) -> Union[str, None]:
         """
         Get the working directory of a particular job
@@ -441,11 +456,10 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
         try:
             db_entry = self.get_item_by_id(job_id)
             if db_entry and len(db_entry) > 0:
-                job_name = db_entry["subjob"][1:]
                 return os.path.join(
                     db_entry["project"],
-                    job_name + "_hdf5",
-                    job_name,
+                    _get_file_name(db_entry=db_entry) + "_hdf5",
+                    db_entry["subjob"][1:],
                 )
             else:
                 return None
@@ -453,7 +467,10 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
             return None
 
     def init_table(
-        self, fileindex: PyFileIndex, working_dir_lst: Optional[List[str]] = None
+        self,
+        fileindex: PyFileIndex,
+        working_dir_lst: Optional[List[str]] = None,
+        known_jobs: Optional[Set[Tuple[str, str]]] = None,
     ) -> List[dict]:
         """
         Initialize the filetable class
@@ -461,25 +478,27 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
         Args:
             fileindex (pandas.DataFrame): file system index for the current project path
             working_dir_lst (list/ None): list of working directories
+            known_jobs (set/ None): (project, subjob) tuples of the jobs which are already part of the table, these are
+                                    skipped when rescanning job container files
 
         Returns:
             list: list of dictionaries
         """
         if working_dir_lst is None:
             working_dir_lst = []
+        if known_jobs is None:
+            known_jobs = set()
         fileindex = fileindex[~fileindex.is_directory]
         fileindex = fileindex.iloc[fileindex.path.values.argsort()]
         job_lst = []
         for path, mtime in zip(fileindex.path, fileindex.mtime):
             try:  # Ignore HDF5 files which are not created by pyiron
-                job_dict = self.get_extract(path, mtime)
+                job_dict_lst = self.get_extract_lst(path, mtime, known_jobs=known_jobs)
             except (ValueError, OSError):
-                pass
-            else:
+                continue
+            for job_dict in job_dict_lst:
                 job_dict["id"] = len(working_dir_lst) + 1
-                working_dir_lst.append(
-                    job_dict["project"][:-1] + job_dict["subjob"] + "_hdf5/"
-                )
+                working_dir_lst.append(job_dict["project"] + job_dict["job"] + "_hdf5/")
                 if job_dict["project"] in working_dir_lst:
                     job_dict["masterid"] = (
                         working_dir_lst.index(job_dict["project"]) + 1
@@ -504,6 +523,7 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
             item_id = float(item_id)
         for k, v in par_dict.items():
             self._job_table.loc[self._job_table.id == int(item_id), k] = v
+        self._status_epoch += 1
 
     def set_job_status(self, job_id: int, status: str) -> None:
         """
@@ -524,22 +544,17 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
             job_id (int): The ID of the job.
             status (str): The new status of the job.
         """
-        if isinstance(job_id, Iterable):
-            for j_id in job_id:
-                db_entry = self.get_item_by_id(item_id=j_id)
-                _write_hdf(
-                    hdf_filehandle=db_entry["project"] + db_entry["subjob"] + ".h5",
-                    data=status,
-                    h5_path=db_entry["subjob"][1:] + "/status",
-                    overwrite="update",
-                )
-        else:
-            db_entry = self.get_item_by_id(item_id=job_id)
-            _write_hdf(
-                hdf_filehandle=db_entry["project"] + db_entry["subjob"] + ".h5",
+        from pyiron_base.storage.hdfio import _write_hdf_pooled
+
+        job_id_lst = job_id if isinstance(job_id, Iterable) else [job_id]
+        for j_id in job_id_lst:
+            db_entry = self.get_item_by_id(item_id=j_id)
+            _write_hdf_pooled(
+                file_name=db_entry["project"]
+                + _get_file_name(db_entry=db_entry)
+                + ".h5",
+                h5_path=db_entry["subjob"] + "/status",
                 data=status,
-                h5_path=db_entry["subjob"][1:] + "/status",
-                overwrite="update",
             )
 
     def update(self) -> None:
@@ -550,16 +565,33 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
             self._get_job_status_from_hdf5(job_id)
             for job_id in self._job_table.id.values
         ]
+        self._status_epoch += 1
         self._fileindex.update()
         if len(self._job_table) != 0:
             files_lst, working_dir_lst = zip(
                 *[
-                    [project + subjob[1:] + ".h5", project + subjob[1:] + "_hdf5"]
+                    [
+                        project + subjob.split("/")[1] + ".h5",
+                        project + subjob.split("/")[-1] + "_hdf5",
+                    ]
                     for project, subjob in zip(
                         self._job_table.project.values, self._job_table.subjob.values
                     )
                 ]
             )
+            # further jobs might have been added to job container files, which are therefore always rescanned
+            known_jobs = set(
+                zip(self._job_table.project.values, self._job_table.subjob.values)
+            )
+            container_files_lst = [
+                file_name
+                for file_name, job, subjob in zip(
+                    files_lst,
+                    self._job_table.job.values,
+                    self._job_table.subjob.values,
+                )
+                if subjob != "/" + job
+            ]
             sanitized_paths = self._fileindex.dataframe.path.str.replace("\\", "/")
             # The files_list is generated using project path values
             # In pyiron, these are all forced to be posix-like with /
@@ -568,14 +600,19 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
             # _fileindex.dataframe.path results
             df_new = self._fileindex.dataframe[
                 ~self._fileindex.dataframe.is_directory
-                & ~sanitized_paths.isin(files_lst)
+                & (
+                    ~sanitized_paths.isin(files_lst)
+                    | sanitized_paths.isin(container_files_lst)
+                )
             ]
         else:
-            files_lst, working_dir_lst = [], []
+            files_lst, working_dir_lst, known_jobs = [], [], set()
             df_new = self._fileindex.dataframe[~self._fileindex.dataframe.is_directory]
         if len(df_new) > 0:
             job_lst = self.init_table(
-                fileindex=df_new, working_dir_lst=list(working_dir_lst)
+                fileindex=df_new,
+                working_dir_lst=list(working_dir_lst),
+                known_jobs=known_jobs,
             )
             if len(job_lst) > 0:
                 df = pandas.DataFrame(job_lst)[self._columns]
@@ -586,27 +623,69 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
                 else:
                     self._job_table = df
 
+    @classmethod
+    def get_extract_lst(
+        cls,
+        path: str,
+        mtime: datetime.datetime,
+        known_jobs: Optional[Set[Tuple[str, str]]] = None,
+    ) -> List[dict]:
+        """
+        Extract the information of all jobs stored in a given file, which is either a single job or a job container
+        file.
+
+        Args:
+            path (str): The file path.
+            mtime (datetime.datetime): The modification time.
+            known_jobs (set, optional): (project, subjob) tuples of jobs to skip.
+
+        Returns:
+            List[dict]: A list of dictionaries containing the extracted job information.
+        """
+        from pyiron_base.storage.hdfio import _list_container_jobs
+
+        try:
+            return [cls.get_extract(path, mtime)]
+        except (ValueError, OSError):
+            container = os.path.splitext(os.path.basename(path))[0]
+            job_lst = _list_container_jobs(file_name=path, container=container)
+            if job_lst is None:
+                raise
+        project = os.path.dirname(path).replace("\\", "/") + "/"
+        return [
+            cls.get_extract(path, mtime, h5_path="/" + container + "/" + job)
+            for job in job_lst
+            if known_jobs is None
+            or (project, "/" + container + "/" + job) not in known_jobs
+        ]
+
     @staticmethod
-    def get_extract(path: str, mtime: datetime.datetime) -> dict:
+    def get_extract(
+        path: str, mtime: datetime.datetime, h5_path: Optional[str] = None
+    ) -> dict:
         """
         Extract job information from a given file path and modification time.
 
         Args:
             path (str): The file path.
             mtime (datetime.datetime): The modification time.
+            h5_path (str, optional): The path of the job inside the file, defaults to the file name without extension.
 
         Returns:
             dict: A dictionary containing the extracted job information.
         """
-        basename = os.path.basename(path)
-        job = os.path.splitext(basename)[0]
+        if h5_path is None:
+            h5_path = "/" + os.path.splitext(os.path.basename(path))[0]
+        job = h5_path.split("/")[-1]
         time = datetime.datetime.fromtimestamp(mtime)
         return_dict = table_columns.copy()
         return_dict.update(
             {
-                "status": get_job_status_from_file(hdf5_file=path, job_name=job),
+                "status": get_job_status_from_file(
+                    hdf5_file=path, job_name=h5_path[1:]
+                ),
                 "job": job,
-                "subjob": "/" + job,
+                "subjob": h5_path,
                 "project": os.path.dirname(path).replace("\\", "/") + "/",
                 # pyiron Project paths are forced to be posix-like with / instead of \
                 # in order for the contains and endswith tests down in _get_job_table
@@ -615,9 +694,11 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
                 "timestart": time,
                 "timestop": time,
                 "totalcputime": 0.0,
-                "hamilton": get_hamilton_from_file(hdf5_file=path, job_name=job),
+                "hamilton": get_hamilton_from_file(
+                    hdf5_file=path, job_name=h5_path[1:]
+                ),
                 "hamversion": get_hamilton_version_from_file(
-                    hdf5_file=path, job_name=job
+                    hdf5_file=path, job_name=h5_path[1:]
                 ),
             }
         )
@@ -636,10 +717,11 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
             str: The status of the job.
         """
         db_entry = self.get_item_by_id(job_id)
-        job_name = db_entry["subjob"][1:]
         return get_job_status_from_file(
-            hdf5_file=os.path.join(db_entry["project"], job_name + ".h5"),
-            job_name=job_name,
+            hdf5_file=os.path.join(
+                db_entry["project"], _get_file_name(db_entry=db_entry) + ".h5"
+            ),
+            job_name=db_entry["subjob"][1:],
         )
 
     def _get_job_table(
@@ -718,6 +800,20 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
         return False
 
 
+def _get_file_name(db_entry: dict) -> str:
+    """
+    Get the name of the HDF5 file of a job without extension, which is the first group of the path of the job inside
+    the file. Jobs stored in job container files share the file with other jobs.
+
+    Args:
+        db_entry (dict): The database entry of the job.
+
+    Returns:
+        str: The name of the HDF5 file without extension.
+    """
+    return db_entry["subjob"].split("/")[1]
+
+
 def filter_function(file_name: str) -> bool:
     """
     Filter function to check if a file name contains ".h5".
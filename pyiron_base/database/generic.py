@@ -656,6 +656,7 @@ class DatabaseAccess(IsDatabase):
 
             self.conn.execute(query, par_dict)
             self.conn.commit()
+        self._status_epoch += 1
         if not self._keep_connection:
             self.conn.close()
 
@@ -678,6 +679,7 @@ class DatabaseAccess(IsDatabase):
         if res.rowcount == 0:
             raise RuntimeError(f"Failed to delete job ({item_id}) from database!")
         self.conn.commit()
+        self._status_epoch += 1
 
         if not self._keep_connection:
             self.conn.close()
@@ -875,16 +877,47 @@ class DatabaseAccess(IsDatabase):
         except KeyError:
             return None
 
+    def get_job_status_dict(self, job_ids: List[int]) -> dict:
+        """
+        Get the status of multiple jobs selected by their job IDs with a single query per 500 jobs.
+
+        Args:
+            job_ids (list): job IDs as integers
+
+        Returns:
+            dict: status of the jobs by job ID, job IDs not found in the database are omitted
+        """
+        job_ids = [int(job_id) for job_id in job_ids]
+        status_dict = {}
+        for i in range(0, len(job_ids), 500):
+            query = select(
+                self.simulation_table.c["id"], self.simulation_table.c["status"]
+            ).where(self.simulation_table.c["id"].in_(job_ids[i : i + 500]))
+            try:
+                result = self.conn.execute(query)
+            except (OperationalError, DatabaseError):
+                if not self._sql_lite:
+                    self.conn = AutorestoredConnection(self._engine)
+                else:
+                    self.conn = self._engine.connect()
+                    self.conn.connection.create_function("like", 2, self.regexp)
+                result = self.conn.execute(query)
+            status_dict.update({row.id: row.status for row in result.fetchall()})
+        if not self._keep_connection:
+            self.conn.close()
+        return status_dict
+
     def get_job_working_directory(self, job_id: int) -> Union[str, None]:
         try:
             db_entry = self.get_item_by_id(job_id)
             if db_entry:
-                job_name = db_entry["subjob"][1:]
+                # the first group of the HDF5 path is named like the HDF5 file
+                file_name = db_entry["subjob"].split("/")[1]
                 return os.path.join(
                     db_entry["projectpath"],
                     db_entry["project"],
-                    job_name + "_hdf5",
-                    job_name,
+                    file_name + "_hdf5",
+                    db_entry["subjob"][1:],
                 )
             else:
                 return None
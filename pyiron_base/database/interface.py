@@ -34,6 +34,9 @@ class IsDatabase(ABC):
     Captures common interface for all database types in pyiron, e.g. SQL/SQLite/FileTable.
     """
 
+    # incremented on every write that may change a job status, JobStatus objects use it to invalidate their cache
+    _status_epoch = 0
+
     @property
     def view_mode(self) -> bool:
         """
@@ -236,6 +239,25 @@ class IsDatabase(ABC):
             item_id=job_id,
         )
 
+    def get_job_status_dict(self, job_ids: List[int]) -> dict:
+        """
+        Get the status of multiple jobs selected by their job IDs.
+
+        Subclasses should override this to query all jobs at once.
+
+        Args:
+            job_ids (list): job IDs as integers
+
+        Returns:
+            dict: status of the jobs by job ID, job IDs not found in the database are omitted
+        """
+        status_dict = {}
+        for job_id in job_ids:
+            status = self.get_job_status(job_id=job_id)
+            if status is not None:
+                status_dict[job_id] = status
+        return status_dict
+
     def get_table_headings(self, table_name: Optional[str] = None) -> List[str]:
         """
         Get column names; if given table_name can select one of multiple tables defined in the database, but subclasses
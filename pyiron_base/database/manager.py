@@ -31,10 +31,13 @@ class DatabaseManager(metaclass=Singleton):
         self._database = None
         self._use_local_database = False
         self._database_is_disabled = s.configuration["disable_database"]
-        self.open_connection()
+        # the connection is opened on first use, to keep importing pyiron_base fast
+        self._connection_pending = True
 
     @property
     def database(self):
+        if self._connection_pending:
+            self.open_connection()
         return self._database
 
     @property
@@ -119,6 +122,7 @@ class DatabaseManager(metaclass=Singleton):
         Internal function to open the connection to the database. Only after this function is called the database is
         accessable.
         """
+        self._connection_pending = False
         if self._database is None and not self.database_is_disabled:
             from pyiron_base.database.generic import DatabaseAccess
 
@@ -153,6 +157,8 @@ class DatabaseManager(metaclass=Singleton):
     def open_local_sqlite_connection(self, connection_string: str) -> None:
         from pyiron_base.database.generic import DatabaseAccess
 
+        self._connection_pending = False
+
         self._database = DatabaseAccess(connection_string, self.sql_table_name)
         self._use_local_database = True
         self._database_is_disabled = False
@@ -186,6 +192,7 @@ class DatabaseManager(metaclass=Singleton):
         """
         Internal function to close the connection to the database.
         """
+        self._connection_pending = False
         if self._database is not None:
             self._database.conn.close()
             self._database = None
@@ -11,7 +11,7 @@ import os
 import posixpath
 import shutil
 import warnings
-from typing import Any, Generator, List, Optional, Union
+from typing import Any, Dict, Generator, List, Optional, Union
 
 from pyiron_snippets.deprecate import deprecate
 
@@ -36,7 +36,7 @@ from pyiron_base.jobs.job.util import (
     _rename_job,
 )
 from pyiron_base.state import state
-from pyiron_base.storage.hdfio import ProjectHDFio
+from pyiron_base.storage.hdfio import DatasetView, ProjectHDFio
 
 __author__ = "Jan Janssen"
 __copyright__ = (
@@ -445,6 +445,20 @@ class JobCore(HasGroups):
             project (ProjectHDFio): HDF5 project
         """
         self._hdf5 = project.copy()
+        self._hdf5_content = HDF5Content(project_hdf5=self._hdf5)
+
+    @property
+    def output_view(self) -> DatasetView:
+        """
+        Read-only view of the job output, which returns arrays as lazy proxies that read only the selected part of the
+        array from the HDF5 file when sliced.
+
+        >>> job.output_view["generic/positions"][-1]
+
+        Returns:
+            DatasetView: view of the output group
+        """
+        return DatasetView(hdf=self.project_hdf5.open("output"))
 
     @property
     def files_to_compress(self) -> list:
@@ -683,6 +697,21 @@ class JobCore(HasGroups):
                 return default
             raise
 
+    def get_many(self, names: List[str]) -> Dict[str, Any]:
+        """
+        Read multiple items of the job, opening the HDF5 file of the job only once for all of them.
+
+        >>> energy, steps = job.get_many(["output/generic/energy_tot", "output/generic/steps"]).values()
+
+        Args:
+            names (List[str]): paths to the data, resolved the same way as in :meth:`__getitem__`
+
+        Returns:
+            Dict[str, Any]: dictionary mapping the paths to the data, None for paths which were not found
+        """
+        with self.project_hdf5.session():
+            return {name: self._get_item(item=name) for name in names}
+
     def load(
         self, job_specifier: Union[str, int], convert_to_object: bool = True
     ) -> Union["pyiron_base.job.generic.GenericJob", "JobCore"]:
@@ -1066,6 +1095,18 @@ class JobCore(HasGroups):
         Args:
             item (str, slice): path to the data or key of the data object
 
+        Returns:
+            dict, list, float, int, :class:`.DataContainer`, None: data or data object; if nothing is found None is returned
+        """
+        return self._get_item(item=item)
+
+    def _get_item(self, item: str) -> Any:
+        """
+        Internal function to get/read data from the HDF5 file, child jobs or access log files, see :meth:`__getitem__`.
+
+        Args:
+            item (str): path to the data or key of the data object
+
         Returns:
             dict, list, float, int, :class:`.DataContainer`, None: data or data object; if nothing is found None is returned
         """
@@ -2,7 +2,9 @@
 # Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
+import json
 import os
+import time
 from dataclasses import asdict, fields
 from typing import List, Optional, Tuple, Union
 
@@ -27,6 +29,11 @@ __email__ = "janssen@mpie.de"
 __status__ = "production"
 __date__ = "Sep 1, 2017"
 
+# executables found by the ExecutableResolver, by resource paths, code name and module, together with the modification
+# times of the bin directories they were found in
+_executable_cache = {}
+_executable_cache_file_loaded = None
+
 
 class Executable(HasDict):
     __hdf_version__ = "0.3.0"
@@ -288,11 +295,11 @@ class Executable(HasDict):
         Returns:
             dict: list of the available version
         """
-        return ExecutableResolver(
+        return _resolve_executables(
             resource_paths=self.path_bin,
             code=self.storage.name,
             module=self._module,
-        ).dict()
+        )
 
     def _executable_select(self) -> str:
         """
@@ -311,3 +318,107 @@ class Executable(HasDict):
 
     def _get_hdf_group_name(self) -> str:
         return "executable"
+
+
+def _resolve_executables(resource_paths: List[str], code: str, module: str) -> dict:
+    """
+    Find the executables of a code in the resource paths, reusing the result of earlier searches.
+
+    Searching the resource paths is slow on networked file systems, so the executables found are cached by resource
+    paths, code name and module. The cache is validated by the modification times of the bin directories, so adding,
+    removing or renaming executables invalidates it, while changing the permissions of an existing file does not. If
+    the executable_cache_file setting is set, the cache is also stored in this file to be reused by later sessions.
+
+    Args:
+        resource_paths (list): base paths for resource locations
+        code (str): name of the simulation code
+        module (str): name of the module the code is part of
+
+    Returns:
+        dict: paths of the executables by version
+    """
+    key = json.dumps([list(resource_paths), code, module])
+    mtimes = _get_bin_mtimes(resource_paths=resource_paths, module=module)
+    cache_file = state.settings.configuration.get("executable_cache_file")
+    if cache_file and key not in _executable_cache:
+        _load_executable_cache(cache_file=cache_file)
+    cached = _executable_cache.get(key)
+    if cached is not None and cached["mtimes"] == mtimes:
+        return dict(cached["executables"])
+    executables = ExecutableResolver(
+        resource_paths=resource_paths, code=code, module=module
+    ).dict()
+    # directories changed within the last seconds might change again without a new modification time on file
+    # systems with a coarse time resolution, so they are searched again the next time
+    racy = time.time_ns() - 2 * 10**9
+    if all(mtime is None or mtime < racy for mtime in mtimes):
+        _executable_cache[key] = {"mtimes": mtimes, "executables": executables}
+        if cache_file:
+            _dump_executable_cache(cache_file=cache_file)
+    return dict(executables)
+
+
+def _get_bin_mtimes(resource_paths: List[str], module: str) -> List[Optional[int]]:
+    """
+    Get the modification times of the bin directories of a module in the resource paths.
+
+    Args:
+        resource_paths (list): base paths for resource locations
+        module (str): name of the module
+
+    Returns:
+        list: modification times in nanoseconds, None for missing directories
+    """
+    mtimes = []
+    for path in resource_paths:
+        try:
+            mtimes.append(os.stat(os.path.join(path, module, "bin")).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return mtimes
+
+
+def _load_executable_cache(cache_file: str) -> None:
+    """
+    Load the executables cached by earlier sessions, once per cache file.
+
+    Args:
+        cache_file (str): path to the cache file
+    """
+    global _executable_cache_file_loaded
+    if _executable_cache_file_loaded == cache_file:
+        return
+    _executable_cache_file_loaded = cache_file
+    try:
+        with open(cache_file) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return
+    if isinstance(cache, dict):
+        for key, value in cache.items():
+            _executable_cache.setdefault(key, value)
+
+
+def _dump_executable_cache(cache_file: str) -> None:
+    """
+    Store the cached executables, merged with the ones other sessions stored in the meantime.
+
+    Args:
+        cache_file (str): path to the cache file
+    """
+    try:
+        with open(cache_file) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    if not isinstance(cache, dict):
+        cache = {}
+    cache.update(_executable_cache)
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
@@ -5,7 +5,8 @@
 The JobStatus class belongs to the GenericJob object.
 """
 
-from typing import Optional, Union
+import time
+from typing import Iterable, Optional, Union
 
 from pyiron_base.utils.instance import static_isinstance
 
@@ -74,6 +75,12 @@ class JobStatus(object):
     """
     The JobStatus object handles the different states a job could have. The available states are: {}
 
+    Once a database and a job ID are set, the status read from the database is cached. Cached statuses are reused
+    until the database reports a write through this process or :attr:`cache_ttl_in_s` seconds have passed, so that
+    status checks in loops do not query the database every time. Changes of the status are written through to the
+    database and the cache at once. Use :meth:`refresh_from_database` to query the database explicitly and
+    :func:`refresh_job_status_lst` to refresh the statuses of many jobs with a single query.
+
     Args:
         initial_status (str): If no initial status is provided the status is set to 'initialized'
         db (DatabaseAccess): The database which is responsible for this job.
@@ -92,8 +99,15 @@ class JobStatus(object):
         .. attribute:: string
 
             job status as string
+
+        .. attribute:: cache_ttl_in_s
+
+            seconds for which a status read from the database is reused, changes by other processes become visible
+            after this time at the latest
     """
 
+    cache_ttl_in_s = 1.0
+
     def __init__(
         self,
         initial_status: str = "initialized",
@@ -106,6 +120,7 @@ class JobStatus(object):
         job_id: Optional[int] = None,
     ):
         super(JobStatus, self).__setattr__("_status_dict", {})
+        self._cache = None
         self._db = None
         self._job_id = None
         self.string = initial_status
@@ -146,6 +161,7 @@ class JobStatus(object):
         ):
             raise TypeError("The database has to be an DatabaseAccess object.")
         self._db = db
+        self._cache = None
 
     @property
     def job_id(self) -> int:
@@ -166,6 +182,7 @@ class JobStatus(object):
         if unique_id and not isinstance(unique_id, int):
             raise TypeError("The Job_ID should be an integer.")
         self._job_id = unique_id
+        self._cache = None
         self.refresh_status()
 
     @format_docstring_with_statuses(n_tabs=2)
@@ -203,21 +220,54 @@ class JobStatus(object):
     def refresh_status(self) -> None:
         """
         Refresh the job status - check if the database and job_id are set and if this is the case load the job status
-        from the database.
+        from the database, unless it is cached or the job is already finished.
         """
         if (
             self.database
             and self.job_id
+            and not self._is_cached()
             and not any([self._status_dict[i] for i in job_status_finished_lst])
         ):
+            self.refresh_from_database()
+
+    def refresh_from_database(self) -> None:
+        """
+        Load the job status from the database, regardless of the cached status.
+        """
+        if self.database and self.job_id:
             try:
                 status = self.database.get_job_status(job_id=self.job_id)
             except IndexError:
                 raise ValueError(
                     f"The job with ID {self.job_id} is not listed in the database anymore."
                 ) from None
-            self._reset()
-            self._status_dict[status] = True
+            self._set_cached_status(status=status)
+
+    def _is_cached(self) -> bool:
+        """
+        Check if the status was read from or written to the database recently and the database was not changed since.
+        The cache is a tuple of the database status epoch, the time of the last database access and the status stored
+        in the database.
+
+        Returns:
+            bool: True if the cached status is still valid
+        """
+        return (
+            self._cache is not None
+            and self._cache[0] == self.database._status_epoch
+            and time.monotonic() - self._cache[1] < self.cache_ttl_in_s
+        )
+
+    def _set_cached_status(self, status: str) -> None:
+        """
+        Private function: Set the status as it is stored in the database and mark it as cached.
+
+        Args:
+            status (str): status stored in the database
+        """
+        self._reset()
+        self._status_dict[status] = True
+        self._cache = (self.database._status_epoch, time.monotonic(), status)
 
     def _status_write(self) -> None:
         """
@@ -225,8 +275,13 @@ class JobStatus(object):
         """
         if self.database and self.job_id:
             current_status = str(self._get_status_from_dict())
-            if self.database.get_job_status(job_id=self.job_id) != current_status:
-                self.database.set_job_status(job_id=self.job_id, status=current_status)
+            # always written, the cached status may be outdated by changes from other processes
+            self.database.set_job_status(job_id=self.job_id, status=current_status)
+            self._cache = (
+                self.database._status_epoch,
+                time.monotonic(),
+                current_status,
+            )
 
     def _reset(self) -> None:
         """
@@ -304,3 +359,26 @@ class JobStatus(object):
             return other != self.string
         else:
             return super(JobStatus, self).__ne__(other)
+
+
+def refresh_job_status_lst(status_lst: Iterable[JobStatus]) -> None:
+    """
+    Refresh the cached statuses of many jobs with a single query per database.
+
+    Args:
+        status_lst (list): JobStatus objects to refresh, objects without database or job ID are skipped
+    """
+    status_by_database = {}
+    for status in status_lst:
+        if status.database and status.job_id:
+            status_by_database.setdefault(id(status.database), []).append(status)
+    for status_group in status_by_database.values():
+        database = status_group[0].database
+        status_dict = database.get_job_status_dict(
+            job_ids=[status.job_id for status in status_group]
+        )
+        for status in status_group:
+            if status.job_id in status_dict:
+                status._set_cached_status(status=status_dict[status.job_id])
+            else:
+                status._cache = None
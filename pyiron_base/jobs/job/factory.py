@@ -6,7 +6,7 @@ Factories for creating jobs, which may already exist in the database/storage.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Type, Union
+from typing import TYPE_CHECKING, Dict, List, Type, Union
 
 from pyiron_base.interfaces.factory import PyironFactory
 from pyiron_base.jobs.datamining import TableJob
@@ -14,10 +14,12 @@ from pyiron_base.jobs.job.generic import GenericJob
 from pyiron_base.jobs.job.jobtype import JobType
 from pyiron_base.jobs.master.flexible import FlexibleMaster
 from pyiron_base.jobs.script import ScriptJob
-from pyiron_base.project.generic import Project
 from pyiron_base.state import state
 from pyiron_base.storage.hdfio import ProjectHDFio
 
+if TYPE_CHECKING:
+    from pyiron_base.project.generic import Project
+
 __author__ = "Liam Huber, Jan Janssen"
 __copyright__ = (
     "Copyright 2021, Max-Planck-Institut für Eisenforschung GmbH - "
@@ -31,7 +33,7 @@ __date__ = "Sep 7, 2021"
 
 
 class JobFactoryCore(PyironFactory, ABC):
-    def __init__(self, project: Project):
+    def __init__(self, project: "Project"):
         self._project = project
 
     @property
@@ -14,7 +14,7 @@ from datetime import datetime
 from inspect import isclass
 from typing import Optional, Union
 
-from h5io_browser.base import _read_hdf, _write_hdf
+from h5io_browser.base import _read_hdf
 from pyiron_snippets.deprecate import deprecate
 
 from pyiron_base.database.filetable import FileTable
@@ -54,7 +54,12 @@ from pyiron_base.jobs.job.util import (
 )
 from pyiron_base.state import state
 from pyiron_base.state.signal import catch_signals
-from pyiron_base.storage.hdfio import ProjectHDFio
+from pyiron_base.storage.hdfio import (
+    _JOB_CONTAINER_VERSION_NODE,
+    ProjectHDFio,
+    _read_hdf_pooled,
+    _write_hdf_pooled,
+)
 from pyiron_base.utils.instance import import_class, static_isinstance
 
 __author__ = "Joerg Neugebauer, Jan Janssen"
@@ -609,15 +614,18 @@ class GenericJob(JobCore, HasDict):
         Refresh job status by updating the job status with the status from the database if a job ID is available.
         """
         if self.job_id:
-            self._status = JobStatus(
-                initial_status=self.project.db.get_job_status(self.job_id),
-                db=self.project.db,
-                job_id=self.job_id,
-            )
+            if (
+                self._status.job_id == self.job_id
+                and self._status.database is self.project.db
+            ):
+                self._status.refresh_from_database()
+            else:
+                self._status = JobStatus(db=self.project.db, job_id=self.job_id)
         elif state.database.database_is_disabled:
             self._status = JobStatus(
-                initial_status=_read_hdf(
-                    self.project_hdf5.file_name, self.job_name + "/status"
+                initial_status=_read_hdf_pooled(
+                    file_name=self.project_hdf5.file_name,
+                    h5_path=self.project_hdf5.h5_path + "/status",
                 )
             )
         if (
@@ -1285,9 +1293,16 @@ class GenericJob(JobCore, HasDict):
         Args:
             hdf (ProjectHDFio): HDF5 group object
         """
-        job_name = posixpath.splitext(posixpath.basename(hdf.file_name))[0]
+        file_name = posixpath.splitext(posixpath.basename(hdf.file_name))[0]
+        job_name = file_name
+        if (
+            posixpath.dirname(hdf.h5_path) == "/" + file_name
+            and _JOB_CONTAINER_VERSION_NODE in hdf.open("..").list_nodes()
+        ):
+            # jobs stored in a shared container file are groups inside the container group
+            job_name = posixpath.basename(hdf.h5_path)
         project_hdf5 = type(hdf)(
-            project=hdf.create_project_from_hdf5(), file_name=job_name
+            project=hdf.create_project_from_hdf5(), file_name=file_name
         )
         return {"job_name": job_name, "project": project_hdf5}
 
@@ -1319,19 +1334,21 @@ class GenericJob(JobCore, HasDict):
         Returns:
             (int): Job ID stored in the database
         """
-        self.to_hdf()
-        if not state.database.database_is_disabled:
-            job_id = self.project.db.add_item_dict(self.db_entry())
-            self._job_id = job_id
-            _write_hdf(
-                hdf_filehandle=self.project_hdf5.file_name,
-                data=job_id,
-                h5_path=self.job_name + "/job_id",
-                overwrite="update",
-            )
-            self.refresh_job_status()
-        else:
-            job_id = self.job_name
+        self._move_to_job_container()
+        # the HDF5 content of the job is written at once, when the batch is left
+        with self.project_hdf5.batch():
+            self.to_hdf()
+            if not state.database.database_is_disabled:
+                job_id = self.project.db.add_item_dict(self.db_entry())
+                self._job_id = job_id
+                _write_hdf_pooled(
+                    file_name=self.project_hdf5.file_name,
+                    h5_path=self.project_hdf5.h5_path + "/job_id",
+                    data=job_id,
+                )
+                self.refresh_job_status()
+            else:
+                job_id = self.job_name
         if self._check_if_input_should_be_written():
             self.project_hdf5.create_working_directory()
             self.write_input()
@@ -1344,6 +1361,23 @@ class GenericJob(JobCore, HasDict):
         )
         return job_id
 
+    def _move_to_job_container(self) -> None:
+        """
+        Store a new job as group inside the current container file of the project, if the job container policy of the
+        project applies to the job type. Jobs which are already stored or are located inside the HDF5 file of their
+        master job are not moved.
+        """
+        policy = getattr(self.project, "job_container_policy", None)
+        if (
+            policy is not None
+            and policy.applies_to(job_type=self.__name__)
+            and self.project_hdf5.h5_path == "/" + self.job_name
+            and not self.project_hdf5.file_exists
+        ):
+            self.project_hdf5 = policy.get_container(project=self.project).open(
+                self.job_name
+            )
+
     def convergence_check(self) -> bool:
         """
         Validate the convergence of the calculation.
@@ -11,6 +11,7 @@ import numpy as np
 
 from pyiron_base.database.filetable import FileTable
 from pyiron_base.jobs.job.generic import GenericJob
+from pyiron_base.storage.hdfio import _append_hdf_dataset, _hdf_file_pool
 
 __author__ = "Osamu Waseda, Jan Janssen"
 __copyright__ = (
@@ -136,6 +137,7 @@ class InteractiveBase(GenericJob):
         self._interactive_write_input_files = False
         self._interactive_flush_frequency = 10000
         self._interactive_write_frequency = 1
+        self._interactive_swmr = False
         self.interactive_cache = {}
 
     @property
@@ -164,6 +166,24 @@ class InteractiveBase(GenericJob):
             self.interactive_flush_frequency = frequency
         self._interactive_write_frequency = frequency
 
+    @property
+    def interactive_swmr(self) -> bool:
+        """
+        Keep the HDF5 file open in single-writer/multiple-reader (SWMR) mode between flushes, so the output can be read
+        from other processes while the job is running. Only appending to existing datasets is done in SWMR mode, the
+        file is reopened for all other writes.
+
+        Returns:
+            bool: True if the output is written in SWMR mode
+        """
+        return self._interactive_swmr
+
+    @interactive_swmr.setter
+    def interactive_swmr(self, swmr: bool) -> None:
+        if not isinstance(swmr, bool):
+            raise AssertionError("interactive_swmr must be a boolean")
+        self._interactive_swmr = swmr
+
     def validate_ready_to_run(self) -> None:
         """
         This should work but doesn't...
@@ -213,27 +233,47 @@ class InteractiveBase(GenericJob):
 
     @staticmethod
     def _extend_hdf(
-        h5: "pyiron_base.storage.hdfio.ProjectHDFio", path: str, key: str, data: Any
+        h5: "pyiron_base.storage.hdfio.ProjectHDFio",
+        path: str,
+        key: str,
+        data: Any,
+        swmr: bool = False,
     ) -> None:
         """
-        Extend an existing HDF5 dataset with new data.
+        Extend an existing HDF5 dataset with new data. Regular numeric arrays are appended in place to a resizable
+        dataset.
 
         Args:
             h5 (pyiron_base.storage.hdfio.ProjectHDFio): HDF5 file object.
             path (str): Path to the dataset within the HDF5 file.
             key (str): Name of the dataset.
             data (Union[list, np.ndarray]): Data to be added to the dataset.
+            swmr (bool): Append to existing datasets in SWMR mode and keep the file open.
 
         Returns:
             None
         """
+        if isinstance(data, np.ndarray) and _append_hdf_dataset(
+            file_name=h5.file_name,
+            h5_path=h5._get_h5_path(path + "/" + key),
+            data=data,
+            storage_policy=h5.storage_policy,
+            swmr=swmr,
+        ):
+            return
+        # ragged and object data can not be appended in place, so the whole dataset is rewritten
         if path in h5.list_groups() and key in h5[path].list_nodes():
             current_hdf = h5[path + "/" + key]
             if isinstance(data, list):
                 entry = current_hdf.tolist() + data
             else:
                 entry = current_hdf.tolist() + data.tolist()
-            data = np.array(entry)
+            try:
+                data = np.array(entry)
+            except ValueError:
+                # ragged frames are stored as object array of arrays
+                data = np.array([None] * len(entry), dtype=object)
+                data[:] = [np.array(e) for e in entry]
         h5[path + "/" + key] = data
 
     @staticmethod
@@ -280,7 +320,7 @@ class InteractiveBase(GenericJob):
         Returns:
             None
         """
-        with self.project_hdf5.open("output") as h5:
+        with self.project_hdf5.session(), self.project_hdf5.open("output") as h5:
             for key in self.interactive_cache.keys():
                 if len(self.interactive_cache[key]) == 0:
                     continue
@@ -299,7 +339,13 @@ class InteractiveBase(GenericJob):
                     elif np.array(data).dtype == np.dtype("O"):
                         self._extend_hdf(h5=h5, path=path, key=key, data=data)
                     else:
-                        self._extend_hdf(h5=h5, path=path, key=key, data=np.array(data))
+                        self._extend_hdf(
+                            h5=h5,
+                            path=path,
+                            key=key,
+                            data=np.array(data),
+                            swmr=self._interactive_swmr,
+                        )
                 except ValueError:
                     self._extend_hdf(
                         h5=h5, path=path, key=key, data=np.array(data, dtype="object")
@@ -328,6 +374,7 @@ class InteractiveBase(GenericJob):
             and len(self.interactive_cache[list(self.interactive_cache.keys())[0]]) != 0
         ):
             self.interactive_flush(path="interactive", include_last_step=True)
+        _hdf_file_pool.release_swmr_writer(file_name=self.project_hdf5.file_name)
         self.project_hdf5.rewrite_hdf5()
         self.status.finished = True
         if not isinstance(self.project.db, FileTable):
@@ -374,6 +421,7 @@ class InteractiveBase(GenericJob):
             hdf5_input["interactive"] = {
                 "interactive_flush_frequency": self._interactive_flush_frequency,
                 "interactive_write_frequency": self._interactive_write_frequency,
+                "interactive_swmr": self._interactive_swmr,
             }
 
     def from_hdf(
@@ -401,6 +449,7 @@ class InteractiveBase(GenericJob):
                     ]
                 else:
                     self._interactive_write_frequency = 1
+                self._interactive_swmr = interactive_dict.get("interactive_swmr", False)
 
 
 class _WithInteractiveOpen:
@@ -336,23 +336,26 @@ def run_job_with_status_collect(job: "pyiron_base.jobs.job.generic.GenericJob")
     Args:
         job (GenericJob): pyiron job object
     """
-    if job._job_with_calculate_function and job._collect_output_funct is not None:
-        parsed_output = job._collect_output_funct(
-            working_directory=job.working_directory, **job.get_output_parameter_dict()
-        )
-        job.save_output(output_dict=parsed_output)
-    else:
-        job.collect_output()
-        job.collect_logfiles()
-    job.run_time_to_db()
-    if job.status.collect:
-        if not job.convergence_check():
-            job.status.not_converged = True
+    # the output and the final status are written at once, before the master job is notified
+    with job.project_hdf5.batch():
+        if job._job_with_calculate_function and job._collect_output_funct is not None:
+            parsed_output = job._collect_output_funct(
+                working_directory=job.working_directory,
+                **job.get_output_parameter_dict(),
+            )
+            job.save_output(output_dict=parsed_output)
         else:
-            if job._compress_by_default:
-                job.compress()
-            job.status.finished = True
-    job._hdf5["status"] = job.status.string
+            job.collect_output()
+            job.collect_logfiles()
+        job.run_time_to_db()
+        if job.status.collect:
+            if not job.convergence_check():
+                job.status.not_converged = True
+            else:
+                if job._compress_by_default:
+                    job.compress()
+                job.status.finished = True
+        job._hdf5["status"] = job.status.string
     job.update_master()
 
 
@@ -689,6 +692,8 @@ def run_job_with_runmode_executor_futures(
         debug=False,
         connection_string=connection_string,
     )
+    # the status is changed by the executor process, callers expect it to be current once the future is done
+    job.status.cache_ttl_in_s = 0
 
 
 def run_job_with_runmode_executor_flux(
@@ -748,6 +753,7 @@ def run_job_with_runmode_executor_flux(
     jobspec.cwd = job.project_hdf5.working_directory
     jobspec.environment = dict(os.environ)
     job.server.future = executor.submit(jobspec)
+    job.status.cache_ttl_in_s = 0
 
 
 def run_time_decorator(func: callable) -> callable:
@@ -1074,18 +1080,20 @@ def execute_job_with_calculate_function(
     except RuntimeError:
         raise_runtimeerror_for_failed_job(job=job)
     else:
-        job.set_input_to_read_only()
-        if job_crashed:
-            job.status.aborted = True
-        else:
-            job.save_output(output_dict=parsed_output, shell_output=shell_output)
-            if not job.convergence_check():
-                job.status.not_converged = True
+        # the output and the final status are written at once, before the master job is notified
+        with job.project_hdf5.batch():
+            job.set_input_to_read_only()
+            if job_crashed:
+                job.status.aborted = True
             else:
-                if job._compress_by_default:
-                    job.compress()
-                job.status.finished = True
-        job._hdf5["status"] = job.status.string
+                job.save_output(output_dict=parsed_output, shell_output=shell_output)
+                if not job.convergence_check():
+                    job.status.not_converged = True
+                else:
+                    if job._compress_by_default:
+                        job.compress()
+                    job.status.finished = True
+            job._hdf5["status"] = job.status.string
         job.update_master()
 
 
@@ -205,7 +205,9 @@ def _rename_job(
             ham = job.project.load(child_id)
             ham.move_to(job.project.open(new_job_name + "_hdf5"))
     old_working_directory = job.working_directory
-    if len(job.project_hdf5.h5_path.split("/")) > 2:
+    # jobs stored inside the HDF5 file of their master or a container file share the file with other jobs
+    shared_file = len(job.project_hdf5.h5_path.split("/")) > 2
+    if shared_file:
         new_location = job.project_hdf5.open("../" + new_job_name)
     else:
         new_location = job.project_hdf5.__class__(
@@ -218,11 +220,15 @@ def _rename_job(
     old_job_name = job.name
     job._name = new_job_name
     job.project_hdf5.copy_to(destination=new_location, maintain_name=False)
-    job.project_hdf5.remove_file()
+    if shared_file:
+        job.project_hdf5.remove_group()
+    else:
+        job.project_hdf5.remove_file()
     job.project_hdf5 = new_location
     if os.path.exists(old_working_directory):
         shutil.move(old_working_directory, job.working_directory)
-        os.rmdir("/".join(old_working_directory.split("/")[:-1]))
+        if not shared_file:
+            os.rmdir("/".join(old_working_directory.split("/")[:-1]))
     if os.path.exists(os.path.join(job.working_directory, old_job_name + ".tar.bz2")):
         os.rename(
             os.path.join(job.working_directory, old_job_name + ".tar.bz2"),
@@ -230,6 +236,33 @@ def _rename_job(
         )
 
 
+def _move_job_to_container(
+    job: "pyiron_base.jobs.job.base.JobCore",
+    container: "pyiron_base.storage.hdfio.ProjectHDFio",
+) -> None:
+    """
+    Move the HDF5 file and the working directory of a job into a job container file. The data is copied and the
+    database entry updated before the original HDF5 file is removed.
+
+    Args:
+        job (JobCore): job object to move
+        container (ProjectHDFio): root group of the jobs inside the container file
+    """
+    new_location = container.open(job.job_name)
+    old_working_directory = job.working_directory
+    job.project_hdf5.hd_copy(job.project_hdf5, new_location)
+    if job.job_id is not None:
+        job.project.db.item_update({"subjob": new_location.h5_path}, job.job_id)
+    job.project_hdf5.remove_file()
+    job.project_hdf5 = new_location
+    if os.path.exists(old_working_directory):
+        os.makedirs(os.path.dirname(job.working_directory), exist_ok=True)
+        shutil.move(old_working_directory, job.working_directory)
+        old_folder = os.path.dirname(old_working_directory)
+        if len(os.listdir(old_folder)) == 0:
+            os.rmdir(old_folder)
+
+
 def _is_valid_job_name(job_name: str) -> None:
     """
     internal function to validate the job_name - only available in Python 3.4 <
@@ -633,6 +666,16 @@ def _job_remove_folder(job: "pyiron_base.jobs.job.base.JobCore") -> None:
     working_directory = os.path.abspath(os.path.join(str(job.working_directory), ".."))
     if os.path.exists(working_directory) and len(os.listdir(working_directory)) == 0:
         shutil.rmtree(working_directory)
+    # jobs stored in a job container live one level deeper, remove the directory of
+    # the container as well once its HDF5 file is gone and it holds no other jobs
+    file_name = job.project_hdf5.file_name
+    hdf5_directory = os.path.splitext(file_name)[0] + "_hdf5"
+    if (
+        not os.path.exists(file_name)
+        and os.path.isdir(hdf5_directory)
+        and len(os.listdir(hdf5_directory)) == 0
+    ):
+        os.rmdir(hdf5_directory)
 
 
 def _job_store_before_copy(job: "pyiron_base.jobs.job.base.JobCore") -> bool:
@@ -14,7 +14,6 @@ from pyiron_base.database.filetable import (
     get_hamilton_version_from_file,
     get_job_status_from_file,
 )
-from pyiron_base.project.generic import Project
 from pyiron_base.state import state
 from pyiron_base.state.signal import catch_signals
 
@@ -61,6 +60,9 @@ class JobWrapper(object):
             state.database.open_local_sqlite_connection(
                 connection_string=connection_string
             )
+        # the job classes import the job wrapper, so the Project is only imported once it is needed
+        from pyiron_base.project.generic import Project
+
         pr = Project(path=os.path.join(working_directory, "..", ".."))
         if job_id is not None:
             self.job = pr.load(int(job_id))
@@ -1,11 +1,17 @@
+import hashlib
 import importlib
+import json
 import os
 import pkgutil
 import sys
 import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 
 import pandas
+from tqdm.auto import tqdm
 
+import pyiron_base._version
 import pyiron_base.storage.hdfio
 from pyiron_base.maintenance.databaseperformance import get_database_statistics
 from pyiron_base.maintenance.update.pyiron_base_03x_to_04x import (
@@ -13,6 +19,9 @@ from pyiron_base.maintenance.update.pyiron_base_03x_to_04x import (
 )
 from pyiron_base.state import state
 
+if TYPE_CHECKING:
+    from pyiron_base.storage.hdfio import JobContainerPolicy, StoragePolicy
+
 # we sometimes move classes between modules; this would break HDF storage,
 # since objects save there the module path from which their classes can be
 # imported.  We can work around this by defining here an explicit map that
@@ -46,6 +55,219 @@ def add_module_conversion(old: str, new: str):
         )
 
 
+class _MaintenanceJournal:
+    """
+    Journal of the HDF5 files processed by a maintenance task, stored as JSON lines so an interrupted run can be resumed.
+    A file is skipped as long as its modification time and the version of the task are unchanged since it was processed.
+
+    Args:
+        file_name (str, optional): path of the journal file, None disables the journal
+        task (str): name of the maintenance task
+        version (str): version of the task, changing it processes all files again
+    """
+
+    def __init__(self, file_name: Optional[str], task: str, version: str):
+        self._file_name = file_name
+        self._task = task
+        self._version = version
+        self._entries = {}
+        if file_name is not None and os.path.exists(file_name):
+            with open(file_name) as f:
+                lines = f.readlines()
+            for line in lines:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # the last line is incomplete if the run was interrupted while writing it
+                    continue
+                if entry["task"] == task:
+                    self._entries[entry["file"]] = (entry["mtime"], entry["version"])
+            if len(lines) > 0 and not lines[-1].endswith("\n"):
+                with open(file_name, "a") as f:
+                    f.write("\n")
+
+    def is_done(self, file_name: str) -> bool:
+        """
+        Check if a file was processed and not modified since.
+
+        Args:
+            file_name (str): absolute path of the HDF5 file
+
+        Returns:
+            bool: True if the file can be skipped
+        """
+        return self._entries.get(file_name, None) == (
+            os.stat(file_name).st_mtime_ns,
+            self._version,
+        )
+
+    def add(self, file_name: str) -> None:
+        """
+        Record a successfully processed file.
+
+        Args:
+            file_name (str): absolute path of the HDF5 file
+        """
+        if self._file_name is None:
+            return
+        entry = {
+            "task": self._task,
+            "file": file_name,
+            "mtime": os.stat(file_name).st_mtime_ns,
+            "version": self._version,
+        }
+        with open(self._file_name, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+        self._entries[file_name] = (entry["mtime"], entry["version"])
+
+
+def _get_job_files(project, recursive: bool, **kwargs: dict) -> Dict[str, List[str]]:
+    """
+    Get the HDF5 files of the jobs in a project, jobs stored inside the file of their master job or in a job container
+    file share the file.
+
+    Args:
+        project (Project): project to search
+        recursive (bool): search subprojects
+        **kwargs (dict): Optional arguments for filtering with keys matching the project database column name
+
+    Returns:
+        dict: absolute paths of the HDF5 files as keys and the paths of the jobs inside the files as values
+    """
+    job_table = project.job_table(recursive=recursive, **kwargs)
+    if len(job_table) == 0:
+        return {}
+    file_dict = {}
+    for project_path, project_name, subjob in zip(
+        job_table["projectpath"], job_table["project"], job_table["subjob"]
+    ):
+        file_name = (
+            (project_path if isinstance(project_path, str) else "")
+            + project_name
+            + subjob.split("/")[1]
+            + ".h5"
+        )
+        file_dict.setdefault(file_name, []).append(subjob)
+    return file_dict
+
+
+def _process_files(
+    function: Callable,
+    file_dict: Dict[str, dict],
+    journal: _MaintenanceJournal,
+    max_workers: int = 1,
+    progress: bool = True,
+) -> None:
+    """
+    Apply a maintenance function to HDF5 files, serially or in a pool of worker processes, and record the processed
+    files in the journal. Failures are logged and the files are left out of the journal, so they are processed again in
+    the next run.
+
+    Args:
+        function (callable): module level function called with the file name and the arguments of the file
+        file_dict (dict): absolute paths of the HDF5 files as keys and dictionaries of arguments as values
+        journal (_MaintenanceJournal): journal of the processed files
+        max_workers (int): number of worker processes, 1 processes the files in the current process
+        progress (bool): add an interactive progress bar
+    """
+    file_dict = {
+        file_name: kwargs
+        for file_name, kwargs in file_dict.items()
+        if os.path.exists(file_name) and not journal.is_done(file_name)
+    }
+
+    def finished(file_name, exception):
+        if exception is not None:
+            state.logger.warning(f"Maintenance of {file_name} failed: {exception}")
+        else:
+            journal.add(file_name)
+
+    if max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as exe:
+            future_dict = {
+                exe.submit(function, file_name=file_name, **kwargs): file_name
+                for file_name, kwargs in file_dict.items()
+            }
+            future_lst = as_completed(future_dict)
+            if progress:
+                future_lst = tqdm(future_lst, total=len(future_dict))
+            for future in future_lst:
+                finished(file_name=future_dict[future], exception=future.exception())
+    else:
+        file_lst = tqdm(file_dict.items()) if progress else file_dict.items()
+        for file_name, kwargs in file_lst:
+            try:
+                function(file_name=file_name, **kwargs)
+            except Exception as e:
+                finished(file_name=file_name, exception=e)
+            else:
+                finished(file_name=file_name, exception=None)
+
+
+def _defragment_file(file_name: str) -> None:
+    """
+    Rewrite an HDF5 file to free up unused space.
+
+    Args:
+        file_name (str): absolute path of the HDF5 file
+    """
+    pyiron_base.storage.hdfio.FileHDFio(file_name=file_name).rewrite_hdf5()
+
+
+def _update_hdf_types(hdf, conversion_dict: Dict[str, str]) -> None:
+    """
+    Rewrite the TYPE fields of a group and all its subgroups according to the module conversions.
+
+    Args:
+        hdf (FileHDFio): HDF5 group
+        conversion_dict (dict): old module paths as keys and new module paths as values
+    """
+    contents = hdf.list_all()
+    for group in contents["groups"]:
+        _update_hdf_types(hdf=hdf.open(group), conversion_dict=conversion_dict)
+    if "TYPE" in contents["nodes"]:
+        (
+            module_path,
+            class_name,
+        ) = pyiron_base.storage.hdfio._extract_module_class_name(hdf["TYPE"])
+        if module_path in conversion_dict:
+            new_module_path = conversion_dict[module_path]
+            hdf["TYPE"] = f"<class '{new_module_path}.{class_name}'>"
+
+
+def _update_hdf_types_file(
+    file_name: str, h5_path_lst: List[str], conversion_dict: Dict[str, str]
+) -> None:
+    """
+    Rewrite the TYPE fields of the jobs stored in an HDF5 file according to the module conversions.
+
+    Args:
+        file_name (str): absolute path of the HDF5 file
+        h5_path_lst (list): paths of the jobs inside the HDF5 file
+        conversion_dict (dict): old module paths as keys and new module paths as values
+    """
+    with pyiron_base.storage.hdfio.FileHDFio(file_name=file_name).session():
+        for h5_path in h5_path_lst:
+            _update_hdf_types(
+                hdf=pyiron_base.storage.hdfio.FileHDFio(
+                    file_name=file_name, h5_path=h5_path
+                ),
+                conversion_dict=conversion_dict,
+            )
+
+
+def _get_conversion_version() -> str:
+    """
+    Get a version of the module conversions, which changes whenever a conversion is added.
+
+    Returns:
+        str: hash of the module conversions
+    """
+    return hashlib.sha1(
+        json.dumps(sorted(_MODULE_CONVERSION_DICT.items())).encode()
+    ).hexdigest()
+
+
 class Maintenance:
     """
     The purpose of maintenance class is to provide
@@ -120,6 +342,8 @@ class LocalMaintenance:
         self,
         recursive: bool = True,
         progress: bool = True,
+        max_workers: int = 1,
+        journal_file: Optional[str] = None,
         **kwargs: dict,
     ):
         """
@@ -128,7 +352,52 @@ class LocalMaintenance:
         By default iterate recursively over the jobs within the current
         project.  This can be controlled with `recursive` and `kwargs`.
 
+        Every file is rewritten once, even if it stores multiple jobs. The files can be rewritten in parallel by a pool
+        of worker processes. With a journal file an interrupted run resumes where it stopped, since files which were
+        not modified since they were rewritten by the same pyiron_base version are skipped.
+
         Args:
+            recursive (bool): search subprojects [True/False] - True by default
+            progress (bool): if True (default), add an interactive progress bar to the iteration
+            max_workers (int): number of worker processes - 1 by default, which rewrites the files in this process
+            journal_file (str): path of the journal file to record the rewritten files in - None by default
+            **kwargs (dict): Optional arguments for filtering with keys matching the project database column name
+                            (eg. status="finished"). Asterisk can be used to denote a wildcard, for zero or more
+                            instances of any character
+        """
+        _process_files(
+            function=_defragment_file,
+            file_dict={
+                file_name: {}
+                for file_name in _get_job_files(
+                    project=self._project, recursive=recursive, **kwargs
+                )
+            },
+            journal=_MaintenanceJournal(
+                file_name=journal_file,
+                task="defragment_storage",
+                version=pyiron_base._version.__version__,
+            ),
+            max_workers=max_workers,
+            progress=progress,
+        )
+
+    def recompress_storage(
+        self,
+        storage_policy: Optional["StoragePolicy"] = None,
+        recursive: bool = True,
+        progress: bool = True,
+        **kwargs: dict,
+    ):
+        """
+        Rewrite the arrays stored in the hdf5 files of jobs according to a chunking and compression policy and
+        defragment the files afterwards to free up the space saved.
+
+        By default iterate recursively over the jobs within the current
+        project.  This can be controlled with `recursive` and `kwargs`.
+
+        Args:
+            storage_policy (StoragePolicy): chunking and compression policy, defaults to the policy of the project
             recursive (bool): search subprojects [True/False] - True by default
             progress (bool): if True (default), add an interactive progress bar to the iteration
             **kwargs (dict): Optional arguments for filtering with keys matching the project database column name
@@ -139,12 +408,73 @@ class LocalMaintenance:
             recursive=recursive, progress=progress, convert_to_object=False, **kwargs
         ):
             hdf = job.project_hdf5
-            hdf.rewrite_hdf5(job.name)
+            if not hdf.file_exists:
+                continue
+            policy = (
+                storage_policy if storage_policy is not None else hdf.storage_policy
+            )
+            with pyiron_base.storage.hdfio._open_hdf_pooled(
+                hdf.file_name, mode="a"
+            ) as h:
+                rewritten = pyiron_base.storage.hdfio._recompress_hdf(
+                    hdf=h[hdf.h5_path], storage_policy=policy
+                )
+            if rewritten > 0:
+                hdf.rewrite_hdf5()
+
+    def consolidate_jobs(
+        self,
+        job_container_policy: Optional["JobContainerPolicy"] = None,
+        recursive: bool = True,
+        progress: bool = True,
+        **kwargs: dict,
+    ):
+        """
+        Move the HDF5 files of jobs into shared job container files, to reduce the number of files of the project.
+
+        Only jobs of the types selected by the job container policy are moved. Jobs which are still running, master
+        jobs with child jobs and jobs stored inside the HDF5 file of their master job remain in place.
+
+        Args:
+            job_container_policy (JobContainerPolicy): container policy, defaults to the policy of the project
+            recursive (bool): search subprojects [True/False] - True by default
+            progress (bool): if True (default), add an interactive progress bar to the iteration
+            **kwargs (dict): Optional arguments for filtering with keys matching the project database column name
+                            (eg. status="finished"). Asterisk can be used to denote a wildcard, for zero or more
+                            instances of any character
+        """
+        from pyiron_base.jobs.job.util import _move_job_to_container
+
+        policy = (
+            job_container_policy
+            if job_container_policy is not None
+            else self._project.job_container_policy
+        )
+        if policy is None:
+            raise ValueError(
+                "No job container policy is defined, set Project.job_container_policy or pass a policy."
+            )
+        for job in self._project.iter_jobs(
+            recursive=recursive, progress=progress, convert_to_object=False, **kwargs
+        ):
+            if (
+                policy.applies_to(job_type=job.__name__)
+                and str(job.status)
+                not in ["submitted", "running", "collect", "refresh", "busy"]
+                and job.project_hdf5.h5_path == "/" + job.job_name
+                and job.project_hdf5.file_exists
+                and len(job.child_ids) == 0
+            ):
+                _move_job_to_container(
+                    job=job, container=policy.get_container(project=job.project)
+                )
 
     def update_hdf_types(
         self,
         recursive: bool = True,
         progress: bool = True,
+        max_workers: int = 1,
+        journal_file: Optional[str] = None,
         **kwargs: dict,
     ):
         """
@@ -155,37 +485,44 @@ class LocalMaintenance:
         consider all objects previously imported from `old` to be imported from
         `new`.
 
+        The files can be updated in parallel by a pool of worker processes. With a journal file an interrupted run
+        resumes where it stopped, since files which were not modified since they were updated with the same module
+        conversions are skipped.
+
         Args:
             recursive (bool): search subprojects [True/False] - True by default
             progress (bool): if True (default), add an interactive progress bar to the iteration
+            max_workers (int): number of worker processes - 1 by default, which updates the files in this process
+            journal_file (str): path of the journal file to record the updated files in - None by default
             **kwargs (dict): Optional arguments for filtering with keys matching the project database column name
                             (eg. status="finished"). Asterisk can be used to denote a wildcard, for zero or more
                             instances of any character
         """
-
-        def recurse(hdf):
-            contents = hdf.list_all()
-            for group in contents["groups"]:
-                recurse(hdf[group])
-            if "TYPE" in contents["nodes"]:
-                (
-                    module_path,
-                    class_name,
-                ) = pyiron_base.storage.hdfio._extract_module_class_name(hdf["TYPE"])
-                if module_path in _MODULE_CONVERSION_DICT:
-                    new_module_path = _MODULE_CONVERSION_DICT[module_path]
-                    hdf["TYPE"] = f"<class '{new_module_path}.{class_name}'>"
-
-        for job in self._project.iter_jobs(
-            recursive=recursive, progress=progress, convert_to_object=False, **kwargs
-        ):
-            hdf = job.project_hdf5
-            recurse(hdf)
+        conversion_dict = dict(_MODULE_CONVERSION_DICT)
+        _process_files(
+            function=_update_hdf_types_file,
+            file_dict={
+                file_name: {
+                    "h5_path_lst": h5_path_lst,
+                    "conversion_dict": conversion_dict,
+                }
+                for file_name, h5_path_lst in _get_job_files(
+                    project=self._project, recursive=recursive, **kwargs
+                ).items()
+            },
+            journal=_MaintenanceJournal(
+                file_name=journal_file,
+                task="update_hdf_types",
+                version=_get_conversion_version(),
+            ),
+            max_workers=max_workers,
+            progress=progress,
+        )
 
         def fix_project_data(pr):
             try:
                 hdf = pr.create_hdf(pr.path, "project_data")["../data"]
-                recurse(hdf)
+                _update_hdf_types(hdf=hdf, conversion_dict=conversion_dict)
             except ValueError:
                 # in case project data does not exist yet
                 pass
@@ -194,22 +531,46 @@ class LocalMaintenance:
         for sub in self._project.iter_groups():
             fix_project_data(sub)
 
-        self.update_pyiron_tables(recursive=recursive, progress=progress, **kwargs)
+        self.update_pyiron_tables(
+            recursive=recursive, progress=progress, journal_file=journal_file, **kwargs
+        )
 
     def update_pyiron_tables(
         self,
         recursive: bool = True,
         progress: bool = True,
+        journal_file: Optional[str] = None,
         **kwargs: dict,
     ):
+        """
+        Rewrite pyiron tables for renamed modules, the tables are loaded as objects and stored again.
+
+        Args:
+            recursive (bool): search subprojects [True/False] - True by default
+            progress (bool): if True (default), add an interactive progress bar to the iteration
+            journal_file (str): path of the journal file to record the updated tables in - None by default
+            **kwargs (dict): Optional arguments for filtering with keys matching the project database column name
+                            (eg. status="finished"). Asterisk can be used to denote a wildcard, for zero or more
+                            instances of any character
+        """
         kwargs["hamilton"] = "PyironTable"
         for old, new in _MODULE_CONVERSION_DICT.items():
             sys.modules[old] = importlib.import_module(new)
 
+        journal = _MaintenanceJournal(
+            file_name=journal_file,
+            task="update_pyiron_tables",
+            version=_get_conversion_version(),
+        )
         for job in self._project.iter_jobs(
-            recursive=recursive, progress=progress, **kwargs
+            recursive=recursive, progress=progress, convert_to_object=False, **kwargs
         ):
-            job.to_hdf()
+            # the tables are only loaded as objects if they changed since the last update
+            file_name = job.project_hdf5.file_name
+            if journal.is_done(file_name):
+                continue
+            job.to_object().to_hdf()
+            journal.add(file_name)
 
 
 class UpdateMaintenance:
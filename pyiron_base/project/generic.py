@@ -28,7 +28,9 @@ from pyiron_base.database.jobtable import (
     set_job_status,
 )
 from pyiron_base.interfaces.has_groups import HasGroups
+from pyiron_base.jobs.dynamic import warn_dynamic_job_classes
 from pyiron_base.jobs.flex.factory import create_job_factory
+from pyiron_base.jobs.job.extension.jobstatus import JobStatus, refresh_job_status_lst
 from pyiron_base.jobs.job.extension.server.generic import Server
 from pyiron_base.jobs.job.extension.server.queuestatus import (
     queue_check_job_is_waiting_or_running,
@@ -100,6 +102,10 @@ class Project(ProjectPath, HasGroups):
         job_type (): Job Type object with all the available job types: ['ExampleJob', 'ParallelMaster',
                         'ScriptJob', 'ListMaster'].
         data (pyiron_base.project.data.ProjectData): A storage container for project-level data.
+        storage_policy (pyiron_base.storage.hdfio.StoragePolicy): Chunking and compression policy for large arrays
+                        written to the HDF5 files of the project, falls back to the configuration if None.
+        job_container_policy (pyiron_base.storage.hdfio.JobContainerPolicy): Policy to store small jobs as groups
+                        inside shared container files rather than in one HDF5 file per job, disabled if None.
 
     Examples:
 
@@ -134,6 +140,8 @@ class Project(ProjectPath, HasGroups):
         self._filter = ["groups", "nodes", "objects"]
         self._inspect_mode = False
         self._data = None
+        self.storage_policy = None
+        self.job_container_policy = None
         self._creator = Creator(project=self)
         self._loader = JobLoader(project=self)
         self._inspector = JobInspector(project=self)
@@ -224,6 +232,8 @@ class Project(ProjectPath, HasGroups):
         new = self.__class__(path=self.path, user=self.user, sql_query=self.sql_query)
         new._filter = self._filter
         new._inspect_mode = self._inspect_mode
+        new.storage_policy = self.storage_policy
+        new.job_container_policy = self.job_container_policy
         return new
 
     def copy_to(
@@ -1374,6 +1384,21 @@ class Project(ProjectPath, HasGroups):
                 if not self.queue_check_job_is_waiting_or_running(job):
                     self.db.set_job_status(job_id=job_id, status="aborted")
 
+    def refresh_loaded_jobs_status(self, *jobs) -> None:
+        """
+        Refresh the cached status of already loaded job objects with a single database query.
+
+        In contrast to :meth:`refresh_job_status` this does not check the queuing system, it only updates the status of
+        the given job objects to the status currently stored in the database, e.g. before filtering many jobs by their
+        status.
+
+        Args:
+            *jobs (GenericJob): loaded job objects, any number of them
+        """
+        refresh_job_status_lst(
+            [job.status for job in jobs if isinstance(job.status, JobStatus)]
+        )
+
     @staticmethod
     def _refresh_job_status_file_table(df: pandas.DataFrame) -> pandas.DataFrame:
         """
@@ -1892,6 +1917,8 @@ class Project(ProjectPath, HasGroups):
                 "sql_query": self.sql_query,
                 "filter": self._filter,
                 "inspect_mode": self._inspect_mode,
+                "storage_policy": self.storage_policy,
+                "job_container_policy": self.job_container_policy,
             }
         )
         return state_dict
@@ -1902,6 +1929,8 @@ class Project(ProjectPath, HasGroups):
         self.sql_query = state["sql_query"]
         self._filter = state["filter"]
         self._inspect_mode = state["inspect_mode"]
+        self.storage_policy = state.get("storage_policy", None)
+        self.job_container_policy = state.get("job_container_policy", None)
         self._data = None
         self._creator = Creator(project=self)
         self._loader = JobLoader(project=self)
@@ -2233,3 +2262,15 @@ class Creator:
         )
         table.analysis_project = self._project
         return table
+
+
+# imported here, since the job classes imported by the toolkit import the Project class in turn
+from pyiron_base.jobs.job.toolkit import BaseTools  # noqa: E402
+
+Project.register_tools("base", BaseTools)
+
+# Dynamic job class definition is no longer supported in pyiron_base >=0.7.0
+warn_dynamic_job_classes(
+    resource_folder_lst=state.settings.resource_paths,
+    logger=state.logger,
+)
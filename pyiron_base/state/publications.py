@@ -9,12 +9,14 @@ your project for a list of everything you should cite.
 `Publications` is the way we work towards this goal.
 """
 
-from typing import Dict, List, Union
+from typing import TYPE_CHECKING, Dict, List, Union
 
-import pandas
 from pyiron_snippets.singleton import Singleton
 from typing_extensions import Literal
 
+if TYPE_CHECKING:
+    import pandas
+
 __author__ = "Joerg Neugebauer, Jan Janssen"
 __copyright__ = (
     "Copyright 2021, Max-Planck-Institut für Eisenforschung GmbH - "
@@ -87,7 +89,7 @@ class Publications(metaclass=Singleton):
 
     def show(
         self, bib_format: Literal["pandas", "dict", "bibtex", "apa"] = "pandas"
-    ) -> Union[Dict, pandas.DataFrame, str]:
+    ) -> Union[Dict, "pandas.DataFrame", str]:
         """
         List the publications used in this project.
 
@@ -149,6 +151,8 @@ class Publications(metaclass=Singleton):
         if bib_format.lower() == "dict":
             return self._publications
         elif bib_format.lower() == "pandas":
+            import pandas
+
             publication_lst = []
             for p in publication_dict:
                 for v in p.values():
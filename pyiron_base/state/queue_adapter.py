@@ -10,13 +10,16 @@ multiple adapters.
 
 import os
 from itertools import groupby
+from typing import TYPE_CHECKING
 
 from pyiron_snippets.resources import ResourceResolver
 from pyiron_snippets.singleton import Singleton
-from pysqa import QueueAdapter as PySQAAdpter
 
 from pyiron_base.state.settings import settings
 
+if TYPE_CHECKING:
+    from pysqa import QueueAdapter as PySQAAdpter
+
 __author__ = "Liam Huber"
 __copyright__ = (
     "Copyright 2021, Max-Planck-Institut für Eisenforschung GmbH - "
@@ -54,13 +57,21 @@ class QueueAdapters(metaclass=Singleton):
         # in case a resource folder defines both queue.yaml and clusters.yaml
         # use the groupby to only pick up unique folders in the same order as
         # found by the resolver
-        self._adapters = [
-            PySQAAdpter(directory=group[0])
-            for group in groupby(map(os.path.dirname, queue_search))
+        queue_directories = [
+            group[0] for group in groupby(map(os.path.dirname, queue_search))
         ]
+        if len(queue_directories) > 0:
+            # pysqa is only imported when queues are configured, it is slow to import
+            from pysqa import QueueAdapter as PySQAAdpter
+
+            self._adapters = [
+                PySQAAdpter(directory=directory) for directory in queue_directories
+            ]
+        else:
+            self._adapters = []
 
     @property
-    def adapter(self) -> PySQAAdpter:
+    def adapter(self) -> "PySQAAdpter":
         """
         A :class:`pysqa.QueueAdapter` constructed from the first appropriate configuration files found among the
         `queues/` subdirectory among the resource paths defined in the settings.
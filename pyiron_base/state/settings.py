@@ -93,6 +93,17 @@ class Settings(metaclass=Singleton):
             the working directory warning files to inform users about possibly modified content. (Default is True).
         config_file_permissions_warning / CONFIG_FILE_PERMISSIONS_WARNING / PYIRONCONFIGFILEPERMISSIONSWARNING (bool):
             Whether to print a warning message, when the permission of the .pyiron config file, let others access it.
+        hdf_compression / HDF_COMPRESSION / PYIRONHDFCOMPRESSION (None|"gzip"|"lzf"): Filter to compress large numeric
+            arrays written to HDF5 with, arrays are stored uncompressed if None. (Default is None.)
+        hdf_compression_level / HDF_COMPRESSION_LEVEL / PYIRONHDFCOMPRESSIONLEVEL (int): Compression level (0-9) of the
+            gzip filter. (Default is 4.)
+        hdf_compression_threshold / HDF_COMPRESSION_THRESHOLD / PYIRONHDFCOMPRESSIONTHRESHOLD (int): Size in bytes
+            above which arrays are chunked and compressed. (Default is 1048576.)
+        hdf_shuffle / HDF_SHUFFLE / PYIRONHDFSHUFFLE (bool): Whether to apply the shuffle filter before compressing,
+            which typically improves the compression of numeric data. (Default is True.)
+        executable_cache_file / EXECUTABLE_CACHE_FILE / PYIRONEXECUTABLECACHEFILE (str): Path to a file in which the
+            executables found in the resource paths are cached across sessions. (Default is None, which only caches
+            them within the running python process.)
 
 
     Properties:
@@ -188,6 +199,11 @@ class Settings(metaclass=Singleton):
                 "credentials_file": None,
                 "write_work_dir_warnings": True,
                 "config_file_permissions_warning": True,
+                "hdf_compression": None,
+                "hdf_compression_level": 4,
+                "hdf_compression_threshold": 1048576,
+                "hdf_shuffle": True,
+                "executable_cache_file": None,
             }
         )
 
@@ -210,6 +226,11 @@ class Settings(metaclass=Singleton):
             "PYIRONCREDENTIALSFILE": "credentials_file",
             "PYIRONWRITEWORKDIRWARNINGS": "write_work_dir_warnings",
             "PYIRONCONFIGFILEPERMISSIONSWARNING": "config_file_permissions_warning",
+            "PYIRONHDFCOMPRESSION": "hdf_compression",
+            "PYIRONHDFCOMPRESSIONLEVEL": "hdf_compression_level",
+            "PYIRONHDFCOMPRESSIONTHRESHOLD": "hdf_compression_threshold",
+            "PYIRONHDFSHUFFLE": "hdf_shuffle",
+            "PYIRONEXECUTABLECACHEFILE": "executable_cache_file",
         }
 
     @property
@@ -233,6 +254,11 @@ class Settings(metaclass=Singleton):
             "CREDENTIALS_FILE": "credentials_file",
             "WRITE_WORK_DIR_WARNINGS": "write_work_dir_warnings",
             "CONFIG_FILE_PERMISSIONS_WARNING": "config_file_permissions_warning",
+            "HDF_COMPRESSION": "hdf_compression",
+            "HDF_COMPRESSION_LEVEL": "hdf_compression_level",
+            "HDF_COMPRESSION_THRESHOLD": "hdf_compression_threshold",
+            "HDF_SHUFFLE": "hdf_shuffle",
+            "EXECUTABLE_CACHE_FILE": "executable_cache_file",
         }
 
     @property
@@ -463,11 +489,15 @@ class Settings(metaclass=Singleton):
                 self._configuration[key] = self._convert_to_list_of_paths(
                     value, ensure_ends_with="/" if key == "project_paths" else None
                 )
-            elif key == "connection_timeout":
+            elif key in [
+                "connection_timeout",
+                "hdf_compression_level",
+                "hdf_compression_threshold",
+            ]:
                 self._configuration[key] = int(value)
-            elif key == "sql_file":
+            elif key == "sql_file" or (key == "executable_cache_file" and value):
                 self._configuration[key] = self.convert_path_to_abs_posix(value)
-            elif key in ["project_check_enabled", "disable_database"]:
+            elif key in ["project_check_enabled", "disable_database", "hdf_shuffle"]:
                 self._configuration[key] = (
                     value if isinstance(value, bool) else strtobool(value)
                 )
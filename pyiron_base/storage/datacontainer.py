@@ -7,6 +7,8 @@ Data structure for versatile data handling.
 
 import copy
 import json
+import numbers
+import posixpath
 import warnings
 from collections.abc import Mapping, MutableMapping, Sequence, Set
 
@@ -23,6 +25,7 @@ from pyiron_base.interfaces.has_groups import HasGroups
 from pyiron_base.interfaces.has_hdf import HasHDF
 from pyiron_base.interfaces.lockable import Lockable, sentinel
 from pyiron_base.storage.fileio import read, write
+from pyiron_base.storage.hdfio import _claim_hdf_group, _is_hdf_group_owner
 from pyiron_base.storage.hdfstub import HDFStub, to_object
 
 __author__ = "Marvin Poul"
@@ -49,6 +52,23 @@ _internal_hdf_nodes = [
 ]
 
 
+def _get_hdf_location(hdf):
+    """
+    Return file name and path of an HDF group, or None if the group is not backed by a file.
+    """
+    file_name = getattr(hdf, "file_name", None)
+    if file_name is None:
+        return None
+    return file_name, hdf.h5_path
+
+
+def _get_hdf_node_name(key, index):
+    """
+    Return the name of the HDF node of an element, which encodes its key and position.
+    """
+    return "{}__index_{}".format(key if isinstance(key, str) else "", index)
+
+
 def _normalize(key):
     if isinstance(key, str):
         if key.isdecimal():
@@ -850,9 +870,18 @@ class DataContainer(DataContainerBase, HasHDF, HasDict):
     def __new__(cls, *args, **kwargs):
         instance = super().__new__(cls, *args, **kwargs)
         object.__setattr__(instance, "_lazy", False)
+        # location of the HDF group last written to or read from, token of the claim on the group and the values in the
+        # group by node name, see _to_hdf()
+        object.__setattr__(instance, "_hdf_written", None)
 
         return instance
 
+    def __getstate__(self):
+        # copies and unpickled containers are not tied to the HDF group of the original
+        state = self.__dict__.copy()
+        state["_hdf_written"] = None
+        return state
+
     def __init__(
         self,
         init=None,
@@ -885,15 +914,46 @@ class DataContainer(DataContainerBase, HasHDF, HasDict):
     def _get_hdf_group_name(self):
         return self.table_name
 
+    def to_hdf(self, hdf, group_name=None):
+        """
+        Write the container to HDF, values still in the group since the last write or read are skipped.
+
+        Args:
+            hdf (:class:`.ProjectHDFio`): HDF group to write to
+            group_name (str, optional): name of subgroup, defaults to :attr:`.table_name`
+        """
+        super().to_hdf(hdf=hdf, group_name=group_name)
+        # claim the group only after the type information was written to it, which invalidates earlier claims
+        if self._hdf_written is not None:
+            location, _, written = self._hdf_written
+            self._set_hdf_written(location, written)
+
     def _to_hdf(self, hdf):
+        # list the group once and before writing, so that the listing can reuse the file index
+        listing = hdf.list_all()
+        nodes, groups = set(listing["nodes"]), set(listing["groups"])
+        # values still in the group since the last write or read are skipped, see _is_written(), this has to be checked
+        # before writing to the group invalidates the claim on it
+        location = _get_hdf_location(hdf)
+        previous = self._hdf_written[2] if self._owns_hdf(location) else {}
         hdf["READ_ONLY"] = self.read_only
-        written_keys = _internal_hdf_nodes.copy()
-        for i, (k, v) in enumerate(self.items()):
+        written = {}
+        for i, (k, v) in enumerate(self._items_unloaded()):
             if isinstance(k, str) and "__index_" in k:
                 raise ValueError("Key {} clashes with internal use!".format(k))
 
-            k = "{}__index_{}".format(k if isinstance(k, str) else "", i)
-            written_keys.append(k)
+            name = _get_hdf_node_name(k, i)
+            if (
+                name in previous
+                and previous[name] is v
+                and (name in nodes or name in groups)
+                and self._is_written(v, location, name)
+            ):
+                written[name] = v
+                continue
+            v = self[k]
+            written[name] = v
+            k = name
 
             # pandas objects also have a to_hdf method that is entirely unrelated to ours
             if hasattr(v, "to_hdf") and not isinstance(
@@ -901,7 +961,7 @@ class DataContainer(DataContainerBase, HasHDF, HasDict):
             ):
                 # if v will be written as a group, but a node of the same name k exists already in the file, h5py will
                 # complain, so delete it first
-                if k in hdf.list_nodes():
+                if k in nodes:
                     del hdf[k]
                 v.to_hdf(hdf=hdf, group_name=k)
             else:
@@ -914,11 +974,109 @@ class DataContainer(DataContainerBase, HasHDF, HasDict):
                         "Error saving {} (key {}): DataContainer doesn't support saving elements "
                         'of type "{}" to HDF!'.format(v, k, type(v))
                     ) from None
-        for n in hdf.list_nodes() + hdf.list_groups():
-            if n not in written_keys:
+        for n in listing["nodes"] + listing["groups"]:
+            if n not in written and n not in _internal_hdf_nodes:
                 del hdf[n]
+        # claimed in to_hdf()
+        object.__setattr__(
+            self,
+            "_hdf_written",
+            (location, None, written) if location is not None else None,
+        )
+
+    def _set_hdf_written(self, location, values):
+        """
+        Remember the values written to or read from an HDF group.
+
+        Args:
+            location (tuple): file name and path of the HDF group, None if not backed by a file
+            values (dict): values by node name
+        """
+        if location is not None:
+            written = (location, _claim_hdf_group(*location), values)
+        else:
+            written = None
+        # set directly, as this is no modification of the container and works on read only containers
+        object.__setattr__(self, "_hdf_written", written)
+
+    def _owns_hdf(self, location) -> bool:
+        """
+        Check whether the container was the last one to write to or read from the given HDF group and nothing in the
+        group was changed since.
+
+        Args:
+            location (tuple): file name and path of the HDF group
+
+        Returns:
+            bool: True if the values remembered for the group are still in it
+        """
+        return (
+            location is not None
+            and self._hdf_written is not None
+            and self._hdf_written[0] == location
+            and _is_hdf_group_owner(*location, token=self._hdf_written[1])
+        )
+
+    def _items_unloaded(self):
+        """
+        Iterate over keys and values without loading values not read from HDF yet.
+
+        Yields:
+            tuple: key and value, which may be an :class:`.HDFStub`
+        """
+        reverse_indices = {i: k for k, i in self._indices.items()}
+        for i, v in enumerate(self._store):
+            yield reverse_indices.get(i, i), v
+
+    @staticmethod
+    def _is_written(value, location, name) -> bool:
+        """
+        Check whether a value written or read before under the given name cannot have changed since.
+
+        Immutable values and values not read from HDF yet cannot have changed, containers are checked recursively and
+        all other values, e.g. arrays, may have been modified in place and are written again.
+
+        Args:
+            value: value of the container
+            location (tuple): file name and path of the HDF group of the container
+            name (str): node name of the value
+
+        Returns:
+            bool: True if the value does not need to be written again
+        """
+        if isinstance(value, (str, bytes, numbers.Number, np.generic, type(None))):
+            return True
+        if isinstance(value, HDFStub):
+            return True
+        if isinstance(value, DataContainer):
+            return value._is_unchanged((location[0], posixpath.join(location[1], name)))
+        return False
+
+    def _is_unchanged(self, location) -> bool:
+        """
+        Check whether the container is unchanged since it was last written to or read from the given HDF group.
+
+        Args:
+            location (tuple): file name and path of the HDF group
+
+        Returns:
+            bool: True if the container does not need to be written again
+        """
+        if not self._owns_hdf(location):
+            return False
+        previous = self._hdf_written[2]
+        if len(previous) != len(self):
+            return False
+        for i, (k, v) in enumerate(self._items_unloaded()):
+            name = _get_hdf_node_name(k, i)
+            if previous.get(name, None) is not v or not self._is_written(
+                v, location, name
+            ):
+                return False
+        return True
 
     def _from_hdf(self, hdf, version=None):
+        object.__setattr__(self, "_hdf_written", None)
         with self.unlocked():
             self.clear()
 
@@ -963,6 +1121,13 @@ class DataContainer(DataContainerBase, HasHDF, HasDict):
                     self[k] = v
 
                 self.read_only = bool(hdf.get("READ_ONLY", False))
+                self._set_hdf_written(
+                    _get_hdf_location(hdf),
+                    {
+                        _get_hdf_node_name(k, i): v
+                        for i, (k, v) in enumerate(self._items_unloaded())
+                    },
+                )
 
     # HDFStub compat
     def __getitem__(self, key):
@@ -973,6 +1138,27 @@ class DataContainer(DataContainerBase, HasHDF, HasDict):
             value = self[key] = value.load()
             return value
 
+    def dataset(self, key):
+        """
+        Access an array without loading it completely.
+
+        If the container was read lazily and the array was not accessed yet, a proxy is returned that reads only the
+        selected part of the array from HDF5 when sliced, otherwise the array itself.
+
+        Args:
+            key (str, int): key or path of the array
+
+        Returns:
+            :class:`.HDFDataset`, numpy.ndarray: lazy proxy or the array itself
+        """
+        key = _normalize(key)
+        if isinstance(key, tuple):
+            return self[key[:-1]].dataset(key[-1])
+        value = super().__getitem__(key)
+        if isinstance(value, HDFStub):
+            return value.dataset()
+        return value
+
     def _force_load(self, recursive=True):
         """
         Load all HDFStubs present in the data container.
@@ -19,7 +19,11 @@ __date__ = "Jul 16, 2020"
 
 
 import copy
+import hashlib
+import posixpath
 import warnings
+import weakref
+from collections.abc import MutableMapping
 from typing import Any, Callable, Iterable, List, Tuple
 
 import h5py
@@ -29,6 +33,7 @@ import pandas as pd
 from pyiron_base.interfaces.has_dict import HasDictfromHDF
 from pyiron_base.interfaces.has_hdf import HasHDF
 from pyiron_base.interfaces.lockable import Lockable, sentinel
+from pyiron_base.storage.hdfio import FileHDFio, _open_hdf_pooled
 
 _CHARSIZE = np.dtype("U1").itemsize
 
@@ -47,11 +52,456 @@ def _ensure_str_array_size(array, strlen):
     if isinstance(strlen, np.ndarray):
         strlen = strlen.itemsize // _CHARSIZE
     if current_length < strlen:
+        if isinstance(array, _HDFDatasetArray):
+            return array.change_dtype(f"{2 * strlen}U")
         return array.astype(f"{2 * strlen}U")
     else:
         return array
 
 
+def _encode_str_array(array):
+    """
+    Encode a unicode array of any shape to UTF-8 bytes for writing to HDF5.
+
+    numpy stores unicode data in UTF-32/UCS-4, but h5py wants UTF-8.  Each character in a UTF-8 string might be encoded
+    in up to four bytes, so to make sure we can store any string of length n the bytes are 4 * n wide, which is exactly
+    the itemsize of the unicode array, see also https://docs.h5py.org/en/stable/strings.html
+
+    Args:
+        array (ndarray): array of dtype <U
+
+    Returns:
+        ndarray: array of dtype S with the same shape
+    """
+    dtype = h5py.string_dtype("utf8", array.dtype.itemsize)
+    try:
+        # pure ASCII content is a valid UTF-8 encoding already and numpy converts it without a python loop
+        return array.astype(dtype)
+    except UnicodeEncodeError:
+        return np.char.encode(array, "utf8").astype(dtype)
+
+
+def _decode_str_array(array):
+    """
+    Decode a UTF-8 bytes array of any shape written by :func:`_encode_str_array` back to unicode.
+
+    Args:
+        array (ndarray): array of dtype S
+
+    Returns:
+        ndarray: array of dtype <U with the same shape and the length of the original strings
+    """
+    # itemsize of the bytes is four bytes per character of the original unicode strings
+    dtype = f"U{array.dtype.itemsize // _CHARSIZE}"
+    try:
+        return array.astype(dtype)
+    except UnicodeDecodeError:
+        return np.char.decode(array, "utf8").astype(dtype)
+
+
+def _read_array(name, hdf):
+    """
+    Read an array written by :meth:`FlattenedStorage._to_hdf`.
+
+    Args:
+        name (str): name of the array node
+        hdf (:class:`.FileHDFio`): group of the array
+
+    Returns:
+        ndarray: array
+    """
+    a = np.asarray(hdf[name])
+    if a.dtype.char == "S":
+        # if saved as bytes, we wrote this as an encoded unicode string, so manually decode here
+        a = _decode_str_array(a)
+    return a
+
+
+class _HDFArray:
+    """
+    Location of an array in an HDF5 file, which is only read once the array is accessed.
+
+    Only the file name and paths are kept, so copying and pickling storages with arrays that were not accessed yet is
+    cheap.
+
+    Args:
+        file_name (str): absolute path of the HDF5 file
+        h5_path (str): path of the group of the array inside the HDF5 file
+        name (str): name of the array node
+        per (str): either "element" or "chunk"
+        length (int): expected length of the first axis of the array
+    """
+
+    __slots__ = ("file_name", "h5_path", "name", "per", "length")
+
+    def __init__(self, file_name, h5_path, name, per, length):
+        self.file_name = file_name
+        self.h5_path = h5_path
+        self.name = name
+        self.per = per
+        self.length = length
+
+    def load(self):
+        """
+        Read the array from the HDF5 file.
+
+        Returns:
+            ndarray: array
+
+        Raises:
+            RuntimeError: if the length of the array does not match the allocation of the storage
+        """
+        a = _read_array(
+            self.name, FileHDFio(file_name=self.file_name, h5_path=self.h5_path)
+        )
+        if a.shape[0] != self.length:
+            raise RuntimeError(
+                f"per-{self.per} array {self.name} read inconsistently from HDF: "
+                f"shape {a.shape[0]} does not match global allocation {self.length}!"
+            )
+        return a
+
+
+class _LazyArrayDict(MutableMapping):
+    """
+    Dictionary of arrays, which reads arrays given as :class:`_HDFArray` on first access.
+
+    Checking for or iterating over the names of the arrays does not read them, accessing the values, e.g. via
+    `items()`, does.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._data = dict(*args, **kwargs)
+
+    def __getitem__(self, key):
+        a = self._data[key]
+        if isinstance(a, _HDFArray):
+            a = self._data[key] = a.load()
+        return a
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+
+    def __delitem__(self, key):
+        del self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._data!r})"
+
+
+class _ArrayViews:
+    """
+    Views of an array handed out by :meth:`.FlattenedStorage.get_array`, which can change the array in place.
+
+    Keeps the digest of the rows of the array last written to HDF, so that changes to them are noticed before appending
+    new rows.  Views are referenced weakly and references to collected views are dropped whenever their number doubled.
+
+    Args:
+        digest (bytes): digest of the rows last written, None if they are unknown
+    """
+
+    __slots__ = ("digest", "_refs", "_limit")
+
+    def __init__(self, digest):
+        self.digest = digest
+        self._refs = []
+        self._limit = 64
+
+    def add(self, view):
+        """
+        Remember a view of the array.
+
+        Args:
+            view (ndarray): view handed out
+        """
+        if len(self._refs) >= self._limit:
+            self.prune()
+            self._limit = max(64, 2 * len(self._refs))
+        self._refs.append(weakref.ref(view))
+
+    def prune(self) -> bool:
+        """
+        Drop references to collected views.
+
+        Returns:
+            bool: True if any view is still alive
+        """
+        self._refs = [r for r in self._refs if r() is not None]
+        return len(self._refs) > 0
+
+
+def _digest_rows(array, num_rows):
+    """
+    Digest the first rows of an array to notice changes made to them in place.
+
+    Args:
+        array (ndarray): array to digest
+        num_rows (int): number of rows to digest
+
+    Returns:
+        bytes: digest, None if the dtype of the array cannot be appended to in HDF
+    """
+    if array.dtype.kind not in "biufcU":
+        return None
+    return hashlib.blake2b(
+        np.ascontiguousarray(array[:num_rows]).data, digest_size=16
+    ).digest()
+
+
+class _HDFDatasetArray:
+    """
+    Per element array kept in a resizable dataset of an HDF5 file instead of memory.
+
+    Indexing reads or writes only the selected rows, resizing grows the dataset in place and unicode strings are stored
+    as UTF-8 bytes as written by :meth:`FlattenedStorage._to_hdf`.  The file is opened on every access, unless a session
+    of the file is active.
+
+    Args:
+        file_name (str): absolute path of the HDF5 file
+        h5_path (str): path of the dataset inside the HDF5 file
+        dtype (numpy.dtype): dtype of the array, unicode for datasets of strings
+        shape (tuple): shape of the array
+    """
+
+    __slots__ = ("file_name", "h5_path", "dtype", "shape")
+
+    # bytes copied at once when datasets are rewritten
+    _block_size = 2**24
+
+    def __init__(self, file_name, h5_path, dtype, shape):
+        self.file_name = file_name
+        self.h5_path = h5_path
+        self.dtype = np.dtype(dtype)
+        self.shape = tuple(shape)
+
+    @classmethod
+    def open(cls, file_name, h5_path):
+        """
+        Access an existing dataset without reading it.
+
+        Args:
+            file_name (str): absolute path of the HDF5 file
+            h5_path (str): path of the dataset inside the HDF5 file
+
+        Returns:
+            :class:`_HDFDatasetArray`: array backed by the dataset
+        """
+        with _open_hdf_pooled(file_name) as hdf:
+            dataset = hdf[h5_path]
+            dtype, shape = dataset.dtype, dataset.shape
+        if dtype.char == "S":
+            dtype = np.dtype(f"U{dtype.itemsize // _CHARSIZE}")
+        return cls(file_name=file_name, h5_path=h5_path, dtype=dtype, shape=shape)
+
+    @classmethod
+    def create(cls, file_name, h5_path, shape, dtype, fill=None):
+        """
+        Create a new resizable dataset, replacing any existing node.
+
+        Args:
+            file_name (str): absolute path of the HDF5 file
+            h5_path (str): path of the dataset inside the HDF5 file
+            shape (tuple): shape of the array
+            dtype (numpy.dtype): dtype of the array
+            fill (optional): initial value of all entries
+
+        Returns:
+            :class:`_HDFDatasetArray`: array backed by the new dataset
+        """
+        array = cls(file_name=file_name, h5_path=h5_path, dtype=dtype, shape=shape)
+        kwargs = {}
+        if fill is not None:
+            kwargs["fillvalue"] = array._encode(fill)
+        with _open_hdf_pooled(file_name, mode="a") as hdf:
+            if h5_path in hdf:
+                del hdf[h5_path]
+            dataset = hdf.create_dataset(
+                h5_path,
+                shape=array.shape,
+                dtype=array._h5_dtype,
+                maxshape=(None,) + array.shape[1:],
+                chunks=(array._block_rows(2**20),) + array.shape[1:],
+                **kwargs,
+            )
+            dataset.attrs["TITLE"] = "ndarray"
+        return array
+
+    @classmethod
+    def from_array(cls, file_name, h5_path, array):
+        """
+        Write an array to a new resizable dataset in blocks, so neither in memory nor on disk arrays are read at once.
+
+        Args:
+            file_name (str): absolute path of the HDF5 file
+            h5_path (str): path of the dataset inside the HDF5 file
+            array (numpy.ndarray, :class:`_HDFDatasetArray`): array to write
+
+        Returns:
+            :class:`_HDFDatasetArray`: array backed by the new dataset
+        """
+        if (
+            isinstance(array, cls)
+            and array.file_name == file_name
+            and array.h5_path == h5_path
+        ):
+            return array
+        new = cls.create(
+            file_name=file_name, h5_path=h5_path, shape=array.shape, dtype=array.dtype
+        )
+        rows = new._block_rows(cls._block_size)
+        for start in range(0, len(array), rows):
+            new[start : start + rows] = array[start : start + rows]
+        return new
+
+    @property
+    def _h5_dtype(self):
+        if self.dtype.char == "U":
+            return h5py.string_dtype("utf8", self.dtype.itemsize)
+        return self.dtype
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def itemsize(self):
+        return self.dtype.itemsize
+
+    def __len__(self):
+        return self.shape[0]
+
+    def _block_rows(self, nbytes):
+        row_bytes = self._h5_dtype.itemsize * int(np.prod(self.shape[1:]))
+        return max(1, nbytes // max(1, row_bytes))
+
+    def _encode(self, value):
+        value = np.asarray(value, dtype=self.dtype)
+        if self.dtype.char == "U":
+            value = _encode_str_array(value)
+        return value
+
+    def _decode(self, data):
+        data = np.asarray(data, dtype=self._h5_dtype)
+        if self.dtype.char == "U":
+            data = _decode_str_array(data)
+        return data
+
+    def __getitem__(self, key):
+        with _open_hdf_pooled(self.file_name) as hdf:
+            dataset = hdf[self.h5_path]
+            if isinstance(key, (list, np.ndarray)):
+                key = np.asarray(key)
+                if key.dtype == bool:
+                    key = np.flatnonzero(key)
+                # h5py only reads increasing indices
+                unique, inverse = np.unique(key, return_inverse=True)
+                if len(unique) > 0:
+                    data = dataset[unique][inverse.reshape(-1)]
+                else:
+                    data = dataset[0:0]
+            else:
+                data = dataset[key]
+        return self._decode(data)
+
+    def __setitem__(self, key, value):
+        value = self._encode(value)
+        with _open_hdf_pooled(self.file_name, mode="a") as hdf:
+            dataset = hdf[self.h5_path]
+            if value.ndim == 0 and isinstance(key, slice):
+                # h5py broadcasts scalars row by row, so fill large ranges in blocks instead
+                start, stop, step = key.indices(len(self))
+                rows = self._block_rows(self._block_size) * step
+                for block in range(start, stop, rows):
+                    block = slice(block, min(block + rows, stop), step)
+                    dataset[block] = np.full(
+                        (len(range(*block.indices(stop))),) + self.shape[1:],
+                        value,
+                        dtype=value.dtype,
+                    )
+            else:
+                dataset[key] = value
+
+    def __array__(self, dtype=None, copy=None):
+        a = self[()]
+        return a if dtype is None else a.astype(dtype)
+
+    def __deepcopy__(self, memo):
+        # copies must not share the dataset
+        return self[()]
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}({self.file_name!r}, {self.h5_path!r}, "
+            f"dtype={self.dtype}, shape={self.shape})"
+        )
+
+    def resize(self, new_shape):
+        """
+        Resize the dataset along the first axis, datasets not written as resizable are converted once.
+
+        Args:
+            new_shape (tuple): new shape of the array
+        """
+        new_shape = tuple(new_shape)
+        if new_shape == self.shape:
+            return
+        with _open_hdf_pooled(self.file_name, mode="a") as hdf:
+            dataset = hdf[self.h5_path]
+            resizable = dataset.maxshape[0] is None
+            if resizable:
+                dataset.resize(new_shape[0], axis=0)
+        if resizable:
+            self.shape = new_shape
+        else:
+            self._rewrite(dtype=self.dtype, length=new_shape[0])
+
+    def change_dtype(self, dtype):
+        """
+        Convert the dataset to a new dtype in place, e.g. to store longer strings.
+
+        Args:
+            dtype (numpy.dtype): new dtype
+
+        Returns:
+            :class:`_HDFDatasetArray`: self
+        """
+        self._rewrite(dtype=dtype, length=len(self))
+        return self
+
+    def _rewrite(self, dtype, length):
+        new = self.create(
+            file_name=self.file_name,
+            h5_path=self.h5_path + "__rewrite",
+            shape=(length,) + self.shape[1:],
+            dtype=dtype,
+        )
+        rows = self._block_rows(self._block_size)
+        length = min(length, len(self))
+        for start in range(0, length, rows):
+            stop = min(start + rows, length)
+            new[start:stop] = self[start:stop]
+        with _open_hdf_pooled(self.file_name, mode="a") as hdf:
+            del hdf[self.h5_path]
+            hdf.move(new.h5_path, self.h5_path)
+        self.dtype, self.shape = new.dtype, new.shape
+
+    def remove(self):
+        """
+        Remove the dataset from the file.
+        """
+        with _open_hdf_pooled(self.file_name, mode="a") as hdf:
+            del hdf[self.h5_path]
+
+
 class FlattenedStorage(Lockable, HasDictfromHDF, HasHDF):
     """
     Efficient storage of ragged arrays in flattened arrays.
@@ -203,6 +653,17 @@ class FlattenedStorage(Lockable, HasDictfromHDF, HasHDF):
     >>> len(store)
     3
 
+    Storages too large to fit into memory can keep their per element arrays in an HDF5 file.  After :meth:`.to_disk`
+    or when opening a stored container with :meth:`.from_disk` chunks are added to and read from the file directly;
+    :meth:`.flush` writes the remaining state, so the file can be read again with :meth:`.from_disk` or
+    :meth:`.from_hdf`.  Open a session of the file with :meth:`.FileHDFio.session` around many small accesses and
+    prefer :meth:`.add_chunks` to add many chunks.
+
+    Writing a storage again to the group it was last written to or read from only appends the chunks added since.
+    Chunks changed with :meth:`.set_array` or deleted arrays cause a full rewrite.  Arrays returned by
+    :meth:`.get_array` can be changed in place, so arrays handed out since the last write are rewritten in full, if
+    the rows already written differ from their digest.
+
     You can set storages as read-only via methods defined on
     :class:`.Lockable`.
 
@@ -235,6 +696,14 @@ class FlattenedStorage(Lockable, HasDictfromHDF, HasHDF):
         np.dtype("uint64"): 0,
         str: "_default",
     }
+    # ufuncs of the reductions known by name to reduce(), mean divides the sum by the chunk lengths
+    _reductions = {
+        "sum": np.add,
+        "prod": np.multiply,
+        "min": np.minimum,
+        "max": np.maximum,
+        "mean": np.add,
+    }
 
     def __init__(self, num_chunks=1, num_elements=1, lock_method="error", **kwargs):
         """
@@ -259,6 +728,14 @@ class FlattenedStorage(Lockable, HasDictfromHDF, HasHDF):
         self.prev_chunk_index = 0
         self.prev_element_index = 0
         self._fill_values = {}
+        # maps identifiers to chunk indices, built on the first lookup by identifier
+        self._identifier_index = None
+        # file name and group the per element arrays are kept in, see to_disk()
+        self._disk_location = None
+        # file name, group, number of chunks and elements of the last write to or read from HDF, see _to_hdf()
+        self._hdf_mark = None
+        # maps array names to the views handed out since the last write to HDF, see get_array()
+        self._array_views = {}
 
         self._init_arrays()
 
@@ -309,14 +786,25 @@ class FlattenedStorage(Lockable, HasDictfromHDF, HasHDF):
             "length",
         )
 
+    def __getstate__(self):
+        # views handed out are not shared with copies and weak references cannot be pickled
+        state = self.__dict__.copy()
+        state["_array_views"] = {}
+        return state
+
     def copy(self):
         """
         Return a deep copy of the storage.
 
+        Per element arrays kept on disk are read into memory for the copy.
+
         Returns:
             :class:`.FlattenedStorage`: copy of self
         """
-        return copy.deepcopy(self)
+        new = copy.deepcopy(self)
+        new._disk_location = None
+        new._hdf_mark = None
+        return new
 
     def find_chunk(self, identifier):
         """
@@ -331,10 +819,76 @@ class FlattenedStorage(Lockable, HasDictfromHDF, HasHDF):
         Raises:
             KeyError: if identifier is not found in storage
         """
-        for i, name in enumerate(self._per_chunk_arrays["identifier"]):
-            if name == identifier:
-                return i
-        raise KeyError(f"No chunk named {identifier}")
+        i = self._get_identifier_index().get(identifier, None)
+        if i is None or not self._check_identifier(identifier, i):
+            # identifiers written to the array directly are not tracked, so rebuild the index before giving up
+            self._identifier_index = None
+            i = self._get_identifier_index().get(identifier, None)
+        if i is None:
+            raise KeyError(f"No chunk named {identifier}")
+        return i
+
+    def find_chunks(self, identifiers: Iterable[str]) -> np.ndarray:
+        """
+        Return integer indices for given identifiers.
+
+        Args:
+            identifiers (list of str): names of chunks previously passed to :meth:`.add_chunk`
+
+        Returns:
+            :class:`numpy.ndarray`: integer indices for chunks
+
+        Raises:
+            KeyError: if any identifier is not found in storage
+        """
+        identifiers = list(identifiers)
+        index = self._get_identifier_index()
+        try:
+            indices = np.array([index[i] for i in identifiers], dtype=np.int64)
+        except KeyError:
+            return np.array([self.find_chunk(i) for i in identifiers], dtype=np.int64)
+        if not np.array_equal(
+            self._per_chunk_arrays["identifier"][indices], np.asarray(identifiers)
+        ):
+            self._identifier_index = None
+            return np.array([self.find_chunk(i) for i in identifiers], dtype=np.int64)
+        return indices
+
+    def _get_identifier_index(self) -> dict:
+        """
+        Return the mapping of identifiers to chunk indices and build it if necessary.
+
+        If an identifier is used for multiple chunks, it maps to the first of them.
+
+        Returns:
+            dict: identifiers as keys and chunk indices as values
+        """
+        if self._identifier_index is None:
+            identifiers = self._per_chunk_arrays["identifier"][: self.num_chunks]
+            # iterate backwards, so that the first chunk with an identifier wins
+            self._identifier_index = dict(
+                zip(
+                    identifiers[::-1].tolist(),
+                    range(len(identifiers) - 1, -1, -1),
+                )
+            )
+        return self._identifier_index
+
+    def _check_identifier(self, identifier: str, index: int) -> bool:
+        """
+        Check that a chunk index from the identifier index still belongs to the identifier.
+
+        Args:
+            identifier (str): name of the chunk
+            index (int): chunk index
+
+        Returns:
+            bool: True if the chunk at the index has the identifier
+        """
+        return (
+            index < self.num_chunks
+            and self._per_chunk_arrays["identifier"][index] == identifier
+        )
 
     def _get_per_element_slice(self, frame):
         start = self._per_chunk_arrays["start_index"][frame]
@@ -345,7 +899,12 @@ class FlattenedStorage(Lockable, HasDictfromHDF, HasHDF):
     def _resize_elements(self, new):
         old_max = self._num_elements_alloc
         self._num_elements_alloc = new
-        for k, a in self._per_element_arrays.items():
+        if old_max == new:
+            # arrays not read from HDF yet have the right size already, so avoid reading them
+            arrays = list(self._loaded_arrays(self._per_element_arrays))
+        else:
+            arrays = self._per_element_arrays.items()
+        for k, a in arrays:
             new_shape = (new,) + a.shape[1:]
             try:
                 a.resize(new_shape)
@@ -360,7 +919,11 @@ class FlattenedStorage(Lockable, HasDictfromHDF, HasHDF):
     def _resize_chunks(self, new):
         old_max = self._num_chunks_alloc
         self._num_chunks_alloc = new
-        for k, a in self._per_chunk_arrays.items():
+        if old_max == new:
+            arrays = list(self._loaded_arrays(self._per_chunk_arrays))
+        else:
+            arrays = self._per_chunk_arrays.items()
+        for k, a in arrays:
             new_shape = (new,) + a.shape[1:]
             try:
                 a.resize(new_shape)
@@ -451,7 +1014,19 @@ class FlattenedStorage(Lockable, HasDictfromHDF, HasHDF):
         else:
             raise ValueError(f'per must "element" or "chunk", not {per}')
 
-        if fill is None:
+        if (
+            per == "element"
+            and self._disk_location is not None
+            and np.dtype(dtype).kind in "biufcU"
+        ):
+            store[name] = _HDFDatasetArray.create(
+                file_name=self._disk_location[0],
+                h5_path=posixpath.join(self._disk_location[1], "element_arrays", name),
+                shape=shape,
+                dtype=dtype,
+                fill=fill,
+            )
+        elif fill is None:
             store[name] = np.empty(shape=shape, dtype=dtype)
         else:
             store[name] = np.full(shape=shape, fill_value=fill, dtype=dtype)
@@ -482,19 +1057,34 @@ class FlattenedStorage(Lockable, HasDictfromHDF, HasHDF):
         if isinstance(frame, str):
             frame = self.find_chunk(frame)
         if name in self._per_element_arrays:
+            array = self._per_element_arrays[name]
             if frame is not None:
-                return self._per_element_arrays[name][
-                    self._get_per_element_slice(frame)
-                ]
+                value = array[self._get_per_element_slice(frame)]
             else:
-                return self._per_element_arrays[name][: self.num_elements]
+                value = array[: self.num_elements]
+            per = "element"
         elif name in self._per_chunk_arrays:
+            array = self._per_chunk_arrays[name]
             if frame is not None:
-                return self._per_chunk_arrays[name][frame]
+                value = array[frame]
             else:
-                return self._per_chunk_arrays[name][: self.num_chunks]
+                value = array[: self.num_chunks]
+            per = "chunk"
         else:
             raise KeyError(f"no array named {name}")
+        # views allow changing the array in place, which _to_hdf() needs to know about before appending to it
+        if (
+            isinstance(array, np.ndarray)
+            and isinstance(value, np.ndarray)
+            and value.base is not None
+        ):
+            views = self._array_views.get(name)
+            if views is None:
+                views = self._array_views[name] = _ArrayViews(
+                    self._digest_written(array, per)
+                )
+            views.add(value)
+        return value
 
     def get_array_ragged(self, name: str) -> np.ndarray:
         """
@@ -553,6 +1143,101 @@ class FlattenedStorage(Lockable, HasDictfromHDF, HasHDF):
 
         return np.array([resize_and_pad(v) for v in values])
 
+    def reduce(self, name, func="sum", empty=None) -> np.ndarray:
+        """
+        Reduce the values of a per element array over the elements of each chunk.
+
+        All chunks are reduced at once with :meth:`numpy.ufunc.reduceat`, so no python loop over chunks is needed.
+
+        >>> store = FlattenedStorage(energy=[[1.0, 2.0], [3.0], [4.0, 5.0, 6.0]])
+        >>> store.reduce("energy", "max")
+        array([2., 3., 6.])
+        >>> store.reduce("energy", "mean")
+        array([1.5, 3. , 5. ])
+
+        Values computed from per element arrays can be reduced as well, e.g. the largest force norm in every chunk is
+        `store.reduce(np.linalg.norm(store["forces"], axis=-1), "max")`.
+
+        Args:
+            name (str or numpy.ndarray): name of a per element array or values for all elements
+            func (str or numpy.ufunc): one of "sum", "prod", "min", "max", "mean" or a binary numpy ufunc
+            empty (optional): result for chunks without elements, defaults to the identity of `func` and to nan for
+                              "mean"
+
+        Returns:
+            numpy.ndarray: reduced values of every chunk, with the per element shape of the array
+
+        Raises:
+            KeyError: if no per element array `name` exists
+            ValueError: if given values do not match the number of elements
+            ValueError: if `func` is not a known reduction
+            ValueError: if there are chunks without elements, `func` has no identity and `empty` is not given
+        """
+        if isinstance(name, str):
+            if name not in self._per_element_arrays:
+                raise KeyError(f"no per element array named {name}")
+            values = self._per_element_arrays[name][: self.num_elements]
+        else:
+            values = np.asarray(name)
+            if len(values) != self.num_elements:
+                raise ValueError(
+                    f"Got {len(values)} values, but storage has {self.num_elements} elements!"
+                )
+        mean = isinstance(func, str) and func == "mean"
+        if isinstance(func, str):
+            try:
+                func = self._reductions[func]
+            except KeyError:
+                raise ValueError(f"Unknown reduction {func}!") from None
+
+        offsets, order = self._get_element_order()
+        values = values[order]
+        lengths = np.diff(offsets)
+        # reduceat cannot reduce empty segments, so reduce only filled chunks; as the elements are ordered by chunk,
+        # every segment then ends where the next filled chunk starts
+        filled = lengths > 0
+        if filled.any():
+            result = func.reduceat(values, offsets[:-1][filled], axis=0)
+        else:
+            result = np.empty((0,) + values.shape[1:], dtype=values.dtype)
+        if mean:
+            result = result / lengths[filled].reshape((-1,) + (1,) * (values.ndim - 1))
+        if filled.all():
+            return result
+
+        if empty is None:
+            empty = np.nan if mean else func.identity
+            if empty is None:
+                raise ValueError(
+                    f"Chunks without elements cannot be reduced with {func.__name__}, pass empty!"
+                )
+        reduced = np.full(
+            (len(lengths),) + values.shape[1:],
+            empty,
+            dtype=np.result_type(result.dtype, empty),
+        )
+        reduced[filled] = result
+        return reduced
+
+    def _get_element_order(self):
+        """
+        Return where chunks start and end if the elements of all chunks were stored one after another in chunk order.
+
+        Returns:
+            tuple: offsets of length `len(self) + 1` and an index that brings per element arrays into that order, a
+                   slice if they are in that order already
+        """
+        lengths = self._per_chunk_arrays["length"][: self.num_chunks].astype(np.int64)
+        starts = self._per_chunk_arrays["start_index"][: self.num_chunks]
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        if np.array_equal(starts, offsets[:-1]):
+            return offsets, slice(0, offsets[-1])
+        # index of every element of all chunks, e.g. starts [4, 0] and lengths [2, 3] give [4, 5, 0, 1, 2]
+        return offsets, np.arange(offsets[-1]) + np.repeat(
+            starts - offsets[:-1], lengths
+        )
+
     @sentinel
     def set_array(self, name, frame, value):
         """
@@ -571,6 +1256,7 @@ class FlattenedStorage(Lockable, HasDictfromHDF, HasHDF):
 
         if isinstance(frame, str):
             frame = self.find_chunk(frame)
+        self._invalidate_hdf_mark(frame)
         if name in self._per_element_arrays:
             if self._per_element_arrays[name].dtype.char == "U":
                 self._per_element_arrays[name] = _ensure_str_array_size(
@@ -578,6 +1264,8 @@ class FlattenedStorage(Lockable, HasDictfromHDF, HasHDF):
                 )
             self._per_element_arrays[name][self._get_per_element_slice(frame)] = value
         elif name in self._per_chunk_arrays:
+            if name == "identifier":
+                self._identifier_index = None
             if self._per_chunk_arrays[name].dtype.char == "U":
                 if isinstance(value, np.ndarray) and value.ndim == 0:
                     strlen = len(value.item())
@@ -606,9 +1294,14 @@ class FlattenedStorage(Lockable, HasDictfromHDF, HasHDF):
             KeyError: if no array with given `name` exists and `ignore_missing` is not given
         """
         if name in self._per_element_arrays:
+            a = self._per_element_arrays[name]
+            if isinstance(a, _HDFDatasetArray):
+                a.remove()
             del self._per_element_arrays[name]
+            self._hdf_mark = None
         elif name in self._per_chunk_arrays:
             del self._per_chunk_arrays[name]
+            self._hdf_mark = None
         elif not ignore_missing:
             raise KeyError(name)
 
@@ -686,23 +1379,66 @@ class FlattenedStorage(Lockable, HasDictfromHDF, HasHDF):
         Returns:
             :class:`.FlattenedStorage` or subclass: storage with the selected chunks
         """
+        return self.select(
+            np.array([bool(selector(self, i)) for i in range(len(self))], dtype=bool)
+        )
+
+    def select(self, indices) -> "FlattenedStorage":
+        """
+        Create a new storage with the chunks given by a boolean mask or an array of chunk indices.
+
+        If called on a subclass this correctly returns an instance of that subclass instead.
+
+        >>> store = FlattenedStorage(energy=[[1], [2], [3]])
+        >>> store.select(store["energy"] > 1)["energy"]
+        array([2, 3])
+
+        Args:
+            indices (array of bool or int): either a mask of the length of the storage, or chunk indices in the order
+                                            they should be added to the new storage
+
+        Returns:
+            :class:`.FlattenedStorage` or subclass: storage with the selected chunks
+
+        Raises:
+            ValueError: if a mask does not match the length of the storage
+        """
+        indices = np.asarray(indices)
+        if indices.dtype == bool:
+            if len(indices) != len(self):
+                raise ValueError(
+                    f"Mask of length {len(indices)} does not match storage of length {len(self)}!"
+                )
+            indices = np.flatnonzero(indices)
+        indices = indices.astype(np.int64).reshape(-1)
+        lengths = self._per_chunk_arrays["length"][indices]
+        starts = self._per_chunk_arrays["start_index"][indices]
+        # index of every element of the selected chunks, e.g. starts [4, 0] and lengths [2, 3] give [4, 5, 0, 1, 2]
+        offsets = np.cumsum(lengths) - lengths
+        element_indices = np.arange(lengths.sum()) + np.repeat(
+            starts - offsets, lengths
+        )
+
         new = type(self)()
-        for k, a in self._per_chunk_arrays.items():
-            if k not in ("start_index", "length", "identifier"):
-                new.add_array(k, shape=a.shape[1:], dtype=a.dtype, per="chunk")
-        for k, a in self._per_element_arrays.items():
-            new.add_array(k, shape=a.shape[1:], dtype=a.dtype, per="element")
-        for i in range(len(self)):
-            if selector(self, i):
-                new.add_chunk(
-                    self.get_array("length", i),
-                    identifier=self.get_array("identifier", i),
+        arrays = {}
+        for per, store, index in (
+            ("chunk", self._per_chunk_arrays, indices),
+            ("element", self._per_element_arrays, element_indices),
+        ):
+            for k, a in store.items():
+                if k in ("start_index", "length", "identifier"):
+                    continue
+                new.add_array(
+                    k,
+                    shape=a.shape[1:],
+                    dtype=a.dtype,
+                    fill=self._fill_values.get(k, None),
+                    per=per,
                 )
-                for k in self._per_chunk_arrays:
-                    if k not in ("start_index", "length", "identifier"):
-                        new.set_array(k, len(new) - 1, self.get_array(k, i))
-                for k in self._per_element_arrays:
-                    new.set_array(k, len(new) - 1, self.get_array(k, i))
+                arrays[k] = a[index]
+        new.add_chunks(
+            lengths, identifiers=self._per_chunk_arrays["identifier"][indices], **arrays
+        )
         return new
 
     def split(self, array_names: Iterable[str]) -> "FlattenedStorage":
@@ -722,6 +1458,9 @@ class FlattenedStorage(Lockable, HasDictfromHDF, HasHDF):
                 raise ValueError(f"Array name {k} not present in FlattenedStorage!")
 
         split = copy.copy(self)
+        split._identifier_index = None
+        split._disk_location = None
+        split._hdf_mark = None
         for k in list(split._per_element_arrays):
             if k not in array_names:
                 del split._per_element_arrays[k]
@@ -808,6 +1547,7 @@ class FlattenedStorage(Lockable, HasDictfromHDF, HasHDF):
 
         self._resize_elements(self._num_elements_alloc)
         self._resize_chunks(self._num_chunks_alloc)
+        self._hdf_mark = None
         return self
 
     @sentinel
@@ -864,6 +1604,12 @@ class FlattenedStorage(Lockable, HasDictfromHDF, HasHDF):
             self.num_elements = new_elements
         if self.current_chunk_index + 1 > self.num_chunks:
             self.num_chunks += 1
+            if self._identifier_index is not None:
+                self._identifier_index.setdefault(identifier, self.current_chunk_index)
+        else:
+            # an existing chunk is overwritten
+            self._identifier_index = None
+            self._invalidate_hdf_mark(self.current_chunk_index)
 
         # len of chunk to index into the initialized arrays
         i = self.current_element_index + n
@@ -902,6 +1648,109 @@ class FlattenedStorage(Lockable, HasDictfromHDF, HasHDF):
         self.current_element_index = i
         # return last_chunk_index, last_element_index
 
+    @sentinel
+    def add_chunks(self, lengths, identifiers=None, **arrays):
+        """
+        Add many new chunks to the storage at once.
+
+        This is equivalent to calling :meth:`.add_chunk` for every chunk, but resizes the storage only once and copies
+        the arrays as a whole, so it is much faster to build large storages this way.
+
+        Per element arrays are given concatenated over all new chunks, per chunk arrays with one entry per new chunk.
+
+        >>> container = FlattenedStorage()
+        >>> container.add_chunks([2, 1], identifiers=["A", "B"], energy=[3.14, 2.71], forces=np.zeros((3, 3)))
+        >>> container.get_array("forces", "B").shape
+        (1, 3)
+
+        If an array does not exist yet, it is added as a per element array if its first axis matches the total number of
+        new elements and otherwise as a per chunk array.
+
+        .. attention:: Edge-case!
+
+            If the number of new elements and chunks are equal, new arrays are assumed to be per element, as in
+            :meth:`.add_chunk`, and per chunk arrays must be added explicitly with :meth:`.add_array()` beforehand.
+
+        Args:
+            lengths (array of int): lengths of the new chunks
+            identifiers (array of str, optional): human-readable names for the chunks, if None use the chunk indices as
+                                                  strings
+            **arrays: additional arrays to store for the chunks
+
+        Raises:
+            ValueError: if the number of identifiers or the length of an array does not match the new chunks
+        """
+        lengths = np.asarray(lengths, dtype=np.int32).reshape(-1)
+        num_new_chunks = len(lengths)
+        num_new_elements = int(lengths.sum())
+        chunk_start = self.current_chunk_index
+        chunk_end = chunk_start + num_new_chunks
+        element_start = self.current_element_index
+        element_end = element_start + num_new_elements
+
+        if identifiers is None:
+            identifiers = np.arange(chunk_start, chunk_end).astype(str)
+        else:
+            identifiers = np.asarray(identifiers, dtype=str).reshape(-1)
+            if len(identifiers) != num_new_chunks:
+                raise ValueError(
+                    f"Got {len(identifiers)} identifiers for {num_new_chunks} chunks!"
+                )
+        arrays = {k: np.asarray(a) for k, a in arrays.items()}
+        for k, a in arrays.items():
+            if k in self._per_element_arrays:
+                expected = num_new_elements
+            elif k in self._per_chunk_arrays:
+                expected = num_new_chunks
+            elif len(a.shape) > 0 and a.shape[0] == num_new_elements:
+                self.add_array(k, shape=a.shape[1:], dtype=a.dtype, per="element")
+                expected = num_new_elements
+            elif len(a.shape) > 0 and a.shape[0] == num_new_chunks:
+                self.add_array(k, shape=a.shape[1:], dtype=a.dtype, per="chunk")
+                expected = num_new_chunks
+            else:
+                expected = None
+            if expected is None or len(a.shape) == 0 or a.shape[0] != expected:
+                raise ValueError(
+                    f"Array {k} matches neither the {num_new_elements} new elements nor the {num_new_chunks} new "
+                    f"chunks!"
+                )
+
+        if element_end > self._num_elements_alloc:
+            self._resize_elements(max(element_end, self._num_elements_alloc * 2))
+        if chunk_end > self._num_chunks_alloc:
+            self._resize_chunks(max(chunk_end, self._num_chunks_alloc * 2))
+
+        if chunk_start < self.num_chunks:
+            # existing chunks are overwritten
+            self._identifier_index = None
+            self._invalidate_hdf_mark(chunk_start)
+        elif self._identifier_index is not None:
+            for i, identifier in enumerate(identifiers.tolist(), start=chunk_start):
+                self._identifier_index.setdefault(identifier, i)
+        self.num_elements = max(self.num_elements, element_end)
+        self.num_chunks = max(self.num_chunks, chunk_end)
+
+        self._per_chunk_arrays["start_index"][chunk_start:chunk_end] = (
+            element_start + np.cumsum(lengths) - lengths
+        )
+        self._per_chunk_arrays["length"][chunk_start:chunk_end] = lengths
+        arrays["identifier"] = identifiers
+        for k, a in arrays.items():
+            if k in self._per_element_arrays:
+                store, start, end = self._per_element_arrays, element_start, element_end
+            else:
+                store, start, end = self._per_chunk_arrays, chunk_start, chunk_end
+            if store[k].dtype.char == "U":
+                store[k] = _ensure_str_array_size(store[k], a)
+            store[k][start:end] = a
+
+        if num_new_chunks > 0:
+            self.prev_chunk_index = chunk_end - 1
+            self.prev_element_index = element_end - lengths[-1]
+        self.current_chunk_index = chunk_end
+        self.current_element_index = element_end
+
     @sentinel
     def extend(self, other: "FlattenedStorage"):
         """
@@ -969,6 +1818,7 @@ class FlattenedStorage(Lockable, HasDictfromHDF, HasHDF):
         self.num_chunks = combined_num_chunks
         self.current_chunk_index = self.num_chunks
         self.current_element_index = self.num_elements
+        self._identifier_index = None
 
         return self
 
@@ -998,17 +1848,7 @@ class FlattenedStorage(Lockable, HasDictfromHDF, HasHDF):
     def _to_hdf(self, hdf):
         def write_array(name, array, hdf):
             if array.dtype.char == "U":
-                # numpy stores unicode data in UTF-32/UCS-4, but h5py wants UTF-8, so we manually encode them here
-                # TODO: string arrays with shape != () not handled
-                hdf[name] = np.array(
-                    [s.encode("utf8") for s in array],
-                    # each character in a utf8 string might be encoded in up to 4 bytes, so to
-                    # make sure we can store any string of length n we tell h5py that the
-                    # string will be 4 * n bytes; numpy's dtype does this calculation already
-                    # in itemsize, so we don't need to repeat it here
-                    # see also https://docs.h5py.org/en/stable/strings.html
-                    dtype=h5py.string_dtype("utf8", array.dtype.itemsize),
-                )
+                hdf[name] = _encode_str_array(array)
             else:
                 hdf[name] = array
 
@@ -1016,34 +1856,208 @@ class FlattenedStorage(Lockable, HasDictfromHDF, HasHDF):
         self._resize_elements(self.num_elements)
         self._resize_chunks(self.num_chunks)
 
+        # when the group holds what was last written or read, only chunks and elements added since are appended to
+        # the existing datasets
+        append = self._can_append(hdf)
+        if append:
+            _, _, num_chunks, num_elements = self._hdf_mark
+
         hdf["num_elements"] = self._num_elements_alloc
         hdf["num_chunks"] = self._num_chunks_alloc
 
+        # per element arrays of storages kept on disk stay in their datasets and arrays added in memory are moved
+        # there; arrays on disk are copied to other files in blocks
+        on_disk = isinstance(hdf, FileHDFio) and self._disk_location == (
+            hdf.file_name,
+            hdf.h5_path,
+        )
         hdf_arrays = hdf.open("element_arrays")
-        for k, a in self._per_element_arrays.items():
-            write_array(k, a, hdf_arrays)
+        if append:
+            # arrays not read from HDF yet are unchanged since
+            arrays = list(self._loaded_arrays(self._per_element_arrays))
+        else:
+            arrays = self._per_element_arrays.items()
+        for k, a in arrays:
+            # arrays in memory of storages kept on disk are moved to their datasets below
+            if (
+                append
+                and (isinstance(a, _HDFDatasetArray) or not on_disk)
+                and self._written_unchanged(k, a, num_elements)
+                and self._append_array(k, a, hdf_arrays, num_elements)
+            ):
+                continue
+            if isinstance(hdf_arrays, FileHDFio) and (
+                isinstance(a, _HDFDatasetArray)
+                or (on_disk and a.dtype.kind in "biufcU")
+            ):
+                a = _HDFDatasetArray.from_array(
+                    file_name=hdf_arrays.file_name,
+                    h5_path=posixpath.join(hdf_arrays.h5_path, k),
+                    array=a,
+                )
+                if on_disk:
+                    self._per_element_arrays[k] = a
+            else:
+                write_array(k, a, hdf_arrays)
 
         hdf_arrays = hdf.open("chunk_arrays")
-        for k, a in self._per_chunk_arrays.items():
+        if append:
+            arrays = list(self._loaded_arrays(self._per_chunk_arrays))
+        else:
+            arrays = self._per_chunk_arrays.items()
+        for k, a in arrays:
+            if (
+                append
+                and self._written_unchanged(k, a, num_chunks)
+                and self._append_array(k, a, hdf_arrays, num_chunks)
+            ):
+                continue
             write_array(k, a, hdf_arrays)
 
         hdf["_fill_values"] = self._fill_values
+        self._set_hdf_mark(hdf)
+        # views still alive can change the arrays just written
+        for k, views in list(self._array_views.items()):
+            if k in self._per_element_arrays:
+                a, per = self._per_element_arrays[k], "element"
+            else:
+                a, per = self._per_chunk_arrays.get(k), "chunk"
+            if isinstance(a, np.ndarray) and views.prune():
+                views.digest = self._digest_written(a, per)
+            else:
+                del self._array_views[k]
 
-    def _from_hdf(self, hdf, version=None):
-        def read_array(name, hdf):
-            a = np.asarray(hdf[name])
-            if a.dtype.char == "S":
-                # if saved as bytes, we wrote this as an encoded unicode string, so manually decode here
-                # TODO: string arrays with shape != () not handled
-                a = np.fromiter(
-                    (s.decode("utf8") for s in a),
-                    # itemsize of original a is four bytes per character, so divide by four to get
-                    # length of the orignal stored unicode string; np.dtype('U1').itemsize is just a
-                    # platform agnostic way of knowing how wide a unicode charater is for numpy
-                    dtype=f"U{a.dtype.itemsize // np.dtype('U1').itemsize}",
-                )
-            return a
+    def _set_hdf_mark(self, hdf):
+        """
+        Remember that the given group holds the current chunks and elements of the storage.
 
+        Args:
+            hdf (:class:`.FileHDFio`): HDF group written to or read from, other HDF implementations are not tracked
+        """
+        if isinstance(hdf, FileHDFio):
+            self._hdf_mark = (
+                hdf.file_name,
+                hdf.h5_path,
+                self.num_chunks,
+                self.num_elements,
+            )
+        else:
+            self._hdf_mark = None
+
+    def _digest_written(self, array, per):
+        """
+        Digest the rows of an array last written to or read from HDF.
+
+        Args:
+            array (ndarray): full array
+            per (str): either "element" or "chunk"
+
+        Returns:
+            bytes: digest, None if the storage was not written to or read from HDF
+        """
+        if self._hdf_mark is None:
+            return None
+        return _digest_rows(
+            array, self._hdf_mark[3] if per == "element" else self._hdf_mark[2]
+        )
+
+    def _written_unchanged(self, name, array, num_written) -> bool:
+        """
+        Check that the rows of an array last written to HDF were not changed in place via views of it.
+
+        Args:
+            name (str): name of the array
+            array (ndarray): full array
+            num_written (int): number of rows last written
+
+        Returns:
+            bool: True if no views were handed out since or the written rows match their digest
+        """
+        views = self._array_views.get(name)
+        if views is None:
+            return True
+        return views.digest is not None and views.digest == _digest_rows(
+            array, num_written
+        )
+
+    def _invalidate_hdf_mark(self, frame):
+        """
+        Forget the last write to HDF, if the given chunk was part of it and is about to be modified.
+
+        Args:
+            frame (int): index of the modified chunk
+        """
+        if self._hdf_mark is not None and frame < self._hdf_mark[2]:
+            self._hdf_mark = None
+
+    def _can_append(self, hdf) -> bool:
+        """
+        Check whether new chunks can be appended to the datasets in the given group instead of rewriting them.
+
+        This is the case if the group was the last one written to or read from and still contains the same number of
+        chunks and elements, so no other storage was written there in the meantime.
+
+        Args:
+            hdf (:class:`.FileHDFio`): HDF group to write to
+
+        Returns:
+            bool: True if only new chunks and elements need to be written
+        """
+        if self._hdf_mark is None or not isinstance(hdf, FileHDFio):
+            return False
+        file_name, h5_path, num_chunks, num_elements = self._hdf_mark
+        if (file_name, h5_path) != (hdf.file_name, hdf.h5_path):
+            return False
+        if num_chunks > self.num_chunks or num_elements > self.num_elements:
+            return False
+        try:
+            return (
+                hdf["num_chunks"] == num_chunks and hdf["num_elements"] == num_elements
+            )
+        except ValueError:
+            return False
+
+    @staticmethod
+    def _append_array(name, array, hdf, start) -> bool:
+        """
+        Write the rows of an array from `start` onwards to the end of its existing dataset.
+
+        Args:
+            name (str): name of the array
+            array (:class:`numpy.ndarray`): full array
+            hdf (:class:`.FileHDFio`): HDF group of the dataset
+            start (int): number of rows already in the dataset
+
+        Returns:
+            bool: False if there is no dataset of the same dtype and length `start`, so the array must be written in
+                  full
+        """
+        if array.dtype.kind not in "biufcU":
+            return False
+        try:
+            dataset = _HDFDatasetArray.open(
+                file_name=hdf.file_name, h5_path=posixpath.join(hdf.h5_path, name)
+            )
+        except (KeyError, AttributeError):
+            return False
+        if (
+            dataset.dtype != array.dtype
+            or dataset.shape[1:] != array.shape[1:]
+            or len(dataset) != start
+        ):
+            return False
+        if isinstance(array, _HDFDatasetArray):
+            # array kept in this dataset on disk
+            return (dataset.file_name, dataset.h5_path) == (
+                array.file_name,
+                array.h5_path,
+            )
+        if len(array) > start:
+            dataset.resize(array.shape)
+            dataset[start:] = array[start:]
+        return True
+
+    def _from_hdf(self, hdf, version=None):
         try:
             num_chunks = hdf["num_chunks"]
             num_elements = hdf["num_elements"]
@@ -1052,6 +2066,7 @@ class FlattenedStorage(Lockable, HasDictfromHDF, HasHDF):
             num_elements = hdf["num_atoms"]
 
         self._num_chunks_alloc = self.num_chunks = self.current_chunk_index = num_chunks
+        self._identifier_index = None
         self._num_elements_alloc = self.num_elements = self.current_element_index = (
             num_elements
         )
@@ -1059,30 +2074,47 @@ class FlattenedStorage(Lockable, HasDictfromHDF, HasHDF):
         if version == "0.1.0":
             with hdf.open("arrays") as hdf_arrays:
                 for k in hdf_arrays.list_nodes():
-                    a = read_array(k, hdf_arrays)
+                    a = _read_array(k, hdf_arrays)
                     if a.shape[0] == self._num_elements_alloc:
                         self._per_element_arrays[k] = a
                     elif a.shape[0] == self._num_chunks_alloc:
                         self._per_chunk_arrays[k] = a
         elif version == "0.2.0" or "0.3.0":
-            with hdf.open("element_arrays") as hdf_arrays:
-                for k in hdf_arrays.list_nodes():
-                    self._per_element_arrays[k] = read_array(k, hdf_arrays)
-            with hdf.open("chunk_arrays") as hdf_arrays:
-                for k in hdf_arrays.list_nodes():
-                    self._per_chunk_arrays[k] = read_array(k, hdf_arrays)
+            # arrays stored in files are only read on first access, so loading large storages to access a single array
+            # stays cheap
+            lazy = isinstance(hdf, FileHDFio)
+            if lazy:
+                self._per_element_arrays = _LazyArrayDict(self._per_element_arrays)
+                self._per_chunk_arrays = _LazyArrayDict(self._per_chunk_arrays)
+            for per, store, length in (
+                ("element", self._per_element_arrays, self._num_elements_alloc),
+                ("chunk", self._per_chunk_arrays, self._num_chunks_alloc),
+            ):
+                with hdf.open(per + "_arrays") as hdf_arrays:
+                    for k in hdf_arrays.list_nodes():
+                        if lazy:
+                            store._data[k] = _HDFArray(
+                                file_name=hdf_arrays.file_name,
+                                h5_path=hdf_arrays.h5_path,
+                                name=k,
+                                per=per,
+                                length=length,
+                            )
+                        else:
+                            store[k] = _read_array(k, hdf_arrays)
         else:
             raise RuntimeError(
                 f"Unsupported HDF version {version}; use an older version of pyiron to load this job!"
             )
 
-        for k, a in self._per_chunk_arrays.items():
+        # arrays not read yet are checked when they are read
+        for k, a in self._loaded_arrays(self._per_chunk_arrays):
             if a.shape[0] != self._num_chunks_alloc:
                 raise RuntimeError(
                     f"per-chunk array {k} read inconsistently from HDF: "
                     f"shape {a.shape[0]} does not match global allocation {self._num_chunks_alloc}!"
                 )
-        for k, a in self._per_element_arrays.items():
+        for k, a in self._loaded_arrays(self._per_element_arrays):
             if a.shape[0] != self._num_elements_alloc:
                 raise RuntimeError(
                     f"per-element array {k} read inconsistently from HDF: "
@@ -1091,8 +2123,130 @@ class FlattenedStorage(Lockable, HasDictfromHDF, HasHDF):
 
         if version >= "0.3.0":
             self._fill_values = hdf["_fill_values"]
+        if version != "0.1.0":
+            self._set_hdf_mark(hdf)
+        else:
+            self._hdf_mark = None
+        self._array_views = {}
+
+    def to_disk(self, hdf, group_name=None):
+        """
+        Write the storage to HDF and keep its per element arrays in the file from now on.
+
+        Chunks added afterwards are written to the file directly, call :meth:`.flush` to store the number of chunks and
+        the per chunk arrays, which are kept in memory.
+
+        Args:
+            hdf (:class:`.FileHDFio`): HDF group to write to
+            group_name (str, optional): name of subgroup, defaults to the group name of :meth:`.to_hdf`
+        """
+        hdf = hdf.open(
+            group_name if group_name is not None else self._get_hdf_group_name()
+        )
+        self._disk_location = (hdf.file_name, hdf.h5_path)
+        self.flush()
+
+    @classmethod
+    def from_disk(cls, hdf, group_name=None) -> "FlattenedStorage":
+        """
+        Open a storage written by :meth:`.to_hdf` or :meth:`.to_disk` with its per element arrays kept in the file.
+
+        No per element array is read, :meth:`.get_array` reads only the requested chunks and new chunks are written to
+        the file directly, see :meth:`.to_disk`.
+
+        Args:
+            hdf (:class:`.FileHDFio`): HDF group to read from
+            group_name (str, optional): name of subgroup, defaults to the group name of :meth:`.from_hdf`
+
+        Returns:
+            :class:`.FlattenedStorage` or subclass: storage backed by the file
+        """
+        store = cls()
+        hdf = hdf.open(
+            group_name if group_name is not None else store._get_hdf_group_name()
+        )
+        store.from_hdf(hdf, group_name="")
+        store._disk_location = (hdf.file_name, hdf.h5_path)
+        if isinstance(store._per_element_arrays, _LazyArrayDict):
+            for k, a in store._per_element_arrays._data.items():
+                if isinstance(a, _HDFArray):
+                    store._per_element_arrays._data[k] = _HDFDatasetArray.open(
+                        file_name=a.file_name, h5_path=posixpath.join(a.h5_path, k)
+                    )
+        return store
+
+    def flush(self):
+        """
+        Write the state of a storage kept on disk to its HDF group.
 
-    def to_pandas(self, explode=False, include_index=False) -> pd.DataFrame:
+        Raises:
+            ValueError: if the storage is not kept on disk
+        """
+        if self._disk_location is None:
+            raise ValueError(
+                "Storage is not kept on disk, call to_disk() or from_disk() first!"
+            )
+        file_name, h5_path = self._disk_location
+        parent, group_name = posixpath.split(h5_path)
+        self.to_hdf(FileHDFio(file_name=file_name, h5_path=parent), group_name)
+
+    @staticmethod
+    def _loaded_arrays(store):
+        """
+        Iterate over the arrays of a store, which were already read.
+
+        Args:
+            store (dict): per element or per chunk arrays
+
+        Yields:
+            tuple: name and array
+        """
+        if isinstance(store, _LazyArrayDict):
+            store = store._data
+        for k, a in store.items():
+            if not isinstance(a, _HDFArray):
+                yield k, a
+
+    def to_arrow(self):
+        """
+        Convert arrays to an arrow table with one row per chunk.
+
+        Per element arrays become list columns with offsets computed from the chunk lengths, so numeric arrays are
+        passed to arrow without creating python objects and are not copied if their chunks are stored in order.  Arrays
+        with a per element shape become fixed size lists.  Requires pyarrow.
+
+        Returns:
+            :class:`pyarrow.Table`: table of array values
+
+        Raises:
+            ImportError: if pyarrow is not installed
+        """
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError("FlattenedStorage.to_arrow() requires pyarrow!") from None
+
+        def convert(a):
+            values = pyarrow.array(np.ascontiguousarray(a).reshape(-1))
+            for n in reversed(a.shape[1:]):
+                values = pyarrow.FixedSizeListArray.from_arrays(values, n)
+            return values
+
+        offsets, order = self._get_element_order()
+        offsets = pyarrow.array(offsets)
+        columns = {}
+        for k in self.list_arrays(only_user=True):
+            if k in self._per_element_arrays:
+                columns[k] = pyarrow.LargeListArray.from_arrays(
+                    offsets, convert(self.get_array(k)[order])
+                )
+            else:
+                columns[k] = convert(self.get_array(k))
+        return pyarrow.table(columns)
+
+    def to_pandas(
+        self, explode=False, include_index=False, dtype_backend="numpy"
+    ) -> pd.DataFrame:
         """
         Convert arrays to pandas dataframe.
 
@@ -1100,10 +2254,23 @@ class FlattenedStorage(Lockable, HasDictfromHDF, HasHDF):
             explode (bool): If `False` values of per element arrays are stored
                             in the dataframe as arrays, otherwise each row in the dataframe
                             corresponds to an element in the original storage.
+            include_index (bool): keep the chunk index as a column if `explode` is given
+            dtype_backend (str): "numpy" stores values of per element arrays as arrays in object columns, "pyarrow"
+                                 stores them in list columns of :class:`pandas.ArrowDtype` without python objects, see
+                                 :meth:`.to_arrow`; `explode` is not supported then
 
         Returns:
             :class:`pandas.DataFrame`: table of array values
+
+        Raises:
+            ValueError: if `dtype_backend` is unknown or "pyarrow" and `explode` is given
         """
+        if dtype_backend == "pyarrow":
+            if explode:
+                raise ValueError("explode is not supported with the pyarrow backend!")
+            return self.to_arrow().to_pandas(types_mapper=pd.ArrowDtype)
+        elif dtype_backend != "numpy":
+            raise ValueError(f"Unknown dtype_backend {dtype_backend}!")
         arrays = self.list_arrays(only_user=True)
         # convert to list for the case where shape!=(); in this case pandas
         # complains about multidimensional arrays
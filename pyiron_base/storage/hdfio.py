@@ -5,12 +5,17 @@
 Classes to map the Python objects to HDF5 data structures
 """
 
+import contextlib
+import copy
 import importlib
+import itertools
 import numbers
 import os
 import posixpath
 import sys
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import h5py
 import numpy as np
@@ -40,6 +45,17 @@ __email__ = "janssen@mpie.de"
 __status__ = "production"
 __date__ = "Sep 1, 2017"
 
+# h5io stores these data types as HDF5 groups, nevertheless they are listed as nodes
+_H5IO_GROUP_TYPES = (
+    "dict",
+    "list",
+    "tuple",
+    "pd_dataframe",
+    "pd_series",
+    "multiarray",
+    "json",
+)
+
 
 # for historic reasons we write str(class) into the HDF 'TYPE' field of objects, so we need to parse this back out
 def _extract_fully_qualified_name(type_field: str) -> str:
@@ -63,35 +79,1707 @@ def _extract_module_class_name(type_field: str) -> Tuple[str, str]:
         type_field (str): The type field containing the fully qualified name.
 
     Returns:
-        Tuple[str, str]: The module path and class name.
+        Tuple[str, str]: The module path and class name.
+    """
+    fully_qualified_path = _extract_fully_qualified_name(type_field)
+    return fully_qualified_path.rsplit(".", maxsplit=1)
+
+
+def _list_groups_and_nodes(hdf: h5py.File, h5_path: str) -> Tuple[List[str], List[str]]:
+    """
+    Get the list of groups and list of nodes from an open HDF5 file
+
+    Args:
+        hdf (h5py.File): file handle of an open HDF5 file
+        h5_path (str): path inside the HDF5 file
+
+    Returns:
+        Tuple[List[str], List[str]]: list of groups and list of nodes
+    """
+    groups = set()
+    nodes = set()
+    try:
+        h = hdf[h5_path]
+        for k in h.keys():
+            if h.get(k, getclass=True) is h5py.Group:
+                groups.add(k)
+            else:
+                nodes.add(k)
+    except KeyError:
+        pass
+    return list(groups), list(nodes)
+
+
+def _list_all_from_open_hdf(hdf: h5py.File, h5_path: str) -> Dict[str, List[str]]:
+    """
+    List groups and nodes from an open HDF5 file, with groups written by h5io - like dictionaries or pandas DataFrames -
+    being listed as nodes. The type attributes of all groups are read from the same open file handle.
+
+    Args:
+        hdf (h5py.File): file handle of an open HDF5 file
+        h5_path (str): path inside the HDF5 file
+
+    Returns:
+        Dict[str, List[str]]: Dictionary with keys "groups" and "nodes" containing sorted lists of groups and nodes
+    """
+    groups, nodes = [], []
+    try:
+        h = hdf[h5_path]
+        for k in h.keys():
+            if h.get(k, getclass=True) is not h5py.Group:
+                nodes.append(k)
+            elif str(h[k].attrs.get("TITLE", "")) in _H5IO_GROUP_TYPES:
+                nodes.append(k)
+            else:
+                groups.append(k)
+    except KeyError:
+        pass
+    return {"groups": sorted(groups), "nodes": sorted(nodes)}
+
+
+def _copy_hdf_group(
+    source: h5py.Group,
+    target: h5py.Group,
+    exclude_groups: List[str],
+    exclude_nodes: List[str],
+) -> None:
+    """
+    Copy the content of one HDF5 group to another with the native HDF5 object copy, so the data is never deserialized.
+    Nodes - including groups written by h5io, like dictionaries or pandas DataFrames - are copied as a whole, groups are
+    copied as a whole unless some of their content is excluded, in which case they are copied recursively.
+
+    Entries of the exclude lists without "/" are excluded at every level, entries of the form "group/name" only inside
+    the given group.
+
+    Args:
+        source (h5py.Group): group to copy from
+        target (h5py.Group): group to copy to, existing nodes are overwritten
+        exclude_groups (List[str]): list of groups to exclude from the copy
+        exclude_nodes (List[str]): list of nodes to exclude from the copy
+    """
+    exclude_groups_split = [i.split("/", 1) for i in exclude_groups]
+    exclude_nodes_split = [i.split("/", 1) for i in exclude_nodes]
+    check_groups = [i[-1] for i in exclude_groups_split]
+    check_nodes = [i[-1] for i in exclude_nodes_split]
+    for k in source.keys():
+        if (
+            source.get(k, getclass=True) is h5py.Group
+            and str(source[k].attrs.get("TITLE", "")) not in _H5IO_GROUP_TYPES
+        ):
+            if k in check_groups:
+                continue
+            ex_n = [e[-1] for e in exclude_nodes_split if k == e[0] or len(e) == 1]
+            ex_g = [e[-1] for e in exclude_groups_split if k == e[0] or len(e) == 1]
+            if len(ex_n) == 0 and len(ex_g) == 0 and k not in target:
+                source.copy(source[k], target, name=k)
+            else:
+                _copy_hdf_group(
+                    source=source[k],
+                    target=target.require_group(k),
+                    exclude_groups=ex_g,
+                    exclude_nodes=ex_n,
+                )
+        elif k not in check_nodes:
+            if k in target:
+                del target[k]
+            source.copy(source[k], target, name=k)
+
+
+def _get_file_inode(file_name: str) -> Optional[Tuple[int, int]]:
+    """
+    Get the device and inode number of a file, which identify the file independent of its name.
+
+    Args:
+        file_name (str): path of the file
+
+    Returns:
+        Optional[Tuple[int, int]]: device and inode number or None if the file does not exist
+    """
+    try:
+        stat_result = os.stat(file_name)
+    except FileNotFoundError:
+        return None
+    return stat_result.st_dev, stat_result.st_ino
+
+
+def _contains_pandas(node: Optional[Union[h5py.Group, h5py.Dataset]]) -> bool:
+    """
+    Check if an HDF5 node stores a pandas object, either directly or nested inside a dict, list or tuple stored by h5io.
+
+    Args:
+        node (h5py.Group, h5py.Dataset, None): HDF5 node to check
+
+    Returns:
+        bool: True if reading the node requires pandas
+    """
+    if not isinstance(node, h5py.Group):
+        return False
+    title = node.attrs.get("TITLE", "")
+    if title in ("pd_dataframe", "pd_series"):
+        return True
+    elif title in ("dict", "list", "tuple"):
+        return any(_contains_pandas(node=sub_node) for sub_node in node.values())
+    else:
+        return False
+
+
+class StoragePolicy:
+    """
+    Chunking and compression policy for numeric arrays written to HDF5.
+
+    h5io stores arrays contiguous and uncompressed, numeric arrays larger than the threshold are instead written as
+    chunked datasets with the given compression filter. They are read back like any other array. A policy can be set
+    per project via :attr:`.Project.storage_policy`, otherwise it is taken from the `hdf_compression`,
+    `hdf_compression_level`, `hdf_compression_threshold` and `hdf_shuffle` keys of `state.settings`.
+
+    >>> policy = StoragePolicy(compression="gzip", threshold=1024)
+    >>> policy.dataset_kwargs(np.zeros(10))
+    >>> policy.dataset_kwargs(np.zeros(1000))
+    {'chunks': True, 'compression': 'gzip', 'shuffle': True, 'compression_opts': 4}
+
+    Args:
+        compression (str, optional): compression filter, either "gzip" or "lzf", None disables compression
+        compression_level (int): compression level (0-9) of the gzip filter
+        threshold (int): size in bytes above which arrays are chunked and compressed
+        shuffle (bool): apply the shuffle filter before compressing
+    """
+
+    def __init__(
+        self,
+        compression: Optional[str] = None,
+        compression_level: int = 4,
+        threshold: int = 1048576,
+        shuffle: bool = True,
+    ):
+        if compression not in [None, "gzip", "lzf"]:
+            raise ValueError(
+                f"Unknown compression {compression}, choose from None, 'gzip' or 'lzf'."
+            )
+        self.compression = compression
+        self.compression_level = compression_level
+        self.threshold = threshold
+        self.shuffle = shuffle
+
+    @classmethod
+    def from_settings(cls) -> "StoragePolicy":
+        """
+        Create the storage policy defined in the pyiron configuration.
+
+        Returns:
+            StoragePolicy: storage policy of the current configuration
+        """
+        config = state.settings.configuration
+        compression = config["hdf_compression"]
+        return cls(
+            compression=(
+                None if compression in [None, "", "None", "none"] else compression
+            ),
+            compression_level=config["hdf_compression_level"],
+            threshold=config["hdf_compression_threshold"],
+            shuffle=config["hdf_shuffle"],
+        )
+
+    def dataset_kwargs(self, data: Any) -> Optional[Dict[str, Any]]:
+        """
+        Get the keyword arguments for :meth:`h5py.Group.create_dataset` to store the given data.
+
+        Args:
+            data (object): data to store
+
+        Returns:
+            dict: keyword arguments, None if the data is stored with the h5io defaults
+        """
+        if not isinstance(data, np.ndarray):
+            return None
+        return self._get_dataset_kwargs(
+            dtype=data.dtype, ndim=data.ndim, nbytes=data.nbytes
+        )
+
+    def _get_dataset_kwargs(
+        self, dtype: np.dtype, ndim: int, nbytes: int
+    ) -> Optional[Dict[str, Any]]:
+        if (
+            self.compression is None
+            or dtype.kind not in "biufc"
+            or ndim == 0
+            or nbytes < self.threshold
+        ):
+            return None
+        kwargs = {
+            "chunks": True,
+            "compression": self.compression,
+            "shuffle": self.shuffle,
+        }
+        if self.compression == "gzip":
+            kwargs["compression_opts"] = self.compression_level
+        return kwargs
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(compression={self.compression!r}, "
+            f"compression_level={self.compression_level}, threshold={self.threshold}, "
+            f"shuffle={self.shuffle})"
+        )
+
+
+class JobContainerPolicy:
+    """
+    Policy to store small jobs as groups inside shared container files, rather than in one HDF5 file per job.
+
+    Projects with many small jobs - like the results of wrapped python functions - create one HDF5 file per job, which
+    exhausts the inode quota of parallel file systems and slows down listing and backing up the project. With a policy
+    set via :attr:`.Project.job_container_policy` new jobs of the selected types are stored in the group
+    `/<container>/<job_name>` of the container file `<container>.h5`, where the container name consists of the prefix
+    and a running index. A new container file is started once the current one holds `max_jobs` jobs or exceeds
+    `max_size` bytes. Existing jobs can be moved to container files with
+    :meth:`.Project.maintenance.local.consolidate_jobs`.
+
+    Container files are written by one process at a time, so the policy is meant for jobs which are saved and executed
+    from the same process rather than being submitted to a queuing system.
+
+    >>> pr.job_container_policy = JobContainerPolicy(job_types=["PythonFunctionContainerJob"])
+
+    Args:
+        job_types (list, optional): names of the job classes stored in container files, None selects all job types
+        max_jobs (int): maximum number of jobs per container file
+        max_size (int): size in bytes above which no further jobs are added to a container file
+        prefix (str): prefix of the names of the container files
+    """
+
+    def __init__(
+        self,
+        job_types: Optional[List[str]] = None,
+        max_jobs: int = 1000,
+        max_size: int = 1073741824,
+        prefix: str = "job_container",
+    ):
+        if max_jobs < 1:
+            raise ValueError("A container file has to hold at least one job.")
+        self.job_types = list(job_types) if job_types is not None else None
+        self.max_jobs = max_jobs
+        self.max_size = max_size
+        self.prefix = _get_safe_job_name(prefix)
+
+    def applies_to(self, job_type: str) -> bool:
+        """
+        Check if jobs of a given type are stored in container files.
+
+        Args:
+            job_type (str): name of the job class, like `job.__name__`
+
+        Returns:
+            bool: True if the jobs are stored in container files
+        """
+        return self.job_types is None or job_type in self.job_types
+
+    def get_container_name(self, path: str) -> str:
+        """
+        Get the name of the container file new jobs are added to, a new container is started when the latest one is
+        full.
+
+        Args:
+            path (str): directory of the container files
+
+        Returns:
+            str: name of the container file without the file extension
+        """
+        index_lst = [
+            int(f[len(self.prefix) + 1 : -3])
+            for f in (os.listdir(path) if os.path.isdir(path) else [])
+            if f.startswith(self.prefix + "_")
+            and f.endswith(".h5")
+            and f[len(self.prefix) + 1 : -3].isdigit()
+        ]
+        if len(index_lst) == 0:
+            return self.prefix + "_0"
+        index = max(index_lst)
+        container = self.prefix + "_" + str(index)
+        file_name = os.path.join(path, container + ".h5")
+        job_lst = _list_container_jobs(file_name=file_name, container=container)
+        if (
+            job_lst is None
+            or len(job_lst) >= self.max_jobs
+            or os.path.getsize(file_name) >= self.max_size
+        ):
+            return self.prefix + "_" + str(index + 1)
+        return container
+
+    def get_container(
+        self, project: "pyiron_base.project.generic.Project"
+    ) -> "ProjectHDFio":
+        """
+        Get the container file new jobs of the project are added to, the container file is created if it does not
+        exist yet.
+
+        Args:
+            project (Project): project the jobs are located in
+
+        Returns:
+            ProjectHDFio: root group of the jobs inside the container file
+        """
+        container = self.get_container_name(path=project.path)
+        hdf = ProjectHDFio(
+            project=project, file_name=container, h5_path="/" + container
+        )
+        if not hdf.file_exists:
+            hdf[_JOB_CONTAINER_VERSION_NODE] = _JOB_CONTAINER_VERSION
+        return hdf
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(job_types={self.job_types!r}, max_jobs={self.max_jobs}, "
+            f"max_size={self.max_size}, prefix={self.prefix!r})"
+        )
+
+
+# container files are marked by a version node in the root group of the jobs, i.e. /<container>/CONTAINER_VERSION
+_JOB_CONTAINER_VERSION_NODE = "CONTAINER_VERSION"
+_JOB_CONTAINER_VERSION = "0.1.0"
+
+
+def _list_container_jobs(file_name: str, container: str) -> Optional[List[str]]:
+    """
+    List the jobs stored in a container file.
+
+    Args:
+        file_name (str): absolute path of the HDF5 file
+        container (str): name of the container, which equals the file name without extension
+
+    Returns:
+        list: sorted names of the jobs in the container, None if the file is not a container file
+    """
+    with _open_hdf_pooled(file_name) as hdf:
+        if container not in hdf or _JOB_CONTAINER_VERSION_NODE not in hdf[container]:
+            return None
+        group = hdf[container]
+        return sorted(
+            k for k in group.keys() if group.get(k, getclass=True) is h5py.Group
+        )
+
+
+def _write_hdf_with_storage_policy(
+    hdf_filehandle: Union[str, h5py.File],
+    h5_path: str,
+    data: Any,
+    storage_policy: Optional[StoragePolicy] = None,
+    compression: int = 4,
+) -> None:
+    """
+    Write data to an HDF5 file, large numeric arrays are chunked and compressed according to the storage policy. All
+    other data is written with h5io.
+
+    Args:
+        hdf_filehandle (str/h5py.File): open h5py file handle or file name
+        h5_path (str): path inside the HDF5 file
+        data (object): data to store
+        storage_policy (StoragePolicy, optional): chunking and compression policy, defaults to the configured policy
+        compression (int): gzip compression level h5io applies to strings and json data
+    """
+    if storage_policy is None:
+        storage_policy = StoragePolicy.from_settings()
+    dataset_kwargs = storage_policy.dataset_kwargs(data)
+    if dataset_kwargs is None:
+        _write_hdf5_with_json_support(
+            hdf_filehandle=hdf_filehandle,
+            h5_path=h5_path,
+            data=data,
+            compression=compression,
+        )
+    elif isinstance(hdf_filehandle, str):
+        with _open_hdf(hdf_filehandle, mode="a") as hdf:
+            _create_compressed_dataset(
+                hdf=hdf, h5_path=h5_path, data=data, dataset_kwargs=dataset_kwargs
+            )
+    else:
+        _create_compressed_dataset(
+            hdf=hdf_filehandle,
+            h5_path=h5_path,
+            data=data,
+            dataset_kwargs=dataset_kwargs,
+        )
+
+
+def _create_compressed_dataset(
+    hdf: h5py.File, h5_path: str, data: np.ndarray, dataset_kwargs: Dict[str, Any]
+) -> None:
+    """
+    Create a dataset which h5io reads as array, replacing any existing node.
+
+    Args:
+        hdf (h5py.File): open HDF5 file handle
+        h5_path (str): path inside the HDF5 file
+        data (np.ndarray): array to store
+        dataset_kwargs (dict): chunking and compression arguments for :meth:`h5py.Group.create_dataset`
+    """
+    if h5_path in hdf:
+        del hdf[h5_path]
+    dataset = hdf.create_dataset(h5_path, data=data, **dataset_kwargs)
+    dataset.attrs["TITLE"] = "ndarray"
+
+
+def _create_resizable_dataset(
+    hdf: h5py.File,
+    h5_path: str,
+    data: np.ndarray,
+    storage_policy: Optional[StoragePolicy] = None,
+) -> None:
+    """
+    Create a chunked dataset, which can be extended along its first axis and is read by h5io as array, replacing any
+    existing node.
+
+    Args:
+        hdf (h5py.File): open HDF5 file handle
+        h5_path (str): path inside the HDF5 file
+        data (np.ndarray): initial content of the dataset
+        storage_policy (StoragePolicy, optional): compression of the chunks, the size threshold is ignored as the
+                                                  dataset is expected to grow
+    """
+    if h5_path in hdf:
+        del hdf[h5_path]
+    row_bytes = data.dtype.itemsize * int(np.prod(data.shape[1:]))
+    kwargs = {}
+    if storage_policy is not None:
+        kwargs = (
+            storage_policy._get_dataset_kwargs(
+                dtype=data.dtype, ndim=data.ndim, nbytes=storage_policy.threshold
+            )
+            or {}
+        )
+    kwargs["chunks"] = (max(1, 65536 // max(1, row_bytes)),) + data.shape[1:]
+    dataset = hdf.create_dataset(
+        h5_path, data=data, maxshape=(None,) + data.shape[1:], **kwargs
+    )
+    dataset.attrs["TITLE"] = "ndarray"
+
+
+def _is_extendable_dataset(
+    dataset: Optional[Union[h5py.Group, h5py.Dataset]], data: np.ndarray
+) -> bool:
+    """
+    Check if an array can be appended to a dataset by resizing it, without converting the dataset.
+
+    Args:
+        dataset (h5py.Dataset): HDF5 node
+        data (np.ndarray): array to append
+
+    Returns:
+        bool: True if the dataset is a resizable numeric array with matching shape and a dtype which can hold the data
+    """
+    return (
+        isinstance(dataset, h5py.Dataset)
+        and dataset.attrs.get("TITLE") == "ndarray"
+        and dataset.dtype.kind in "biufc"
+        and dataset.ndim == data.ndim
+        and dataset.shape[1:] == data.shape[1:]
+        and dataset.maxshape[0] is None
+        and np.result_type(dataset.dtype, data.dtype) == dataset.dtype
+    )
+
+
+def _extend_dataset(dataset: h5py.Dataset, data: np.ndarray) -> None:
+    """
+    Resize a dataset along the first axis and write the array to the new rows.
+
+    Args:
+        dataset (h5py.Dataset): resizable HDF5 dataset
+        data (np.ndarray): array to append
+    """
+    length = dataset.shape[0]
+    dataset.resize(length + len(data), axis=0)
+    dataset[length:] = data
+
+
+def _append_hdf_dataset(
+    file_name: str,
+    h5_path: str,
+    data: np.ndarray,
+    storage_policy: Optional[StoragePolicy] = None,
+    swmr: bool = False,
+) -> bool:
+    """
+    Append an array along the first axis to a dataset, which is resized in place. A dataset written in one piece or with
+    a narrower dtype is converted to a resizable dataset once.
+
+    Args:
+        file_name (str): absolute path of the HDF5 file
+        h5_path (str): path inside the HDF5 file
+        data (np.ndarray): array to append
+        storage_policy (StoragePolicy, optional): compression of newly created datasets
+        swmr (bool): append to existing resizable datasets with a handle in SWMR write mode, which is kept open, so
+                     other processes can read the file while it is written
+
+    Returns:
+        bool: False if the data can not be appended in place, e.g. for ragged or object arrays
+    """
+    if data.ndim == 0 or data.dtype.kind not in "biufc" or 0 in data.shape[1:]:
+        return False
+    if (
+        swmr
+        and os.path.exists(file_name)
+        and not _hdf_write_buffer.pending(file_name=file_name)
+    ):
+        hdf = _hdf_file_pool.get_swmr_writer(file_name=file_name)
+        dataset = hdf.get(h5_path) if hdf is not None else None
+        if _is_extendable_dataset(dataset=dataset, data=data):
+            _extend_dataset(dataset=dataset, data=data)
+            dataset.flush()
+            return True
+        # new datasets can not be created in SWMR mode
+        _hdf_file_pool.release_swmr_writer(file_name=file_name)
+    with _open_hdf_pooled(file_name, mode="a", changed_paths=[h5_path]) as hdf:
+        dataset = hdf.get(h5_path)
+        if dataset is None:
+            _create_resizable_dataset(
+                hdf=hdf, h5_path=h5_path, data=data, storage_policy=storage_policy
+            )
+        elif (
+            not isinstance(dataset, h5py.Dataset)
+            or dataset.attrs.get("TITLE") != "ndarray"
+            or dataset.dtype.kind not in "biufc"
+            or dataset.shape[1:] != data.shape[1:]
+            or dataset.ndim != data.ndim
+        ):
+            return False
+        elif _is_extendable_dataset(dataset=dataset, data=data):
+            _extend_dataset(dataset=dataset, data=data)
+        else:
+            _create_resizable_dataset(
+                hdf=hdf,
+                h5_path=h5_path,
+                data=np.concatenate([dataset[()], data]),
+                storage_policy=storage_policy,
+            )
+    return True
+
+
+def _recompress_hdf(
+    hdf: Union[h5py.File, h5py.Group], storage_policy: StoragePolicy
+) -> int:
+    """
+    Rewrite the arrays of an open HDF5 file, whose chunking and compression does not match the storage policy.
+
+    Args:
+        hdf (h5py.File/h5py.Group): open HDF5 file handle
+        storage_policy (StoragePolicy): chunking and compression policy
+
+    Returns:
+        int: number of rewritten datasets
+    """
+    datasets = []
+
+    def collect(name, obj):
+        if isinstance(obj, h5py.Dataset) and obj.attrs.get("TITLE") == "ndarray":
+            datasets.append(name)
+
+    hdf.visititems(collect)
+    rewritten = 0
+    for name in datasets:
+        dataset = hdf[name]
+        dataset_kwargs = storage_policy._get_dataset_kwargs(
+            dtype=dataset.dtype, ndim=dataset.ndim, nbytes=dataset.nbytes
+        )
+        if dataset_kwargs is None:
+            if dataset.compression is None:
+                continue
+            data = dataset[()]
+            del hdf[name]
+            hdf.create_dataset(name, data=data).attrs["TITLE"] = "ndarray"
+        elif (
+            dataset.compression == dataset_kwargs["compression"]
+            and dataset.compression_opts == dataset_kwargs.get("compression_opts")
+            and dataset.shuffle == dataset_kwargs["shuffle"]
+        ):
+            continue
+        else:
+            _create_compressed_dataset(
+                hdf=hdf,
+                h5_path=name,
+                data=dataset[()],
+                dataset_kwargs=dataset_kwargs,
+            )
+        rewritten += 1
+    return rewritten
+
+
+def _open_hdf_swmr_fallback(file_name: str, mode: str = "r") -> h5py.File:
+    """
+    Open an HDF5 file, if another process writes the file in single-writer/multiple-reader (SWMR) mode it is opened
+    for reading with ``swmr=True`` instead.
+
+    Args:
+        file_name (str): absolute path of the HDF5 file
+        mode (str): mode to open the HDF5 file
+
+    Returns:
+        h5py.File: open HDF5 file handle
+    """
+    try:
+        return _open_hdf(file_name, mode=mode)
+    except OSError:
+        if mode != "r" or not os.path.exists(file_name):
+            raise
+        return _open_hdf(file_name, mode="r", swmr=True)
+
+
+def _refresh_swmr_node(node: Optional[Union[h5py.Group, h5py.Dataset]]) -> None:
+    """
+    Refresh a dataset or all datasets of a group opened in SWMR read mode, so data appended by the writer is visible.
+
+    Args:
+        node (h5py.Group/h5py.Dataset): HDF5 node
+    """
+    if isinstance(node, h5py.Dataset):
+        node.refresh()
+    elif isinstance(node, h5py.Group):
+        node.visititems(
+            lambda _, obj: obj.refresh() if isinstance(obj, h5py.Dataset) else None
+        )
+
+
+class _HDFFilePool:
+    """
+    Least recently used pool of open HDF5 file handles.
+
+    The pool is only active while at least one :meth:`FileHDFio.session` is entered, outside of a session every
+    operation opens and closes the HDF5 file as before. Handles are shared by all :class:`FileHDFio` objects in the
+    process, a handle opened for reading is reopened in append mode as soon as a write is requested. Before a pooled
+    handle is returned, the inode of the file is compared to the inode at the time the handle was opened, so a file which
+    was deleted or replaced in the meantime is reopened rather than served from a stale handle.
+
+    In addition the pool manages handles opened in single-writer/multiple-reader (SWMR) mode, which stay open outside of
+    sessions until they are released. In SWMR mode existing datasets can only be extended, so the SWMR handle of a file
+    is used for reading but closed as soon as the file is opened for any other write.
+
+    Args:
+        max_size (int): maximum number of simultaneously open HDF5 files
+    """
+
+    def __init__(self, max_size: int = 16) -> None:
+        self.max_size = max_size
+        self._handles = OrderedDict()
+        self._swmr_writers = {}
+        self._depth = 0
+        self._previous_max_sizes = []
+        self._lock = threading.RLock()
+
+    @property
+    def active(self) -> bool:
+        """
+        Check if a session is active.
+
+        Returns:
+            bool: True if HDF5 files are kept open
+        """
+        return self._depth > 0
+
+    def enter(self, max_size: Optional[int] = None) -> None:
+        """
+        Enter a session, sessions can be nested and the handles are only closed when the outermost session is left.
+
+        Args:
+            max_size (int, optional): maximum number of simultaneously open HDF5 files, the previous limit is restored
+                when the session is left
+        """
+        with self._lock:
+            self._previous_max_sizes.append(self.max_size)
+            if max_size is not None:
+                self.max_size = max_size
+                self._evict()
+            self._depth += 1
+
+    def exit(self) -> None:
+        """
+        Leave a session, restore the maximum number of open files and close all handles if it was the outermost session.
+        """
+        with self._lock:
+            self._depth -= 1
+            self.max_size = self._previous_max_sizes.pop()
+            if self._depth == 0:
+                self.close_all()
+            else:
+                self._evict()
+
+    def get(self, file_name: str, mode: str = "r") -> h5py.File:
+        """
+        Get an open handle for the given HDF5 file.
+
+        Args:
+            file_name (str): absolute path of the HDF5 file
+            mode (str): "r" for read access, any other mode for read and write access
+
+        Returns:
+            h5py.File: open HDF5 file handle
+        """
+        with self._lock:
+            if file_name in self._swmr_writers:
+                if mode == "r":
+                    return self.get_swmr_writer(file_name=file_name)
+                self.release_swmr_writer(file_name=file_name)
+            entry = self._handles.pop(file_name, None)
+            if entry is not None:
+                hdf, inode = entry
+                if (
+                    not hdf.id.valid
+                    or inode != _get_file_inode(file_name=file_name)
+                    or (mode != "r" and hdf.mode == "r")
+                ):
+                    if hdf.id.valid:
+                        hdf.close()
+                    entry = None
+            if entry is None:
+                hdf = _open_hdf_swmr_fallback(
+                    file_name, mode="r" if mode == "r" else "a"
+                )
+                entry = (hdf, _get_file_inode(file_name=file_name))
+            self._handles[file_name] = entry
+            self._evict()
+            return entry[0]
+
+    def _evict(self) -> None:
+        """
+        Close the least recently used handles until the pool does not exceed its maximum size.
+        """
+        with self._lock:
+            while len(self._handles) > self.max_size:
+                _, (hdf_old, _) = self._handles.popitem(last=False)
+                if hdf_old.id.valid:
+                    hdf_old.close()
+
+    def release(self, file_name: str) -> None:
+        """
+        Close the handles of a given HDF5 file, if it is part of the pool.
+
+        Args:
+            file_name (str): absolute path of the HDF5 file
+        """
+        with self._lock:
+            entry = self._handles.pop(file_name, None)
+            if entry is not None and entry[0].id.valid:
+                entry[0].close()
+            self.release_swmr_writer(file_name=file_name)
+            _hdf_tree_index_cache.invalidate(file_name=file_name)
+
+    def has_swmr_writer(self, file_name: str) -> bool:
+        """
+        Check if the given HDF5 file is held open in SWMR write mode.
+
+        Args:
+            file_name (str): absolute path of the HDF5 file
+
+        Returns:
+            bool: True if an SWMR handle is open
+        """
+        return file_name in self._swmr_writers
+
+    def get_swmr_writer(self, file_name: str) -> Optional[h5py.File]:
+        """
+        Get a handle of the given HDF5 file in SWMR write mode, which is kept open until it is released. While it is
+        open, other processes can read the file with ``swmr=True``.
+
+        Args:
+            file_name (str): absolute path of the HDF5 file
+
+        Returns:
+            h5py.File: open HDF5 file handle in SWMR write mode, None if the file format does not support SWMR
+        """
+        with self._lock:
+            hdf = self._swmr_writers.get(file_name)
+            if hdf is not None and hdf.id.valid:
+                return hdf
+            entry = self._handles.pop(file_name, None)
+            if entry is not None and entry[0].id.valid:
+                entry[0].close()
+            hdf = _open_hdf(file_name, mode="a")
+            try:
+                hdf.swmr_mode = True
+            except RuntimeError:
+                # SWMR requires the file to be created with the latest file format
+                hdf.close()
+                return None
+            self._swmr_writers[file_name] = hdf
+            return hdf
+
+    def release_swmr_writer(self, file_name: str) -> None:
+        """
+        Close the SWMR handle of a given HDF5 file, if it is open.
+
+        Args:
+            file_name (str): absolute path of the HDF5 file
+        """
+        with self._lock:
+            hdf = self._swmr_writers.pop(file_name, None)
+            if hdf is not None and hdf.id.valid:
+                hdf.close()
+
+    def close_all(self) -> None:
+        """
+        Close all handles in the pool.
+        """
+        with self._lock:
+            for file_name in list(self._handles.keys()):
+                self.release(file_name=file_name)
+
+
+_hdf_file_pool = _HDFFilePool()
+
+
+def _normalize_h5_path(h5_path: str) -> str:
+    """
+    Normalize a path inside an HDF5 file to an absolute path without redundant separators.
+
+    Args:
+        h5_path (str): path inside the HDF5 file
+
+    Returns:
+        str: normalized absolute path
+    """
+    return posixpath.normpath("/" + h5_path.lstrip("/"))
+
+
+def _is_relative_to(h5_path: str, parent: str) -> bool:
+    """
+    Check if a normalized path inside an HDF5 file is the parent path itself or located below it.
+
+    Args:
+        h5_path (str): normalized path inside the HDF5 file
+        parent (str): normalized path of the parent group
+
+    Returns:
+        bool: True if h5_path equals parent or is located below it
+    """
+    return parent == "/" or h5_path == parent or h5_path.startswith(parent + "/")
+
+
+def _copy_buffered(data: Any) -> Any:
+    """
+    Copy data recorded in or read from the write buffer, so the buffer does not share mutable objects with the caller.
+
+    Args:
+        data (object): data to copy
+
+    Returns:
+        object: deep copy of the data, the data itself if it can not be copied
+    """
+    try:
+        return copy.deepcopy(data)
+    except (TypeError, copy.Error):
+        # e.g. objects holding locks or open file handles
+        return data
+
+
+class _HDFWriteBuffer(threading.local):
+    """
+    Buffer of the changes to HDF5 files recorded while a :meth:`FileHDFio.batch` is active.
+
+    Writes, deletions and created groups are recorded per file in the order they are issued, a write or a deletion
+    replaces all changes recorded for the same path and the paths below it. When the outermost batch is left, the
+    changes of every file are applied with a single open file handle. An exception raised inside a batch discards the
+    changes recorded since this batch was entered, changes recorded in enclosing batches are kept. The buffer is local
+    to the current thread, so other threads keep writing to the files directly.
+    """
+
+    def __init__(self) -> None:
+        self._depth = 0
+        self._files = {}
+        self._snapshots = []
+
+    @property
+    def active(self) -> bool:
+        """
+        Check if a batch is active in the current thread.
+
+        Returns:
+            bool: True if changes are buffered
+        """
+        return self._depth > 0
+
+    def enter(self) -> None:
+        """
+        Enter a batch, batches can be nested and the changes are only written when the outermost batch is left.
+        """
+        # recorded changes are immutable tuples, so copying the ordered dictionaries is sufficient for a rollback
+        self._snapshots.append(
+            {
+                file_name: OrderedDict(changes)
+                for file_name, changes in self._files.items()
+            }
+        )
+        self._depth += 1
+
+    def exit(self, commit: bool = True) -> None:
+        """
+        Leave a batch and write all buffered changes if it was the outermost batch.
+
+        Args:
+            commit (bool): write the changes, if False the changes recorded since the batch was entered are discarded
+        """
+        self._depth -= 1
+        snapshot = self._snapshots.pop()
+        if not commit:
+            self._files = snapshot
+        elif self._depth == 0:
+            files, self._files = self._files, {}
+            for file_name, changes in files.items():
+                self._write_changes(file_name=file_name, changes=changes)
+
+    def pending(self, file_name: str) -> bool:
+        """
+        Check if changes to a given HDF5 file are buffered.
+
+        Args:
+            file_name (str): absolute path of the HDF5 file
+
+        Returns:
+            bool: True if there are buffered changes
+        """
+        return len(self._files.get(file_name, {})) > 0
+
+    def write(
+        self,
+        file_name: str,
+        h5_path: str,
+        data: Any,
+        storage_policy: Optional[StoragePolicy] = None,
+        compression: int = 4,
+    ) -> None:
+        """
+        Record writing data to an HDF5 file. A copy of the data is stored until it is written, so modifying the data
+        afterwards does not change what is written.
+
+        Args:
+            file_name (str): absolute path of the HDF5 file
+            h5_path (str): path inside the HDF5 file
+            data (object): data to store
+            storage_policy (StoragePolicy, optional): chunking and compression policy
+            compression (int): gzip compression level h5io applies to strings and json data
+        """
+        self._record(
+            file_name=file_name,
+            h5_path=h5_path,
+            change=("write", _copy_buffered(data), storage_policy, compression),
+        )
+
+    def delete(self, file_name: str, h5_path: str) -> None:
+        """
+        Record deleting a node or a group from an HDF5 file.
+
+        Args:
+            file_name (str): absolute path of the HDF5 file
+            h5_path (str): path inside the HDF5 file
+        """
+        self._record(file_name=file_name, h5_path=h5_path, change=("delete",))
+
+    def create_group(
+        self, file_name: str, h5_path: str, track_order: bool = False
+    ) -> None:
+        """
+        Record creating a group in an HDF5 file.
+
+        Args:
+            file_name (str): absolute path of the HDF5 file
+            h5_path (str): path inside the HDF5 file
+            track_order (bool): track the elements of the group in insertion order
+        """
+        changes = self._files.setdefault(file_name, OrderedDict())
+        h5_path = _normalize_h5_path(h5_path)
+        if h5_path not in changes or changes[h5_path][0] == "delete":
+            changes.pop(h5_path, None)
+            changes[h5_path] = ("group", track_order)
+
+    def read(self, file_name: str, h5_path: str) -> Tuple[bool, Any]:
+        """
+        Read data from the buffer.
+
+        Args:
+            file_name (str): absolute path of the HDF5 file
+            h5_path (str): path inside the HDF5 file
+
+        Returns:
+            bool, object: True and the data if the data is buffered, False and None if it has to be read from the file
+
+        Raises:
+            ValueError: if the path or one of its parents was deleted or replaced in the buffer
+        """
+        changes = self._files.get(file_name)
+        if not changes:
+            return False, None
+        h5_path = _normalize_h5_path(h5_path)
+        change = changes.get(h5_path)
+        if change is not None and change[0] == "write":
+            return True, _copy_buffered(change[1])
+        for path, change in changes.items():
+            if change[0] != "group" and _is_relative_to(h5_path, path):
+                raise ValueError(
+                    "Unknown item: {} {}, it was removed in the current batch.".format(
+                        h5_path, file_name
+                    )
+                )
+        return False, None
+
+    def list_all(
+        self, file_name: str, h5_path: str, listing: Dict[str, List[str]]
+    ) -> Dict[str, List[str]]:
+        """
+        Update the groups and nodes listed from an HDF5 file with the buffered changes.
+
+        Args:
+            file_name (str): absolute path of the HDF5 file
+            h5_path (str): path inside the HDF5 file
+            listing (dict): groups and nodes listed from the HDF5 file
+
+        Returns:
+            Dict[str, List[str]]: Dictionary with keys "groups" and "nodes" containing sorted lists of groups and nodes
+        """
+        changes = self._files.get(file_name)
+        if not changes:
+            return listing
+        h5_path = _normalize_h5_path(h5_path)
+        groups, nodes = set(listing["groups"]), set(listing["nodes"])
+        for path, change in changes.items():
+            if _is_relative_to(h5_path, path):
+                if change[0] != "group":
+                    groups, nodes = set(), set()
+            elif _is_relative_to(path, h5_path):
+                name_lst = path[len(h5_path) :].strip("/").split("/")
+                if len(name_lst) > 1 or change[0] == "group":
+                    if change[0] != "delete" and name_lst[0] not in nodes:
+                        groups.add(name_lst[0])
+                elif change[0] == "delete":
+                    groups.discard(name_lst[0])
+                    nodes.discard(name_lst[0])
+                else:
+                    groups.discard(name_lst[0])
+                    nodes.add(name_lst[0])
+        return {"groups": sorted(groups), "nodes": sorted(nodes)}
+
+    def discard(self, file_name: str) -> None:
+        """
+        Discard the buffered changes of a given HDF5 file, they are not restored by a rollback.
+
+        Args:
+            file_name (str): absolute path of the HDF5 file
+        """
+        self._files.pop(file_name, None)
+        for snapshot in self._snapshots:
+            snapshot.pop(file_name, None)
+
+    def flush(self, file_name: str) -> None:
+        """
+        Write the buffered changes of a given HDF5 file with a single open file handle. Written changes are final, they
+        are not undone by a rollback.
+
+        Args:
+            file_name (str): absolute path of the HDF5 file
+        """
+        changes = self._files.pop(file_name, None)
+        for snapshot in self._snapshots:
+            snapshot.pop(file_name, None)
+        if changes:
+            self._write_changes(file_name=file_name, changes=changes)
+
+    @staticmethod
+    def _write_changes(file_name: str, changes: OrderedDict) -> None:
+        """
+        Apply recorded changes to an HDF5 file in the order they were recorded.
+
+        Args:
+            file_name (str): absolute path of the HDF5 file
+            changes (OrderedDict): changes recorded for the HDF5 file
+        """
+        with _open_hdf_pooled(
+            file_name, mode="a", changed_paths=list(changes.keys())
+        ) as hdf:
+            for h5_path, change in changes.items():
+                if change[0] == "write":
+                    _write_hdf_with_storage_policy(
+                        hdf_filehandle=hdf,
+                        h5_path=h5_path,
+                        data=change[1],
+                        storage_policy=change[2],
+                        compression=change[3],
+                    )
+                elif change[0] == "delete":
+                    if h5_path in hdf:
+                        del hdf[h5_path]
+                else:
+                    try:
+                        hdf.create_group(h5_path, track_order=change[1])
+                    except ValueError:
+                        pass
+
+    def _record(self, file_name: str, h5_path: str, change: tuple) -> None:
+        """
+        Record a change which replaces the given path, so all changes recorded below this path are dropped.
+
+        Args:
+            file_name (str): absolute path of the HDF5 file
+            h5_path (str): path inside the HDF5 file
+            change (tuple): the change to record
+        """
+        changes = self._files.setdefault(file_name, OrderedDict())
+        h5_path = _normalize_h5_path(h5_path)
+        for path in [p for p in changes.keys() if _is_relative_to(p, h5_path)]:
+            del changes[path]
+        changes[h5_path] = change
+
+
+_hdf_write_buffer = _HDFWriteBuffer()
+
+
+class _HDFTreeIndex:
+    """
+    Groups and nodes of an HDF5 file, read lazily group by group. Only the groups along an accessed path are listed and
+    a listing is kept until the group changes. Groups written by h5io - like dictionaries or pandas DataFrames - are
+    listed as nodes and are not descended into.
+
+    Writes from this module invalidate just the changed path: the listings below it are dropped and the entries of the
+    path in the listings of its parents are checked again on the next access.
+
+    The index also remembers which object last wrote or read a group via :meth:`claim`, as long as nothing inside the
+    group is changed, so objects can skip writing values that are still in the group.
+
+    Args:
+        file_name (str): absolute path of the HDF5 file
+    """
+
+    def __init__(self, file_name: str) -> None:
+        self._file_name = file_name
+        self._groups = {}
+        self._stale = {}
+        self._owners = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def exists(
+        self, h5_path: str, stack: Optional[contextlib.ExitStack] = None
+    ) -> Optional[bool]:
+        """
+        Check if a path exists in the HDF5 file.
+
+        Args:
+            h5_path (str): normalized path inside the HDF5 file
+            stack (contextlib.ExitStack, optional): keeps the HDF5 file open if it has to be read, a file already
+                opened is kept in its `hdf` attribute
+
+        Returns:
+            bool: True if the path is a group or a node, False if it does not exist and None if it is located inside a
+                  node, like an element of a dictionary stored by h5io, which is not part of the index
+        """
+        kind, _ = self._lookup(h5_path=h5_path, stack=stack)
+        if kind == "inside_node":
+            return None
+        return kind != "missing"
+
+    def is_plain_group(self, h5_path: str) -> bool:
+        """
+        Check if a path is a group without TITLE attribute, which h5io can not read as data. Objects stored by h5io
+        with their class name as TITLE are groups which can still be read as data.
+
+        Args:
+            h5_path (str): normalized path inside the HDF5 file
+
+        Returns:
+            bool: True if the path is a group without TITLE attribute
+        """
+        kind, title = self._lookup(h5_path=h5_path)
+        return kind == "group" and title == ""
+
+    def list_all(self, h5_path: str) -> Optional[Dict[str, List[str]]]:
+        """
+        List the groups and nodes of a given group.
+
+        Args:
+            h5_path (str): normalized path inside the HDF5 file
+
+        Returns:
+            Dict[str, List[str]]: Dictionary with keys "groups" and "nodes" containing sorted lists of groups and nodes,
+                                  None if the path is a node or located inside a node, which is not part of the index
+        """
+        with contextlib.ExitStack() as stack:
+            kind, _ = self._lookup(h5_path=h5_path, stack=stack)
+            if kind == "missing":
+                return {"groups": [], "nodes": []}
+            elif kind != "group":
+                return None
+            listing = self._get_listing(h5_path=h5_path, stack=stack)
+        return {"groups": sorted(listing["groups"]), "nodes": sorted(listing["nodes"])}
+
+    def invalidate(self, h5_path: str) -> None:
+        """
+        Invalidate the index for a path which was written, deleted or created.
+
+        Args:
+            h5_path (str): normalized path inside the HDF5 file
+        """
+        with self._lock:
+            self._generation += 1
+            for path in [p for p in self._groups.keys() if _is_relative_to(p, h5_path)]:
+                del self._groups[path]
+                self._stale.pop(path, None)
+            for path in [p for p in self._owners.keys() if _is_relative_to(p, h5_path)]:
+                del self._owners[path]
+            child = h5_path
+            while child != "/":
+                parent, name = posixpath.split(child)
+                self._owners.pop(parent, None)
+                # a group above the changed path stays a group, only the changed path itself has to be checked again
+                if parent in self._groups and (
+                    child == h5_path or name not in self._groups[parent]["groups"]
+                ):
+                    self._stale.setdefault(parent, set()).add(name)
+                child = parent
+
+    def claim(self, h5_path: str) -> int:
+        """
+        Remember that a group was just written or read completely.
+
+        Args:
+            h5_path (str): normalized path of the group inside the HDF5 file
+
+        Returns:
+            int: token, which stays valid until something inside the group is changed
+        """
+        with self._lock:
+            token = self._owners[h5_path] = next(_hdf_owner_tokens)
+        return token
+
+    def is_owner(self, h5_path: str, token: int) -> bool:
+        """
+        Check if a group is unchanged since it was claimed.
+
+        Args:
+            h5_path (str): normalized path of the group inside the HDF5 file
+            token (int): token returned by :meth:`claim`
+
+        Returns:
+            bool: True if the token is still valid
+        """
+        return self._owners.get(h5_path, None) == token
+
+    def peek(self, h5_path: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Find a path in the listings read already, without reading the HDF5 file.
+
+        Args:
+            h5_path (str): normalized path inside the HDF5 file
+
+        Returns:
+            str, str: kind of the path as returned by :meth:`_lookup`, None if the listing of one of its parent groups
+                      was not read yet or is outdated, and the TITLE of a group
+        """
+        if h5_path == "/":
+            return "group", None
+        path, title = "/", None
+        name_lst = h5_path.strip("/").split("/")
+        with self._lock:
+            for i, name in enumerate(name_lst):
+                listing = self._groups.get(path)
+                if listing is None or name in self._stale.get(path, ()):
+                    return None, None
+                if name in listing["groups"]:
+                    path, title = posixpath.join(path, name), listing["groups"][name]
+                elif name in listing["nodes"]:
+                    return ("node" if i == len(name_lst) - 1 else "inside_node"), None
+                else:
+                    return "missing", None
+        return "group", title
+
+    def _lookup(
+        self, h5_path: str, stack: Optional[contextlib.ExitStack] = None
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Find a path by walking the listings of its parent groups.
+
+        Args:
+            h5_path (str): normalized path inside the HDF5 file
+            stack (contextlib.ExitStack, optional): keeps the HDF5 file open if it has to be read
+
+        Returns:
+            str, str: kind of the path - "group", "node", "missing" or "inside_node" - and the TITLE of a group
+        """
+        if stack is None:
+            with contextlib.ExitStack() as stack:
+                return self._lookup(h5_path=h5_path, stack=stack)
+        if h5_path == "/":
+            return "group", None
+        path, title = "/", None
+        name_lst = h5_path.strip("/").split("/")
+        for i, name in enumerate(name_lst):
+            listing = self._get_listing(h5_path=path, stack=stack)
+            if name in listing["groups"]:
+                path, title = posixpath.join(path, name), listing["groups"][name]
+            elif name in listing["nodes"]:
+                return ("node" if i == len(name_lst) - 1 else "inside_node"), None
+            else:
+                return "missing", None
+        return "group", title
+
+    def _get_listing(self, h5_path: str, stack: contextlib.ExitStack) -> dict:
+        """
+        Get the listing of a group, the group is read from the HDF5 file if it is not listed yet or if some of its
+        entries were invalidated.
+
+        Args:
+            h5_path (str): normalized path of the group
+            stack (contextlib.ExitStack): keeps the HDF5 file open, it is opened on the first read
+
+        Returns:
+            dict: Dictionary with keys "groups", mapping the names of the sub groups to their TITLE, and "nodes",
+                  containing the names of the nodes
+        """
+        with self._lock:
+            generation = self._generation
+            listing = self._groups.get(h5_path)
+            stale = set(self._stale.get(h5_path, ()))
+        if listing is not None and len(stale) == 0:
+            return listing
+        if not hasattr(stack, "hdf"):
+            stack.hdf = stack.enter_context(
+                _open_hdf_pooled(self._file_name, flush=False)
+            )
+        group = stack.hdf.get(h5_path)
+        if listing is None:
+            listing = {"groups": {}, "nodes": set()}
+            names = group.keys() if isinstance(group, h5py.Group) else []
+        else:
+            listing = {
+                "groups": dict(listing["groups"]),
+                "nodes": set(listing["nodes"]),
+            }
+            names = [n for n in stale if isinstance(group, h5py.Group) and n in group]
+            for name in stale:
+                listing["groups"].pop(name, None)
+                listing["nodes"].discard(name)
+        for name in names:
+            # datasets are not opened, which dominates the listing of groups with many small datasets
+            if group.get(name, getclass=True) is not h5py.Group:
+                listing["nodes"].add(name)
+                continue
+            title = str(group[name].attrs.get("TITLE", ""))
+            if title in _H5IO_GROUP_TYPES:
+                listing["nodes"].add(name)
+            else:
+                listing["groups"][name] = title
+        with self._lock:
+            if generation == self._generation and isinstance(group, h5py.Group):
+                self._groups[h5_path] = listing
+                self._stale.pop(h5_path, None)
+        return listing
+
+
+_hdf_owner_tokens = itertools.count()
+
+
+class _HDFTreeIndexCache:
+    """
+    Least recently used cache of the tree indices of HDF5 files.
+
+    An index is reused as long as the modification time, size and inode of the file are unchanged, otherwise the file
+    was changed elsewhere and a new, empty index is started. Writes issued from this module are bracketed: before the
+    write :meth:`check` drops the index if the file was changed elsewhere, after the write :meth:`invalidate` removes
+    only the changed path from the index and records the new modification time. The cache never reads the file itself,
+    so it does not hold its lock while waiting for a file handle.
+
+    Args:
+        max_size (int): maximum number of cached indices
+    """
+
+    def __init__(self, max_size: int = 128) -> None:
+        self.max_size = max_size
+        self._indices = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, file_name: str) -> Optional[_HDFTreeIndex]:
+        """
+        Get the tree index of an HDF5 file, a new index is started if the file changed since it was cached.
+
+        Args:
+            file_name (str): absolute path of the HDF5 file
+
+        Returns:
+            _HDFTreeIndex: tree index, None if the file does not exist
+        """
+        stamp = _get_file_stamp(file_name=file_name)
+        with self._lock:
+            if stamp is None:
+                self._indices.pop(file_name, None)
+                return None
+            entry = self._indices.pop(file_name, None)
+            if entry is None or entry[0] != stamp:
+                entry = [stamp, _HDFTreeIndex(file_name=file_name)]
+            self._indices[file_name] = entry
+            while len(self._indices) > self.max_size:
+                self._indices.popitem(last=False)
+            return entry[1]
+
+    def check(self, file_name: str) -> None:
+        """
+        Remove the tree index of an HDF5 file if the file changed since the index was cached, called before writing.
+
+        Args:
+            file_name (str): absolute path of the HDF5 file
+        """
+        stamp = _get_file_stamp(file_name=file_name)
+        with self._lock:
+            entry = self._indices.get(file_name)
+            if entry is not None and entry[0] != stamp:
+                del self._indices[file_name]
+
+    def invalidate(self, file_name: str, h5_path: Optional[str] = None) -> None:
+        """
+        Invalidate the tree index of an HDF5 file after it was changed from this module.
+
+        Args:
+            file_name (str): absolute path of the HDF5 file
+            h5_path (str, optional): changed path inside the HDF5 file, by default the whole index is removed
+        """
+        stamp = _get_file_stamp(file_name=file_name) if h5_path is not None else None
+        with self._lock:
+            entry = self._indices.get(file_name)
+            if entry is None:
+                return
+            elif stamp is None:
+                del self._indices[file_name]
+                return
+            # the write changes the modification time, which must not discard the rest of the index
+            entry[0] = stamp
+        entry[1].invalidate(h5_path=_normalize_h5_path(h5_path))
+
+
+def _claim_hdf_group(file_name: str, h5_path: str) -> Optional[int]:
+    """
+    Remember that a group of an HDF5 file was just written or read completely, see :meth:`_HDFTreeIndex.claim`.
+
+    Args:
+        file_name (str): absolute path of the HDF5 file
+        h5_path (str): path of the group inside the HDF5 file
+
+    Returns:
+        int: token, None if the file does not exist or changes to it are buffered in a batch, which may still be
+             discarded
+    """
+    if _hdf_write_buffer.pending(file_name=file_name):
+        return None
+    index = _hdf_tree_index_cache.get(file_name=file_name)
+    if index is None:
+        return None
+    return index.claim(h5_path=_normalize_h5_path(h5_path))
+
+
+def _is_hdf_group_owner(file_name: str, h5_path: str, token: Optional[int]) -> bool:
+    """
+    Check if a group of an HDF5 file is unchanged since it was claimed with :func:`_claim_hdf_group`.
+
+    Changes made elsewhere are only noticed by the modification time of the file, and the claim is lost when the index
+    of the file is dropped from the cache, so this may return False for unchanged groups but never True for changed
+    ones.
+
+    Args:
+        file_name (str): absolute path of the HDF5 file
+        h5_path (str): path of the group inside the HDF5 file
+        token (int): token returned by :func:`_claim_hdf_group`
+
+    Returns:
+        bool: True if the group is unchanged
+    """
+    if token is None:
+        return False
+    index = _hdf_tree_index_cache.get(file_name=file_name)
+    return index is not None and index.is_owner(
+        h5_path=_normalize_h5_path(h5_path), token=token
+    )
+
+
+def _get_file_stamp(file_name: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Get the modification time, size and inode of a file.
+
+    Args:
+        file_name (str): absolute path of the file
+
+    Returns:
+        tuple: modification time in nanoseconds, size and inode, None if the file does not exist
+    """
+    try:
+        stat_result = os.stat(file_name)
+    except FileNotFoundError:
+        return None
+    return stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino
+
+
+_hdf_tree_index_cache = _HDFTreeIndexCache()
+
+
+@contextlib.contextmanager
+def _open_hdf_pooled(
+    file_name: str,
+    mode: str = "r",
+    flush: bool = True,
+    changed_paths: Optional[List[str]] = None,
+) -> Iterator[h5py.File]:
+    """
+    Open an HDF5 file, while a session is active the handle is taken from the pool and kept open after the with
+    statement.
+
+    Args:
+        file_name (str): absolute path of the HDF5 file
+        mode (str): mode to open the HDF5 file
+        flush (bool): write the changes buffered in an active batch before opening the file
+        changed_paths (list, optional): paths inside the HDF5 file which are changed when the file is opened for
+            writing, only these paths are invalidated in the tree index, by default the whole index of the file
+
+    Yields:
+        h5py.File: open HDF5 file handle
+    """
+    if flush and _hdf_write_buffer.pending(file_name=file_name):
+        # code working on the file directly has to see the changes of the current batch
+        _hdf_write_buffer.flush(file_name=file_name)
+    if mode != "r":
+        _hdf_tree_index_cache.check(file_name=file_name)
+    try:
+        if _hdf_file_pool.active:
+            yield _hdf_file_pool.get(file_name=file_name, mode=mode)
+        elif mode == "r" and _hdf_file_pool.has_swmr_writer(file_name=file_name):
+            yield _hdf_file_pool.get_swmr_writer(file_name=file_name)
+        else:
+            # objects can not be created or removed in SWMR mode
+            _hdf_file_pool.release_swmr_writer(file_name=file_name)
+            with _open_hdf_swmr_fallback(file_name, mode=mode) as hdf:
+                yield hdf
+    finally:
+        if mode != "r":
+            if changed_paths is None:
+                _hdf_tree_index_cache.invalidate(file_name=file_name)
+            for h5_path in changed_paths or []:
+                _hdf_tree_index_cache.invalidate(file_name=file_name, h5_path=h5_path)
+
+
+def _read_hdf_pooled(
+    file_name: str, h5_path: str, stack: Optional[contextlib.ExitStack] = None
+) -> Any:
+    """
+    Read data from an HDF5 file, using the pooled handle while a session is active. While a batch is active, data
+    written in the batch is returned from the buffer.
+
+    Args:
+        file_name (str): absolute path of the HDF5 file
+        h5_path (str): path inside the HDF5 file
+        stack (contextlib.ExitStack, optional): keeps the HDF5 file open after reading, if no session is active, the
+            handle is kept in its `hdf` attribute, so the file can be inspected further if the read fails
+
+    Returns:
+        object: the loaded data
+    """
+    if _hdf_write_buffer.active:
+        buffered, data = _hdf_write_buffer.read(file_name=file_name, h5_path=h5_path)
+        if buffered:
+            return data
+    if not _hdf_file_pool.active and not _hdf_file_pool.has_swmr_writer(
+        file_name=file_name
+    ):
+        if stack is not None:
+            stack.hdf = stack.enter_context(
+                _open_hdf_swmr_fallback(file_name, mode="r")
+            )
+            return _read_hdf(hdf_filehandle=stack.hdf, h5_path=h5_path)
+        try:
+            return _read_hdf(hdf_filehandle=file_name, h5_path=h5_path)
+        except OSError:
+            if not os.path.exists(file_name):
+                raise
+            # another process writes the file in SWMR mode
+            with _open_hdf(file_name, mode="r", swmr=True) as hdf:
+                return _read_hdf(hdf_filehandle=hdf, h5_path=h5_path)
+    hdf = _hdf_file_pool.get(file_name=file_name, mode="r")
+    if hdf.mode != "r" and _contains_pandas(node=hdf.get(h5_path)):
+        # pandas reads via PyTables, which cannot open a file that is held open for writing
+        _hdf_file_pool.release(file_name=file_name)
+        return _read_hdf(hdf_filehandle=file_name, h5_path=h5_path)
+    if hdf.mode == "r" and hdf.swmr_mode:
+        _refresh_swmr_node(node=hdf.get(h5_path))
+    return _read_hdf(hdf_filehandle=hdf, h5_path=h5_path)
+
+
+def _read_hdf_memmap(file_name: str, h5_path: str) -> Optional[np.memmap]:
+    """
+    Map an array stored contiguous and uncompressed in an HDF5 file into memory, rather than reading it.
+
+    Args:
+        file_name (str): absolute path of the HDF5 file
+        h5_path (str): path inside the HDF5 file
+
+    Returns:
+        np.memmap: read-only view of the array, None if the array can not be mapped
     """
-    fully_qualified_path = _extract_fully_qualified_name(type_field)
-    return fully_qualified_path.rsplit(".", maxsplit=1)
+    if not os.path.exists(file_name):
+        return None
+    with _open_hdf_pooled(file_name) as hdf:
+        dataset = hdf.get(h5_path)
+        if (
+            not isinstance(dataset, h5py.Dataset)
+            or dataset.attrs.get("TITLE") != "ndarray"
+            or dataset.chunks is not None
+            or dataset.compression is not None
+            or dataset.external is not None
+            or dataset.dtype.hasobject
+            or dataset.size == 0
+        ):
+            return None
+        offset = dataset.id.get_offset()
+        if offset is None:
+            return None
+        if hdf.mode != "r":
+            # data written through a pooled handle might not be on disk yet
+            hdf.flush()
+        return np.memmap(
+            file_name,
+            mode="r",
+            dtype=dataset.dtype,
+            shape=dataset.shape,
+            offset=offset,
+        )
 
 
-def _list_groups_and_nodes(hdf: h5py.File, h5_path: str) -> Tuple[List[str], List[str]]:
+def _write_hdf_pooled(
+    file_name: str,
+    h5_path: str,
+    data: Any,
+    storage_policy: Optional[StoragePolicy] = None,
+) -> None:
     """
-    Get the list of groups and list of nodes from an open HDF5 file
+    Write data to an HDF5 file, using the pooled handle while a session is active. While a batch is active, the data is
+    buffered instead.
 
     Args:
-        hdf (h5py.File): file handle of an open HDF5 file
+        file_name (str): absolute path of the HDF5 file
         h5_path (str): path inside the HDF5 file
-
-    Returns:
-        Tuple[List[str], List[str]]: list of groups and list of nodes
+        data (object): data to store
+        storage_policy (StoragePolicy, optional): chunking and compression policy, defaults to the configured policy
     """
-    groups = set()
-    nodes = set()
-    try:
-        h = hdf[h5_path]
-        for k in h.keys():
-            if isinstance(h[k], h5py.Group):
-                groups.add(k)
+    if _hdf_write_buffer.active:
+        _hdf_write_buffer.write(
+            file_name=file_name,
+            h5_path=h5_path,
+            data=data,
+            storage_policy=storage_policy,
+        )
+    else:
+        _hdf_tree_index_cache.check(file_name=file_name)
+        try:
+            if _hdf_file_pool.active:
+                hdf_filehandle = _hdf_file_pool.get(file_name=file_name, mode="a")
             else:
-                nodes.add(k)
-    except KeyError:
-        pass
-    return list(groups), list(nodes)
+                # objects can not be created or removed in SWMR mode
+                _hdf_file_pool.release_swmr_writer(file_name=file_name)
+                hdf_filehandle = file_name
+            _write_hdf_with_storage_policy(
+                hdf_filehandle=hdf_filehandle,
+                h5_path=h5_path,
+                data=data,
+                storage_policy=storage_policy,
+            )
+        finally:
+            _hdf_tree_index_cache.invalidate(file_name=file_name, h5_path=h5_path)
 
 
 def _import_class(module_path: str, class_name: str) -> type:
@@ -273,62 +1961,124 @@ class FileHDFio(HasGroups, Pointer):
                 return self.values()
             raise NotImplementedError("Implement if needed, e.g. for [:]")
         else:
-            try:
-                # fast path, a good amount of accesses will want to fetch a specific dataset it knows exists in the
-                # file, there's therefor no point in checking whether item is a group or a node or even worse recursing
-                # in case when item contains '/'.  In most cases read_hdf5 will grab the correct data straight away and
-                # if not we will still check thoroughly below.  Since list_nodes()/list_groups() each open the
-                # underlying file once, this reduces the number of file opens in the most-likely case from 2 to 1 (1 to
-                # check whether the data is there and 1 to read it) and increases in the worst case from 1 to 2 (1 to
-                # try to read it here and one more time to verify it's not a group below).
-                return _read_hdf(
-                    hdf_filehandle=self.file_name, h5_path=self._get_h5_path(item)
-                )
-            except (ValueError, OSError, RuntimeError, NotImplementedError):
-                # h5io couldn't find a dataset with name item, but there still might be a group with that name, which we
-                # check in the rest of the method
-                pass
+            h5_path = _normalize_h5_path(self._get_h5_path(item))
+            index, kind, title = None, None, None
+            if not _hdf_write_buffer.active and ".." not in item.split("/"):
+                # answer existence checks from the tree index of the file, as long as it has read the parent groups
+                index = _hdf_tree_index_cache.get(file_name=self.file_name)
+                if index is not None:
+                    kind, title = index.peek(h5_path=h5_path)
+                if index is None or kind == "missing":
+                    raise ValueError(
+                        "Unknown item: {} {} {}".format(
+                            item, self.file_name, self.h5_path
+                        )
+                    )
+            with contextlib.ExitStack() as stack:
+                if not (kind == "group" and title == ""):
+                    data, found = self._read_or_list(
+                        item=item, h5_path=h5_path, index=index, stack=stack
+                    )
+                    if found:
+                        return data
+            return self._get_group_or_path(item=item)
 
-            item_lst = item.split("/")
-            if len(item_lst) == 1 and item_lst[0] != "..":
-                # if item in self.list_nodes() we would have caught it in the fast path above
-                if item in self.list_groups():
-                    with self.open(item) as hdf_item:
-                        obj = hdf_item.copy()
-                        if self._is_convertable_dtype_object_array(obj):
-                            obj = self._convert_dtype_obj_array(obj)
-                        return obj
-                raise ValueError(
-                    "Unknown item: {} {} {}".format(item, self.file_name, self.h5_path)
+    def _read_or_list(
+        self,
+        item: str,
+        h5_path: str,
+        index: Optional["_HDFTreeIndex"],
+        stack: contextlib.ExitStack,
+    ) -> Tuple[Any, bool]:
+        """
+        Read a node, if it cannot be read, the listings of its parent groups are read from the same file handle.
+
+        Args:
+            item (str): path to the data relative to this group
+            h5_path (str): normalized absolute path to the data
+            index (_HDFTreeIndex, optional): tree index of the file, None if it must not be used
+            stack (contextlib.ExitStack): keeps the HDF5 file open
+
+        Returns:
+            object, bool: the data and True if it was read, None and False otherwise
+
+        Raises:
+            ValueError: if the path does not exist
+        """
+        try:
+            # fast path, a good amount of accesses will want to fetch a specific dataset it knows exists in the file,
+            # there's therefor no point in checking whether item is a group or a node or even worse recursing in case
+            # when item contains '/'.  In most cases read_hdf5 will grab the correct data straight away and if not the
+            # listings of the parent groups are read from the same file handle, so the file is opened only once in
+            # either case.
+            return (
+                _read_hdf_pooled(
+                    file_name=self.file_name,
+                    h5_path=self._get_h5_path(item),
+                    stack=stack if index is not None else None,
+                ),
+                True,
+            )
+        except (ValueError, OSError, RuntimeError, NotImplementedError):
+            # h5io couldn't find a dataset with name item, but there still might be a group with that name, which we
+            # check in the rest of the method
+            pass
+        if index is not None and index.exists(h5_path=h5_path, stack=stack) is False:
+            raise ValueError(
+                "Unknown item: {} {} {}".format(item, self.file_name, self.h5_path)
+            )
+        return None, False
+
+    def _get_group_or_path(self, item: str) -> Any:
+        """
+        Get a group or resolve a path relative to this group, after reading the item as data failed.
+
+        Args:
+            item (str): path to the data or group
+
+        Returns:
+            object: group, data object or project
+        """
+        item_lst = item.split("/")
+        if len(item_lst) == 1 and item_lst[0] != "..":
+            # if item in self.list_nodes() we would have caught it in the fast path above
+            if item in self.list_groups():
+                with self.open(item) as hdf_item:
+                    obj = hdf_item.copy()
+                    if self._is_convertable_dtype_object_array(obj):
+                        obj = self._convert_dtype_obj_array(obj)
+                    return obj
+            raise ValueError(
+                "Unknown item: {} {} {}".format(item, self.file_name, self.h5_path)
+            )
+        else:
+            if (
+                item_lst[0] == ""
+            ):  # item starting with '/', thus we have an absoute HDF5 path
+                item_abs_lst = os.path.normpath(item).replace("\\", "/").split("/")
+            else:  # relative HDF5 path
+                # The self.h5_path is an absolute path (/h5_path/in/h5/file), however, to
+                # reach any directory super to root, we start with a
+                # relative path = ./h5_path/in/h5/file and add whatever we get as item.
+                # The normpath finally returns a path to the item which is relative to the hdf-root.
+                item_abs_lst = (
+                    os.path.normpath(os.path.join("." + self.h5_path, item))
+                    .replace("\\", "/")
+                    .split("/")
                 )
+            # print('h5_path=', self.h5_path, 'item=', item, 'item_abs_lst=', item_abs_lst)
+            if item_abs_lst[0] == "." and len(item_abs_lst) == 1:
+                # Here, we are asked to return the root of the HDF5-file. The resulting self.path would be the
+                # same as the self.file_path and, thus, the path of the pyiron Project this HDF5-file belongs to:
+                return self.create_project_from_hdf5()
+            elif item_abs_lst[0] == "..":
+                # Here, we are asked to return a path super to the root of the HDF5-file, a.k.a. the path of it's
+                # pyiron Project, thus we pass the relative path to the pyiron Project to handle it:
+                return self.create_project_from_hdf5()["/".join(item_abs_lst)]
             else:
-                if (
-                    item_lst[0] == ""
-                ):  # item starting with '/', thus we have an absoute HDF5 path
-                    item_abs_lst = os.path.normpath(item).replace("\\", "/").split("/")
-                else:  # relative HDF5 path
-                    # The self.h5_path is an absolute path (/h5_path/in/h5/file), however, to
-                    # reach any directory super to root, we start with a
-                    # relative path = ./h5_path/in/h5/file and add whatever we get as item.
-                    # The normpath finally returns a path to the item which is relative to the hdf-root.
-                    item_abs_lst = (
-                        os.path.normpath(os.path.join("." + self.h5_path, item))
-                        .replace("\\", "/")
-                        .split("/")
-                    )
-                # print('h5_path=', self.h5_path, 'item=', item, 'item_abs_lst=', item_abs_lst)
-                if item_abs_lst[0] == "." and len(item_abs_lst) == 1:
-                    # Here, we are asked to return the root of the HDF5-file. The resulting self.path would be the
-                    # same as the self.file_path and, thus, the path of the pyiron Project this HDF5-file belongs to:
-                    return self.create_project_from_hdf5()
-                elif item_abs_lst[0] == "..":
-                    # Here, we are asked to return a path super to the root of the HDF5-file, a.k.a. the path of it's
-                    # pyiron Project, thus we pass the relative path to the pyiron Project to handle it:
-                    return self.create_project_from_hdf5()["/".join(item_abs_lst)]
-                else:
-                    hdf_object = self.copy()
-                    hdf_object.h5_path = "/".join(item_abs_lst[:-1])
-                    return hdf_object[item_abs_lst[-1]]
+                hdf_object = self.copy()
+                hdf_object.h5_path = "/".join(item_abs_lst[:-1])
+                return hdf_object[item_abs_lst[-1]]
 
     # TODO: remove this function upon 1.0.0 release
     @staticmethod
@@ -398,12 +2148,35 @@ class FileHDFio(HasGroups, Pointer):
         ):
             value.to_hdf(self, key)
             return
-        _write_hdf5_with_json_support(
-            hdf_filehandle=self.file_name,
+        _write_hdf_pooled(
+            file_name=self.file_name,
             h5_path=self._get_h5_path(key),
             data=value,
+            storage_policy=self.storage_policy,
         )
 
+    def __delitem__(self, key: str) -> None:
+        """
+        Delete an item from the HDF5 file.
+
+        Args:
+            key (str): The key of the item to delete.
+        """
+        if _hdf_write_buffer.active:
+            _hdf_write_buffer.delete(
+                file_name=self.file_name, h5_path=self._get_h5_path(key)
+            )
+        elif self.file_exists:
+            try:
+                with _open_hdf_pooled(
+                    self.file_name,
+                    mode="a",
+                    changed_paths=[self._get_h5_path(key)],
+                ) as hdf:
+                    del hdf[self._get_h5_path(key)]
+            except (AttributeError, KeyError):
+                pass
+
     @property
     def base_name(self) -> str:
         """
@@ -414,6 +2187,16 @@ class FileHDFio(HasGroups, Pointer):
         """
         return ".".join(posixpath.basename(self.file_name).split(".")[:-1])
 
+    @property
+    def storage_policy(self) -> StoragePolicy:
+        """
+        Get the chunking and compression policy for arrays written to the HDF5 file, as defined in the configuration.
+
+        Returns:
+            StoragePolicy: storage policy
+        """
+        return StoragePolicy.from_settings()
+
     @property
     def file_path(self) -> str:
         """
@@ -464,11 +2247,18 @@ class FileHDFio(HasGroups, Pointer):
             FileHDFio: FileHDFio object pointing to the new group
         """
         full_name = self._get_h5_path(name)
-        with _open_hdf(self.file_name, mode="a") as h:
-            try:
-                h.create_group(full_name, track_order=track_order)
-            except ValueError:
-                pass
+        if _hdf_write_buffer.active:
+            _hdf_write_buffer.create_group(
+                file_name=self.file_name, h5_path=full_name, track_order=track_order
+            )
+        else:
+            with _open_hdf_pooled(
+                self.file_name, mode="a", changed_paths=[full_name]
+            ) as h:
+                try:
+                    h.create_group(full_name, track_order=track_order)
+                except ValueError:
+                    pass
         h_new = self[name].copy()
         return h_new
 
@@ -476,8 +2266,13 @@ class FileHDFio(HasGroups, Pointer):
         """
         Remove an HDF5 group if it exists. If the group does not exist, no error message is raised.
         """
+        if _hdf_write_buffer.active:
+            _hdf_write_buffer.delete(file_name=self.file_name, h5_path=self.h5_path)
+            return
         try:
-            with _open_hdf(self.file_name, mode="a") as hdf_file:
+            with _open_hdf_pooled(
+                self.file_name, mode="a", changed_paths=[self.h5_path]
+            ) as hdf_file:
                 del hdf_file[self.h5_path]
         except KeyError:
             pass
@@ -530,7 +2325,9 @@ class FileHDFio(HasGroups, Pointer):
         """
         Remove the HDF5 file with all the related content.
         """
+        _hdf_write_buffer.discard(file_name=self.file_name)
         if self.file_exists:
+            _hdf_file_pool.release(file_name=self.file_name)
             os.remove(self.file_name)
 
     def get_from_table(self, path: str, name: str) -> Union[Dict, List, float, int]:
@@ -566,8 +2363,48 @@ class FileHDFio(HasGroups, Pointer):
             df = pandas.DataFrame(val)
             return df
 
+    def read_many(self, paths: List[str]) -> Dict[str, Any]:
+        """
+        Read multiple items from the HDF5 file, opening the file only once for all of them.
+
+        Each path is resolved the same way as in :meth:`__getitem__`, so HDF5 groups are returned as FileHDFio objects
+        and h5io data types stored as HDF5 groups - like dictionaries or pandas DataFrames - are returned as data.
+
+        Args:
+            paths (List[str]): paths to the data relative to the current h5_path
+
+        Returns:
+            Dict[str, Any]: dictionary mapping the paths to the data
+
+        Raises:
+            ValueError: if one of the paths does not exist in the HDF5 file
+        """
+        with self.session():
+            return {path: self[path] for path in paths}
+
+    def dataset(self, path: str) -> "HDFDataset":
+        """
+        Get a lazy proxy of an array, which exposes its shape and dtype and reads only the selected part of the array
+        when sliced.
+
+        >>> hdf.dataset("output/generic/positions")[-1]
+
+        Args:
+            path (str): path of the array relative to the current group
+
+        Returns:
+            HDFDataset: lazy proxy of the array
+
+        Raises:
+            ValueError: if there is no array at the given path
+        """
+        return HDFDataset(
+            file_name=self.file_name,
+            h5_path=posixpath.normpath(self._get_h5_path(path)),
+        )
+
     def get(
-        self, key: str, default: Optional[object] = None
+        self, key: str, default: Optional[object] = None, mmap: bool = False
     ) -> Union[Dict, List, float, int]:
         """
         Get data from the HDF5 file.
@@ -575,10 +2412,20 @@ class FileHDFio(HasGroups, Pointer):
         Args:
             key (str): Path to the data or key of the data object
             default (object): Default value to return if key doesn't exist
+            mmap (bool): Return arrays stored contiguous and uncompressed as read-only :class:`numpy.memmap`, which
+                         reads the data from the page cache on access instead of copying it into memory. Other data is
+                         read as usual.
 
         Returns:
             Union[Dict, List, float, int]: Data or data object
         """
+        if mmap and isinstance(key, str):
+            array = _read_hdf_memmap(
+                file_name=self.file_name,
+                h5_path=posixpath.normpath(self._get_h5_path(key)),
+            )
+            if array is not None:
+                return array
         try:
             return self.__getitem__(key)
         except ValueError:
@@ -608,16 +2455,21 @@ class FileHDFio(HasGroups, Pointer):
         Returns:
             Dict[str, List[str]]: Dictionary with keys "groups" and "nodes" containing lists of groups and nodes
         """
-        if self.file_exists:
-            with _open_hdf(self.file_name) as hdf:
-                groups, nodes = _list_groups_and_nodes(hdf=hdf, h5_path=self.h5_path)
-            iopy_nodes = self._filter_io_objects(set(groups))
-            return {
-                "groups": sorted(list(set(groups) - iopy_nodes)),
-                "nodes": sorted(list((set(nodes) - set(groups)).union(iopy_nodes))),
-            }
-        else:
-            return {"groups": [], "nodes": []}
+        index = _hdf_tree_index_cache.get(file_name=self.file_name)
+        listing = (
+            index.list_all(h5_path=_normalize_h5_path(self.h5_path))
+            if index is not None
+            else {"groups": [], "nodes": []}
+        )
+        if listing is None:
+            # the path is located inside a node, which is not part of the index
+            with _open_hdf_pooled(self.file_name, flush=False) as hdf:
+                listing = _list_all_from_open_hdf(hdf=hdf, h5_path=self.h5_path)
+        if _hdf_write_buffer.active:
+            listing = _hdf_write_buffer.list_all(
+                file_name=self.file_name, h5_path=self.h5_path, listing=listing
+            )
+        return listing
 
     def _list_nodes(self) -> List[str]:
         """
@@ -713,7 +2565,7 @@ class FileHDFio(HasGroups, Pointer):
         exclude_nodes: Optional[List[str]] = None,
     ) -> None:
         """
-        Copy data from one HDF5 file to another.
+        Copy data from one HDF5 file to another. The HDF5 objects are copied natively, without deserializing them.
 
         Args:
             hdf_old (FileHDFio): Source HDF5 file
@@ -721,33 +2573,23 @@ class FileHDFio(HasGroups, Pointer):
             exclude_groups (List[str]): List of groups to exclude from the copy
             exclude_nodes (List[str]): List of nodes to exclude from the copy
         """
-        if exclude_groups is None or len(exclude_groups) == 0:
-            exclude_groups_split = list()
-            group_list = hdf_old.list_groups()
-        else:
-            exclude_groups_split = [i.split("/", 1) for i in exclude_groups]
-            check_groups = [i[-1] for i in exclude_groups_split]
-            group_list = list(
-                (set(hdf_old.list_groups()) ^ set(check_groups))
-                & set(hdf_old.list_groups())
-            )
-
-        if exclude_nodes is None or len(exclude_nodes) == 0:
-            exclude_nodes_split = list()
-            node_list = hdf_old.list_nodes()
-        else:
-            exclude_nodes_split = [i.split("/", 1) for i in exclude_nodes]
-            check_nodes = [i[-1] for i in exclude_nodes_split]
-            node_list = list(
-                (set(hdf_old.list_nodes()) ^ set(check_nodes))
-                & set(hdf_old.list_nodes())
-            )
-        hdf_new.write_dict(data_dict={p: hdf_old[p] for p in node_list})
-        for p in group_list:
-            h_new = hdf_new.create_group(p)
-            ex_n = [e[-1] for e in exclude_nodes_split if p == e[0] or len(e) == 1]
-            ex_g = [e[-1] for e in exclude_groups_split if p == e[0] or len(e) == 1]
-            self.hd_copy(hdf_old[p], h_new, exclude_nodes=ex_n, exclude_groups=ex_g)
+        # copy the HDF5 objects natively rather than reading them into python and writing them again
+        _hdf_write_buffer.flush(file_name=hdf_old.file_name)
+        with _open_hdf_pooled(file_name=hdf_new.file_name, mode="a") as target:
+            if hdf_old.file_name == hdf_new.file_name:
+                source = contextlib.nullcontext(target)
+            elif os.path.exists(hdf_old.file_name):
+                source = _open_hdf_pooled(file_name=hdf_old.file_name)
+            else:
+                return hdf_new
+            with source as hdf:
+                if hdf_old.h5_path in hdf:
+                    _copy_hdf_group(
+                        source=hdf[hdf_old.h5_path],
+                        target=target.require_group(hdf_new.h5_path),
+                        exclude_groups=exclude_groups or [],
+                        exclude_nodes=exclude_nodes or [],
+                    )
         return hdf_new
 
     @deprecate(job_name="ignored!", exclude_groups="ignored!", exclude_nodes="ignored!")
@@ -794,6 +2636,7 @@ class FileHDFio(HasGroups, Pointer):
                 )
             )
         self.remove_file()
+        _hdf_file_pool.release(file_name=hdf_new.file_name)
         os.rename(hdf_new.file_name, file_name)
 
     def __str__(self) -> str:
@@ -839,7 +2682,131 @@ class FileHDFio(HasGroups, Pointer):
         Returns:
             dict, list, float, int: data or data object
         """
-        return _read_hdf(hdf_filehandle=self.file_name, h5_path=self._get_h5_path(item))
+        return _read_hdf_pooled(
+            file_name=self.file_name, h5_path=self._get_h5_path(item)
+        )
+
+    def write_dict(self, data_dict: Dict[str, Any], compression: int = 4) -> None:
+        """
+        Write a dictionary to the HDF5 file, opening the file only once for all items.
+
+        Args:
+            data_dict (Dict[str, Any]): Dictionary of data objects to be stored in the HDF5 file, the keys provide the
+                                        path inside the HDF5 file relative to the h5_path and the values the data to be
+                                        stored in those nodes.
+            compression (int, optional): The compression level to use (0-9) to compress data using gzip. Defaults to 4.
+        """
+        storage_policy = self.storage_policy
+        if _hdf_write_buffer.active:
+            for k, v in data_dict.items():
+                _hdf_write_buffer.write(
+                    file_name=self.file_name,
+                    h5_path=self._get_h5_path(k),
+                    data=v,
+                    storage_policy=storage_policy,
+                    compression=compression,
+                )
+            return
+        with _open_hdf_pooled(
+            self.file_name,
+            mode="a",
+            changed_paths=[self._get_h5_path(k) for k in data_dict.keys()],
+        ) as hdf:
+            for k, v in data_dict.items():
+                _write_hdf_with_storage_policy(
+                    hdf_filehandle=hdf,
+                    h5_path=self._get_h5_path(k),
+                    data=v,
+                    storage_policy=storage_policy,
+                    compression=compression,
+                )
+
+    def copy_to(
+        self,
+        destination: "FileHDFio",
+        file_name: Optional[str] = None,
+        maintain_name: bool = True,
+    ) -> "FileHDFio":
+        """
+        Copy the content of the HDF5 file to a new location.
+
+        Args:
+            destination (FileHDFio): The FileHDFio object pointing to the new location.
+            file_name (str, optional): The name of the new HDF5 file. Defaults to None.
+            maintain_name (bool, optional): Whether to maintain the names of the HDF5 groups. Defaults to True.
+
+        Returns:
+            FileHDFio: The FileHDFio object pointing to a file which now contains the same content as the current file.
+        """
+        # the copy opens both files itself, so pooled handles have to be closed first
+        _hdf_write_buffer.flush(file_name=self.file_name)
+        _hdf_file_pool.release(file_name=self.file_name)
+        _hdf_file_pool.release(
+            file_name=destination.file_name if file_name is None else file_name
+        )
+        return super().copy_to(
+            destination=destination, file_name=file_name, maintain_name=maintain_name
+        )
+
+    @contextlib.contextmanager
+    def session(self, max_open_files: Optional[int] = None) -> Iterator["FileHDFio"]:
+        """
+        Keep HDF5 files open for the duration of the with statement, rather than opening and closing the file for every
+        single operation.
+
+        The open file handles are shared by all FileHDFio and ProjectHDFio objects of the current process and are
+        managed in a least recently used pool, so the session can span multiple files. Sessions can be nested, the files
+        are closed when the outermost session is left. While a session is active other processes can not write to the
+        open files.
+
+        >>> with job.project_hdf5.session():
+        ...     energy = job["output/generic/energy_tot"]
+        ...     forces = job["output/generic/forces"]
+
+        Args:
+            max_open_files (int, optional): maximum number of simultaneously open HDF5 files
+
+        Yields:
+            FileHDFio: the object itself
+        """
+        _hdf_file_pool.enter(max_size=max_open_files)
+        try:
+            yield self
+        finally:
+            _hdf_file_pool.exit()
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator["FileHDFio"]:
+        """
+        Buffer all writes to HDF5 files for the duration of the with statement and write them with a single open file
+        handle per file when the with statement is left.
+
+        If an exception is raised inside the with statement, the writes, deletions and created groups buffered since
+        the batch was entered are discarded. Batches can be nested, the changes are written when the outermost batch is
+        left and an exception caught outside of an inner batch only discards the changes of the inner batch. The buffer
+        covers all FileHDFio and ProjectHDFio objects of the current thread and stores a copy of the written data.
+        Reading data and listing groups and nodes take the buffered changes into account.
+
+        The batch is no transaction on the files: operations which work on the HDF5 file directly - like
+        :meth:`hd_copy`, :meth:`dataset` or :meth:`rewrite_hdf5` - write the changes buffered for this file first and
+        these changes are not undone by a later exception. When the batch is left, the files are written one after
+        another, so an error while writing, e.g. a full disk, can leave the files written before it updated.
+
+        >>> with job.project_hdf5.batch():
+        ...     job.to_hdf()
+        ...     job.project_hdf5["status"] = "created"
+
+        Yields:
+            FileHDFio: the object itself
+        """
+        _hdf_write_buffer.enter()
+        try:
+            yield self
+        except BaseException:
+            _hdf_write_buffer.exit(commit=False)
+            raise
+        else:
+            _hdf_write_buffer.exit()
 
     def write_dict_to_hdf(self, data_dict: dict) -> None:
         """
@@ -897,43 +2864,6 @@ class FileHDFio(HasGroups, Pointer):
         """
         return posixpath.join(self.h5_path, name)
 
-    def _get_h5io_type(self, name: str) -> str:
-        """
-        Internal function to get h5io type
-
-        Args:
-            name (str): HDF5 key
-
-        Returns:
-            str: h5io type
-        """
-        with _open_hdf(self.file_name) as store:
-            return str(store[self.h5_path][name].attrs.get("TITLE", ""))
-
-    def _filter_io_objects(self, groups: Union[List[str], Set[str]]) -> Set[str]:
-        """
-        Internal function to extract h5io objects (which have the same type as normal groups)
-
-        Args:
-            groups (list, set): list of groups (as obtained e.g. from listdirs
-
-        Returns:
-            set: h5io objects
-        """
-        h5io_types = (
-            "dict",
-            "list",
-            "tuple",
-            "pd_dataframe",
-            "pd_series",
-            "multiarray",
-            "json",
-        )
-        group_h5io = set(
-            [group for group in groups if self._get_h5io_type(group) in h5io_types]
-        )
-        return group_h5io
-
     def _walk(self, level: int = 0) -> None:
         """
         Internal helper function for show_hdf() - iterating over the HDF5 datastructure and generating a human readable
@@ -952,6 +2882,234 @@ class FileHDFio(HasGroups, Pointer):
                 hdf_group._walk(level=level + 1)
 
 
+class HDFDataset:
+    """
+    Lazy proxy of an array stored in an HDF5 file. Only the shape and dtype are read on creation, slicing the proxy
+    reads just the selected part of the array from the file.
+
+    >>> positions = job.project_hdf5.dataset("output/generic/positions")
+    >>> positions.shape
+    (1000, 108, 3)
+    >>> last_frame = positions[-1]
+
+    Args:
+        file_name (str): absolute path of the HDF5 file
+        h5_path (str): path of the array inside the HDF5 file
+    """
+
+    def __init__(self, file_name: str, h5_path: str):
+        self._file_name = file_name
+        self._h5_path = h5_path
+        if not os.path.exists(file_name):
+            raise ValueError(f"Unknown item: {h5_path} {file_name}")
+        with _open_hdf_pooled(file_name) as hdf:
+            dataset = hdf.get(h5_path)
+            if (
+                not isinstance(dataset, h5py.Dataset)
+                or dataset.attrs.get("TITLE") != "ndarray"
+            ):
+                raise ValueError(f"{h5_path} in {file_name} is not an array.")
+            self._shape = dataset.shape
+            self._dtype = dataset.dtype
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self._shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
+    @property
+    def ndim(self) -> int:
+        return len(self._shape)
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self._shape))
+
+    def __len__(self) -> int:
+        if self.ndim == 0:
+            raise TypeError("len() of unsized object")
+        return self._shape[0]
+
+    def __getitem__(self, key: Any) -> Any:
+        """
+        Read the selected part of the array from the HDF5 file.
+
+        Integers, slices (including negative steps), Ellipsis and a single integer or boolean index array (in any order
+        and with repeated entries) are supported. Other numpy index forms, like multiple index arrays or np.newaxis, can
+        not be read lazily and raise an IndexError; apply them to :meth:`read` instead.
+
+        Args:
+            key (int/slice/tuple/np.ndarray): numpy style index
+
+        Returns:
+            np.ndarray: selected part of the array
+        """
+        with _open_hdf_pooled(self._file_name) as hdf:
+            dataset = hdf[self._h5_path]
+            if hdf.mode == "r" and hdf.swmr_mode:
+                # the array might have been extended by the writer since the proxy was created
+                dataset.refresh()
+                self._shape = dataset.shape
+            h5_key, post_key, array_axis = self._translate_key(key=key)
+            data = dataset[h5_key]
+        if post_key is not None:
+            data = data[post_key]
+        if array_axis is not None:
+            data = np.moveaxis(data, array_axis, 0)
+        return data
+
+    def _translate_key(self, key: Any) -> Tuple[tuple, Optional[tuple], Optional[int]]:
+        """
+        Translate a numpy style index into an index h5py can read directly and an index applied to the data read.
+
+        h5py only supports positive slice steps and a single increasing index array, so negative steps are read in
+        increasing order and reversed afterwards, and index arrays are read as sorted unique indices and reordered
+        afterwards.
+
+        Args:
+            key (int/slice/tuple/np.ndarray): numpy style index
+
+        Returns:
+            tuple: index for the HDF5 dataset, index for the data read (None if the data can be used as is) and the axis
+                of the data read which numpy places first (None if the axes are in order)
+        """
+        key = key if isinstance(key, tuple) else (key,)
+        ellipsis = [i for i, k in enumerate(key) if k is Ellipsis]
+        if len(ellipsis) > 1:
+            raise IndexError("an index can only have a single ellipsis ('...')")
+        elif len(ellipsis) == 1:
+            i = ellipsis[0]
+            missing = len(self._shape) - (len(key) - 1)
+            key = key[:i] + (slice(None),) * missing + key[i + 1 :]
+        if len(key) > len(self._shape):
+            raise IndexError(
+                f"too many indices for array: array is {len(self._shape)}-dimensional, but {len(key)} were indexed"
+            )
+        h5_key, post_key = [], []
+        has_array = False
+        for k, length in zip(key, self._shape):
+            if isinstance(k, (int, np.integer)):
+                h5_key.append(k)
+            elif isinstance(k, slice):
+                start, stop, step = k.indices(length)
+                if step > 0:
+                    h5_key.append(k)
+                    post_key.append(slice(None))
+                else:
+                    indices = range(start, stop, step)
+                    if len(indices) == 0:
+                        h5_key.append(slice(0, 0))
+                        post_key.append(slice(None))
+                    else:
+                        h5_key.append(slice(indices[-1], indices[0] + 1, -step))
+                        post_key.append(slice(None, None, -1))
+            elif isinstance(k, (list, np.ndarray)) and not has_array:
+                k = np.asarray(k)
+                if k.dtype == bool:
+                    if k.shape != (length,):
+                        raise IndexError(
+                            f"boolean index of shape {k.shape} does not match the axis of length {length}"
+                        )
+                    k = np.flatnonzero(k)
+                elif k.ndim != 1 or (k.size > 0 and k.dtype.kind not in "iu"):
+                    raise IndexError(
+                        "only one dimensional integer or boolean index arrays can be read lazily"
+                    )
+                k = k.astype(np.int64)
+                if np.any((k < -length) | (k >= length)):
+                    raise IndexError(f"index out of bounds for axis with size {length}")
+                unique, inverse = np.unique(
+                    np.where(k < 0, k + length, k), return_inverse=True
+                )
+                array_position = len(h5_key)
+                h5_key.append(unique)
+                post_key.append(inverse)
+                has_array = True
+            else:
+                raise IndexError(
+                    f"index {k!r} can not be read lazily from the HDF5 file, apply it to read() instead"
+                )
+        array_axis = None
+        if has_array:
+            advanced = [i for i, k in enumerate(h5_key) if not isinstance(k, slice)]
+            if advanced[-1] - advanced[0] + 1 != len(advanced):
+                # numpy moves the axis of the index array first, if it is separated from integer indices by a slice
+                array_axis = sum(isinstance(k, slice) for k in h5_key[:array_position])
+        if all(isinstance(k, slice) and k == slice(None) for k in post_key):
+            return tuple(h5_key), None, array_axis
+        return tuple(h5_key), tuple(post_key), array_axis
+
+    def read(self, mmap: bool = False) -> np.ndarray:
+        """
+        Read the complete array from the HDF5 file.
+
+        Args:
+            mmap (bool): return a read-only :class:`numpy.memmap` if the array is stored contiguous and uncompressed
+
+        Returns:
+            np.ndarray: the array
+        """
+        if mmap:
+            array = _read_hdf_memmap(file_name=self._file_name, h5_path=self._h5_path)
+            if array is not None:
+                return array
+        return self[()]
+
+    def __array__(self, dtype: Optional[np.dtype] = None, copy: Optional[bool] = None):
+        if copy is False:
+            # only a memory map of the file avoids reading the data into a new array
+            array = _read_hdf_memmap(file_name=self._file_name, h5_path=self._h5_path)
+            if array is None or (dtype is not None and np.dtype(dtype) != array.dtype):
+                raise ValueError(
+                    "Unable to avoid copy while creating an array from the HDF5 dataset."
+                )
+            return array
+        array = self.read()
+        return array if dtype is None else array.astype(dtype, copy=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self._file_name}, {self._h5_path}, "
+            f"shape={self._shape}, dtype={self._dtype})"
+        )
+
+
+class DatasetView:
+    """
+    Read-only view of an HDF5 group, which returns arrays as lazy :class:`HDFDataset` proxies instead of reading them
+    and everything else as stored.
+
+    >>> job.output_view["generic/positions"][-1]
+
+    Args:
+        hdf (FileHDFio): HDF5 group to view
+    """
+
+    def __init__(self, hdf: "FileHDFio"):
+        self._hdf = hdf
+
+    def __getitem__(self, item: str) -> Any:
+        try:
+            return self._hdf.dataset(item)
+        except ValueError:
+            value = self._hdf[item]
+        if isinstance(value, FileHDFio):
+            return DatasetView(hdf=value)
+        return value
+
+    def list_groups(self) -> List[str]:
+        return self._hdf.list_groups()
+
+    def list_nodes(self) -> List[str]:
+        return self._hdf.list_nodes()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._hdf})"
+
+
 class BaseHDFio:
     """
     Dummy class to allow other code to type check if it received a ProjectHDFio
@@ -1109,6 +3267,20 @@ class ProjectHDFio(FileHDFio, BaseHDFio):
         """
         return self._project
 
+    @property
+    def storage_policy(self) -> StoragePolicy:
+        """
+        Get the chunking and compression policy for arrays written to the HDF5 file, the policy of the project takes
+        precedence over the configuration.
+
+        Returns:
+            StoragePolicy: storage policy
+        """
+        storage_policy = getattr(self._project, "storage_policy", None)
+        if storage_policy is None:
+            return super().storage_policy
+        return storage_policy
+
     @property
     def project_path(self) -> str:
         """
@@ -1486,6 +3658,24 @@ class DummyHDFio(HasGroups, BaseHDFio):
             else:
                 raise
 
+    def dataset(self, path: str) -> np.ndarray:
+        """
+        Compatibility with :meth:`.FileHDFio.dataset`, the arrays are already in memory and returned as is.
+
+        Args:
+            path (str): name of the array
+
+        Returns:
+            np.ndarray: the array
+
+        Raises:
+            ValueError: if there is no array with the given name
+        """
+        value = self[path]
+        if not isinstance(value, np.ndarray):
+            raise ValueError(f"{path} is not an array.")
+        return value
+
     def __setitem__(self, item: str, value: Any) -> None:
         self._dict[item] = value
 
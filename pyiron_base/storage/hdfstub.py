@@ -6,7 +6,7 @@ Convenience class to lazily read values from HDF.
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 from typing import Any, Callable, Type
 
-from pyiron_base.storage.hdfio import BaseHDFio
+from pyiron_base.storage.hdfio import BaseHDFio, HDFDataset
 
 __author__ = "Marvin Poul"
 __copyright__ = (
@@ -105,6 +105,18 @@ class HDFStub:
         )
         return load(self._hdf, self._group_name)
 
+    def dataset(self) -> "HDFDataset":
+        """
+        Access the array this stub points to without reading it completely.
+
+        Returns:
+            HDFDataset: lazy proxy, which reads only the selected part of the array when sliced
+
+        Raises:
+            ValueError: if the stub does not point to an array
+        """
+        return self._hdf.dataset(self._group_name)
+
     def __repr__(self) -> str:
         """
         Return a string representation of the object.
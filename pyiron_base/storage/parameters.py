@@ -101,6 +101,8 @@ class GenericParameters(HasDict):
         self._block_dict = None
         self._bool_dict = {True: "True", False: "False"}
         self._dataset = OrderedDict()
+        # rows of every parameter, together with the parameter column and a copy of it when the index was built
+        self._key_index = None
         self._block_line_dict = {}
         self.end_value_char = end_value_char
         self.file_name = input_file_name
@@ -490,17 +492,14 @@ class GenericParameters(HasDict):
         Args:
             key_list (list): list of keys to be removed
         """
-        if self.read_only and any([k in self._dataset["Parameter"] for k in key_list]):
+        key_index = self._get_key_index()
+        if self.read_only and any([k in key_index for k in key_list]):
             self._read_only_error()
-        for key in key_list:
-            params = np.array(self._dataset["Parameter"])
-            i_keys = np.where(params == key)[0]
-            if len(i_keys) == 0:
-                continue
-            if i_keys[0] == -1:
-                continue
-            for i_key in i_keys[::-1]:
-                self._delete_line(i_key)
+        i_keys = sorted(
+            {i for key in key_list for i in key_index.get(key, [])}, reverse=True
+        )
+        for i_key in i_keys:
+            self._delete_line(i_key)
 
     def define_blocks(self, block_dict: Dict[str, List[str]]) -> None:
         """
@@ -683,7 +682,7 @@ class GenericParameters(HasDict):
         """
         if isinstance(item, int):
             return self._dataset["Value"][item]
-        elif item in self._dataset["Parameter"]:
+        elif self._find_line(item) > -1:
             return self.get(item)
 
     def __delitem__(self, key: str) -> None:
@@ -764,6 +763,7 @@ class GenericParameters(HasDict):
         if next_block is None:  # append
             for key in block_dict:
                 self._dataset[key] += block_dict[key]
+            self._key_index = None
         else:
             for i, tag in enumerate(self._dataset["Parameter"]):
                 if tag in self._block_dict[next_block]:
@@ -798,6 +798,8 @@ class GenericParameters(HasDict):
                 val = val.tolist()
             del val[line_number]
             self._dataset[key] = val
+        # the column is changed in place, which the index cannot notice by itself
+        self._key_index = None
 
     def _insert(
         self,
@@ -820,6 +822,7 @@ class GenericParameters(HasDict):
             val = np.array(val).tolist()
             lst = np.array(lst).tolist()
             self._dataset[key] = lst[: line_number - shift] + val + lst[line_number:]
+        self._key_index = None
 
     def _refresh_block_line_hash_table(self) -> None:
         """
@@ -887,7 +890,7 @@ class GenericParameters(HasDict):
         if self.read_only:
             self._read_only_error()
         for par, val in qwargs.items():
-            if par in self._dataset["Parameter"]:
+            if par in self._get_key_index():
                 raise ValueError("Parameter exists already: " + par)
 
             if self._block_dict is not None:
@@ -896,14 +899,21 @@ class GenericParameters(HasDict):
                     continue
 
             for col in self._dataset:
-                self._dataset[col] = np.array(self._dataset[col], dtype=object).tolist()
+                if not isinstance(self._dataset[col], list):
+                    self._dataset[col] = np.array(
+                        self._dataset[col], dtype=object
+                    ).tolist()
 
             comment = ""
             if isinstance(val, tuple):
                 val, comment = val
+            key_index = self._get_key_index()
             self._dataset["Parameter"].append(par)
             self._dataset["Value"].append(val)
             self._dataset["Comment"].append(comment)
+            # extend the index instead of rebuilding it on the next lookup
+            key_index.setdefault(par, []).append(len(self._dataset["Parameter"]) - 1)
+            self._key_index[1].append(par)
 
     def _is_multi_word_parameter(self, key: str) -> bool:
         """
@@ -976,21 +986,18 @@ class GenericParameters(HasDict):
                 lst["Comment"].append("")
         return lst
 
-    def _find_line(self, key_name: str) -> Union[int, List[int]]:
+    def _find_line(self, key_name: str, verify: bool = False) -> Union[int, List[int]]:
         """
         Internal helper function to find a line by key name
 
         Args:
             key_name (str): key name
+            verify (bool): check the index against parameter names changed in place, see :meth:`._get_key_index`
 
         Returns:
             Union[int, List[int]]: line index if a single occurrence is found, list of line indices if multiple occurrences are found, -1 if no occurrence is found
         """
-        params = self._dataset["Parameter"]
-        if len(params) > 0:
-            i_line_lst = np.where(np.array(params) == key_name)[0]
-        else:
-            i_line_lst = []
+        i_line_lst = self._get_key_index(verify=verify).get(key_name, [])
         if len(i_line_lst) == 0:
             return -1
         elif len(i_line_lst) == 1:
@@ -1011,6 +1018,40 @@ class GenericParameters(HasDict):
             error_msg = "\n".join(error_msg)
             raise ValueError(error_msg)
 
+    def _get_key_index(self, verify: bool = False) -> Dict[str, List[int]]:
+        """
+        Internal helper function to get the line indices of all parameters
+
+        The index is extended by _append() and reset by the methods changing the parameter column in place, it is
+        rebuilt if the column was replaced or changed its length since it was built, e.g. by load_string(). Code
+        renaming parameters directly in the column has to pass `verify`, which compares the column to a copy taken when
+        the index was built and costs a pass over all parameters.
+
+        Args:
+            verify (bool): compare the parameter column to its copy
+
+        Returns:
+            dict: line indices by parameter name
+        """
+        params = self._dataset["Parameter"]
+        key_index = getattr(self, "_key_index", None)
+        if (
+            key_index is None
+            or key_index[0] is not params
+            or len(key_index[1]) != len(params)
+            # columns read from HDF may be arrays, which do not compare to lists as a whole
+            or (
+                verify
+                and key_index[1]
+                != (params if isinstance(params, list) else list(params))
+            )
+        ):
+            index = {}
+            for i, par in enumerate(params):
+                index.setdefault(par, []).append(i)
+            key_index = self._key_index = (params, list(params), index)
+        return key_index[2]
+
     def clear_all(self) -> None:
         """
         Clears all fields in the object
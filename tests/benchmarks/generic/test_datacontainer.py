@@ -0,0 +1,32 @@
+from pyiron_base._tests import TestWithProject
+from pyiron_base.storage.datacontainer import DataContainer
+import timeit
+
+
+class TestDataContainer(TestWithProject):
+    def test_hdf_incremental(self):
+        """Writing a large container again after changing one value should be faster than writing it in full."""
+        hdf = self.project.create_hdf(self.project.path, "incremental")
+        container = DataContainer(
+            {f"key_{i}": i for i in range(2000)}, table_name="input"
+        )
+        container.to_hdf(hdf)
+
+        def write_changed():
+            container.key_0 += 1
+            container.to_hdf(hdf)
+
+        def write_full():
+            container.key_0 += 1
+            container.copy().to_hdf(hdf)
+
+        time_changed = timeit.timeit(write_changed, number=3)
+        time_full = timeit.timeit(write_full, number=3)
+        read = DataContainer(table_name="input")
+        read.from_hdf(hdf)
+        self.assertEqual(read.key_0, container.key_0)
+        self.assertGreater(
+            time_full,
+            10 * time_changed,
+            "Writing only changed values is not faster than writing the whole container!",
+        )
@@ -0,0 +1,44 @@
+from pyiron_base._tests import TestWithProject
+from pyiron_base.jobs.job.extension import executable
+from pyiron_base.jobs.job.extension.executable import Executable
+import os
+import shutil
+import timeit
+
+
+class TestExecutable(TestWithProject):
+    def test_cache(self):
+        """Creating many executables should search the resource paths only once."""
+        resource_paths = []
+        for i in range(10):
+            resource_path = os.path.join(self.project.path, f"resources_{i}")
+            self.addCleanup(shutil.rmtree, resource_path)
+            bin_path = os.path.join(resource_path, "code", "bin")
+            os.makedirs(bin_path)
+            for version in range(50):
+                path = os.path.join(bin_path, f"run_code_{version}.sh")
+                with open(path, "w") as f:
+                    f.write("#!/bin/bash\n")
+                os.chmod(path, 0o755)
+            # recently changed directories are not cached
+            os.utime(bin_path, ns=(1, 1))
+            resource_paths.append(resource_path)
+
+        def create_uncached():
+            executable._executable_cache.clear()
+            return Executable(path_binary_codes=resource_paths, codename="code")
+
+        def create_cached():
+            return Executable(path_binary_codes=resource_paths, codename="code")
+
+        self.assertEqual(
+            create_uncached().executable_lst, create_cached().executable_lst
+        )
+        time_uncached = timeit.timeit(create_uncached, number=100)
+        time_cached = timeit.timeit(create_cached, number=100)
+        executable._executable_cache.clear()
+        self.assertGreater(
+            time_uncached,
+            5 * time_cached,
+            "Creating executables with cached search results is not faster!",
+        )
@@ -1,4 +1,11 @@
 from pyiron_base._tests import TestWithProject
+from pyiron_base.storage.hdfio import (
+    ProjectHDFio,
+    StoragePolicy,
+    _hdf_tree_index_cache,
+    _open_hdf,
+)
+from unittest.mock import patch
 import numpy as np
 import timeit
 
@@ -21,3 +28,205 @@ class TestFileHDFio(TestWithProject):
             time_regular,
             "Storing an regular array is not faster than a ragged one!",
         )
+
+    def test_list_groups_file_opens(self):
+        """Listing groups and nodes should open the file once, independent of the number of groups."""
+        hdf = self.project.create_hdf(self.project.path, "many_groups")
+        data_dict = {"group_{}/value".format(i): i for i in range(100)}
+        data_dict.update(
+            {"dict_{}".format(i): {"a": np.arange(i + 1)} for i in range(100)}
+        )
+        hdf.write_dict(data_dict=data_dict)
+
+        with patch("pyiron_base.storage.hdfio._open_hdf", wraps=_open_hdf) as opened:
+            self.assertEqual(len(hdf.list_nodes()), 100)
+            self.assertEqual(len(hdf.list_groups()), 100)
+        self.assertEqual(
+            opened.call_count, 1, "Expected a single file open for both listings."
+        )
+
+        def get_h5io_type(name):
+            with _open_hdf(hdf.file_name) as store:
+                return str(store[hdf.h5_path][name].attrs.get("TITLE", ""))
+
+        time_single_open = timeit.timeit(hdf.list_all, number=10)
+        time_open_per_group = timeit.timeit(
+            lambda: [get_h5io_type(g) for g in hdf.list_all()["groups"]],
+            number=10,
+        )
+        self.assertGreater(
+            time_open_per_group,
+            time_single_open,
+            "Listing with one file open is not faster than opening the file per group!",
+        )
+
+    def test_hd_copy(self):
+        """Copying the HDF5 objects natively should be faster than reading and writing them in python."""
+        hdf = self.project.create_hdf(self.project.path, "copy_source")
+        hdf.write_dict(
+            data_dict={
+                "group_{}/array".format(i): np.random.rand(1000) for i in range(50)
+            }
+        )
+        hdf.write_dict(
+            data_dict={"dict_{}".format(i): {"a": np.arange(i + 1)} for i in range(50)}
+        )
+        hdf_native = self.project.create_hdf(self.project.path, "copy_native")
+        hdf_python = self.project.create_hdf(self.project.path, "copy_python")
+
+        def python_copy(hdf_old, hdf_new):
+            hdf_new.write_dict(data_dict={p: hdf_old[p] for p in hdf_old.list_nodes()})
+            for p in hdf_old.list_groups():
+                python_copy(hdf_old[p], hdf_new.create_group(p))
+
+        time_native = timeit.timeit(lambda: hdf.hd_copy(hdf, hdf_native), number=5)
+        time_python = timeit.timeit(lambda: python_copy(hdf, hdf_python), number=5)
+        self.assertEqual(hdf_native.list_all(), hdf_python.list_all())
+        self.assertGreater(
+            time_python,
+            time_native,
+            "Native HDF5 copy is not faster than reading and writing in python!",
+        )
+
+    def test_compression(self):
+        """Compressing large, compressible arrays should shrink the files considerably."""
+        data = np.round(np.cumsum(np.random.rand(1000, 100, 3), axis=0), 3)
+        times = {}
+        sizes = {}
+        for name, policy in [
+            ("none", StoragePolicy()),
+            ("gzip", StoragePolicy(compression="gzip")),
+            ("lzf", StoragePolicy(compression="lzf")),
+        ]:
+            pr = self.project.open(name)
+            pr.storage_policy = policy
+            hdf = ProjectHDFio(project=pr, file_name="compression", h5_path="/data")
+            time_write = timeit.timeit(
+                "hdf['positions'] = data",
+                number=10,
+                globals={"hdf": hdf, "data": data},
+            )
+            time_read = timeit.timeit(
+                "hdf['positions']", number=10, globals={"hdf": hdf}
+            )
+            np.testing.assert_array_equal(hdf["positions"], data)
+            hdf.rewrite_hdf5()
+            times[name] = (time_write, time_read)
+            sizes[name] = hdf.file_size()
+            hdf.remove_file()
+        for name in ["gzip", "lzf"]:
+            print(
+                f"{name}: compression ratio {sizes['none'] / sizes[name]:.2f}, "
+                f"write {times[name][0] / times['none'][0]:.2f}x, "
+                f"read {times[name][1] / times['none'][1]:.2f}x the uncompressed time"
+            )
+            self.assertLess(
+                sizes[name],
+                sizes["none"],
+                f"Compressing with {name} did not reduce the file size!",
+            )
+
+    def test_interactive_flush(self):
+        """Appending to resizable datasets should not become more expensive with the trajectory length."""
+        from pyiron_base.jobs.job.interactive import InteractiveBase
+
+        hdf = self.project.create_hdf(self.project.path, "flush")
+        frame = np.random.rand(1, 100, 3)
+
+        def rewrite(h5, path, key, data):
+            # previous implementation, reading and rewriting the complete dataset on every flush
+            if path in h5.list_groups() and key in h5[path].list_nodes():
+                data = np.array(h5[path + "/" + key].tolist() + data.tolist())
+            h5[path + "/" + key] = data
+
+        def flush_time(extend, key, length):
+            for _ in range(length):
+                extend(h5=hdf, path="interactive", key=key, data=frame)
+            return timeit.timeit(
+                lambda: extend(h5=hdf, path="interactive", key=key, data=frame),
+                number=10,
+            )
+
+        time_append_short = flush_time(InteractiveBase._extend_hdf, "append_short", 10)
+        time_append_long = flush_time(InteractiveBase._extend_hdf, "append_long", 200)
+        time_rewrite_long = flush_time(rewrite, "rewrite_long", 200)
+        self.assertLess(
+            time_append_long,
+            3 * time_append_short,
+            "Appending to a long trajectory is much slower than to a short one!",
+        )
+        self.assertGreater(
+            time_rewrite_long,
+            time_append_long,
+            "Appending in place is not faster than rewriting the whole dataset!",
+        )
+
+    def test_batch(self):
+        """Writing many small items in a batch should be faster than opening the file for every item."""
+        hdf = self.project.create_hdf(self.project.path, "batch")
+
+        def write(h5):
+            for i in range(50):
+                h5["group_{}/value".format(i % 5)] = i
+                h5["status"] = "running"
+
+        def write_batch(h5):
+            with h5.batch():
+                write(h5)
+
+        time_single = timeit.timeit(lambda: write(hdf), number=5)
+        time_batch = timeit.timeit(lambda: write_batch(hdf), number=5)
+        self.assertEqual(hdf["status"], "running")
+        self.assertGreater(
+            time_single,
+            time_batch,
+            "Writing in a batch is not faster than opening the file for every write!",
+        )
+
+    def test_tree_index(self):
+        """Probing for missing items should be served from the cached tree index rather than opening the file."""
+        hdf = self.project.create_hdf(self.project.path, "tree_index")
+        hdf.write_dict(data_dict={"group_{}/value".format(i): i for i in range(20)})
+
+        def probe(h5):
+            for i in range(20):
+                "missing_{}".format(i) in h5
+
+        def probe_uncached(h5):
+            for i in range(20):
+                "missing_{}".format(i) in h5
+                _hdf_tree_index_cache.invalidate(file_name=h5.file_name)
+
+        time_cached = timeit.timeit(lambda: probe(hdf), number=5)
+        time_uncached = timeit.timeit(lambda: probe_uncached(hdf), number=5)
+        self.assertGreater(
+            time_uncached,
+            time_cached,
+            "Probing the cached tree index is not faster than reading the file!",
+        )
+
+    def test_tree_index_write_read(self):
+        """Alternating writes and reads should not get slower with the number of groups in the file."""
+
+        def write_read(hdf):
+            for i in range(50):
+                hdf["x"] = i
+                hdf["x"]
+
+        def create(name, groups):
+            hdf = self.project.create_hdf(self.project.path, name)
+            hdf.write_dict(
+                data_dict={"group_{}/value".format(i): i for i in range(groups)}
+            )
+            write_read(hdf)
+            return hdf
+
+        small = create(name="write_read_small", groups=10)
+        large = create(name="write_read_large", groups=3000)
+        time_small = min(timeit.repeat(lambda: write_read(small), number=1, repeat=3))
+        time_large = min(timeit.repeat(lambda: write_read(large), number=1, repeat=3))
+        self.assertLess(
+            time_large,
+            3 * time_small,
+            "Alternating writes and reads rebuild the tree index of the whole file!",
+        )
@@ -0,0 +1,252 @@
+from pyiron_base._tests import TestWithProject
+from pyiron_base.storage.flattenedstorage import (
+    FlattenedStorage,
+    _decode_str_array,
+    _encode_str_array,
+)
+import h5py
+import numpy as np
+import timeit
+import tracemalloc
+
+
+class TestFlattenedStorage(TestWithProject):
+    def test_string_encoding(self):
+        """Encoding and decoding string arrays should be faster than looping over the strings in python."""
+        array = np.random.choice(["Fe", "Al", "Cu", "Ni", "O"], size=10**6)
+
+        def encode_loop(a):
+            return np.array(
+                [s.encode("utf8") for s in a],
+                dtype=h5py.string_dtype("utf8", a.dtype.itemsize),
+            )
+
+        def decode_loop(a):
+            return np.fromiter(
+                (s.decode("utf8") for s in a),
+                dtype=f"U{a.dtype.itemsize // np.dtype('U1').itemsize}",
+            )
+
+        encoded = _encode_str_array(array)
+        np.testing.assert_array_equal(encoded, encode_loop(array))
+        np.testing.assert_array_equal(_decode_str_array(encoded), array)
+
+        time_loop = timeit.timeit(lambda: decode_loop(encode_loop(array)), number=3)
+        time_vectorized = timeit.timeit(
+            lambda: _decode_str_array(_encode_str_array(array)), number=3
+        )
+        self.assertGreater(
+            time_loop,
+            time_vectorized,
+            "Vectorized string encoding is not faster than looping over the strings!",
+        )
+
+    def test_lazy_loading(self):
+        """Reading a single per chunk array should be faster than reading all arrays of a storage."""
+        store = FlattenedStorage(num_chunks=1000, num_elements=100000)
+        store.add_array("energy", per="chunk")
+        store.add_array("positions", shape=(3,), per="element")
+        store.add_array("forces", shape=(3,), per="element")
+        for i in range(1000):
+            store.add_chunk(
+                100,
+                energy=-i,
+                positions=np.random.rand(100, 3),
+                forces=np.random.rand(100, 3),
+            )
+        hdf = self.project.create_hdf(self.project.path, "lazy")
+        store.to_hdf(hdf)
+
+        def read_energy():
+            read = FlattenedStorage()
+            read.from_hdf(hdf)
+            return read["energy"]
+
+        def read_all():
+            read = FlattenedStorage()
+            read.from_hdf(hdf)
+            return [read[k] for k in read.list_arrays()]
+
+        np.testing.assert_array_equal(read_energy(), store["energy"])
+        time_energy = timeit.timeit(read_energy, number=5)
+        time_all = timeit.timeit(read_all, number=5)
+        self.assertGreater(
+            time_all,
+            time_energy,
+            "Reading a single array is not faster than reading all arrays!",
+        )
+
+    def test_find_chunk(self):
+        """Looking up chunks by identifier should be faster than scanning the identifiers."""
+        store = FlattenedStorage(num_chunks=10000, num_elements=10000)
+        for i in range(10000):
+            store.add_chunk(1, identifier=f"structure_{i}", energy=-i)
+        identifiers = [f"structure_{i}" for i in range(0, 10000, 100)]
+
+        def find_chunk_scan(identifier):
+            for i, name in enumerate(store["identifier"]):
+                if name == identifier:
+                    return i
+
+        self.assertEqual(
+            store.find_chunks(identifiers).tolist(),
+            [find_chunk_scan(i) for i in identifiers],
+        )
+        time_scan = timeit.timeit(
+            lambda: [find_chunk_scan(i) for i in identifiers], number=1
+        )
+        time_index = timeit.timeit(
+            lambda: [store.find_chunk(i) for i in identifiers], number=1
+        )
+        time_bulk = timeit.timeit(lambda: store.find_chunks(identifiers), number=1)
+        self.assertGreater(
+            time_scan,
+            time_index,
+            "Looking up identifiers in the index is not faster than scanning!",
+        )
+        self.assertGreater(
+            time_index,
+            time_bulk,
+            "Looking up identifiers in bulk is not faster than one by one!",
+        )
+
+    def test_add_chunks(self):
+        """Adding and selecting chunks in bulk should be faster than chunk by chunk."""
+        lengths = np.random.randint(1, 10, size=10000)
+        energy = np.random.rand(10000)
+        forces = np.random.rand(lengths.sum(), 3)
+        starts = np.cumsum(lengths) - lengths
+
+        def add_chunk():
+            store = FlattenedStorage()
+            for i, (s, n) in enumerate(zip(starts, lengths)):
+                store.add_chunk(n, energy=energy[i], forces=forces[s : s + n])
+            return store
+
+        def add_chunks():
+            store = FlattenedStorage()
+            store.add_chunks(lengths, energy=energy, forces=forces)
+            return store
+
+        store = add_chunks()
+        np.testing.assert_array_equal(store["forces"], add_chunk()["forces"])
+        time_add_chunk = timeit.timeit(add_chunk, number=1)
+        time_add_chunks = timeit.timeit(add_chunks, number=1)
+        self.assertGreater(
+            time_add_chunk,
+            time_add_chunks,
+            "Adding chunks in bulk is not faster than adding them one by one!",
+        )
+
+        mask = store["energy"] > 0.5
+
+        def select_chunk():
+            new = FlattenedStorage()
+            for i in np.flatnonzero(mask):
+                new.add_chunk(
+                    store["length", i],
+                    energy=store["energy", i],
+                    forces=store["forces", i],
+                )
+            return new
+
+        np.testing.assert_array_equal(
+            store.select(mask)["forces"], select_chunk()["forces"]
+        )
+        time_select_chunk = timeit.timeit(select_chunk, number=1)
+        time_select = timeit.timeit(lambda: store.select(mask), number=1)
+        self.assertGreater(
+            time_select_chunk,
+            time_select,
+            "Selecting chunks with a mask is not faster than adding them one by one!",
+        )
+
+    def test_disk(self):
+        """Building a storage on disk should need less memory than building it in memory."""
+        forces = np.random.rand(100000, 3)
+        lengths = np.full(1000, 100)
+
+        def build(store):
+            with hdf.session():
+                for _ in range(10):
+                    store.add_chunks(lengths, forces=forces)
+
+        def peak_memory(function, *args):
+            tracemalloc.start()
+            function(*args)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            return peak
+
+        hdf = self.project.create_hdf(self.project.path, "disk")
+        memory = FlattenedStorage()
+        disk = FlattenedStorage()
+        disk.to_disk(hdf)
+        peak_memory_store = peak_memory(build, memory)
+        peak_disk_store = peak_memory(build, disk)
+        self.assertEqual(len(disk), len(memory))
+        np.testing.assert_array_equal(disk["forces", 9999], memory["forces", 9999])
+        self.assertGreater(
+            peak_memory_store,
+            2 * peak_disk_store,
+            "Building a storage on disk does not save memory!",
+        )
+
+    def test_hdf_append(self):
+        """Writing a few new chunks of a large storage should be faster than writing the whole storage."""
+        store = FlattenedStorage()
+        store.add_chunks(
+            np.full(10000, 100),
+            energy=np.random.rand(10000),
+            forces=np.random.rand(10**6, 3),
+        )
+        hdf = self.project.create_hdf(self.project.path, "append")
+        store.to_hdf(hdf)
+
+        def append():
+            store.add_chunks([100], energy=[0.0], forces=np.zeros((100, 3)))
+            store.to_hdf(hdf)
+
+        def rewrite():
+            store.add_chunks([100], energy=[0.0], forces=np.zeros((100, 3)))
+            store._hdf_mark = None
+            store.to_hdf(hdf)
+
+        # converts the datasets to resizable ones once
+        append()
+        time_append = timeit.timeit(append, number=5)
+        time_rewrite = timeit.timeit(rewrite, number=5)
+        read = FlattenedStorage()
+        read.from_hdf(hdf)
+        np.testing.assert_array_equal(read["forces"], store["forces"])
+        self.assertGreater(
+            time_rewrite,
+            time_append,
+            "Appending new chunks is not faster than rewriting the storage!",
+        )
+
+    def test_reduce(self):
+        """Reducing per element arrays over all chunks at once should be faster than looping over chunks."""
+        store = FlattenedStorage()
+        lengths = np.random.randint(1, 100, size=10000)
+        store.add_chunks(lengths, forces=np.random.rand(lengths.sum(), 3))
+
+        def reduce_loop():
+            return np.array(
+                [
+                    np.linalg.norm(store.get_array("forces", i), axis=-1).max()
+                    for i in range(len(store))
+                ]
+            )
+
+        def reduce():
+            return store.reduce(np.linalg.norm(store["forces"], axis=-1), "max")
+
+        np.testing.assert_allclose(reduce(), reduce_loop())
+        time_loop = timeit.timeit(reduce_loop, number=1)
+        time_reduce = timeit.timeit(reduce, number=1)
+        self.assertGreater(
+            time_loop,
+            time_reduce,
+            "Reducing all chunks at once is not faster than looping over chunks!",
+        )
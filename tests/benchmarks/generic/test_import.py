@@ -0,0 +1,53 @@
+import subprocess
+import sys
+import timeit
+import unittest
+
+
+def _import_time(code):
+    return min(
+        timeit.repeat(
+            lambda: subprocess.check_call([sys.executable, "-c", code]),
+            number=1,
+            repeat=3,
+        )
+    )
+
+
+class TestImport(unittest.TestCase):
+    def test_lazy_import(self):
+        """Importing pyiron_base should be much faster than importing the whole API."""
+        time_startup = _import_time("pass")
+        time_lazy = _import_time("import pyiron_base") - time_startup
+        time_full = (
+            _import_time(
+                "import pyiron_base\n"
+                "for name in pyiron_base.__all__:\n"
+                "    getattr(pyiron_base, name)"
+            )
+            - time_startup
+        )
+        self.assertGreater(
+            time_full,
+            5 * time_lazy,
+            "Importing pyiron_base is not much faster than importing the whole API!",
+        )
+
+    def test_wrapper_cli(self):
+        """The wrapper sub command should not import the dependencies of the other sub commands."""
+        time_wrapper = _import_time(
+            "from pyiron_base.cli.control import _get_cli_modules\n"
+            "_get_cli_modules(['wrapper'])"
+        )
+        time_all = _import_time(
+            "from pyiron_base.cli.control import _get_cli_modules\n_get_cli_modules([])"
+        )
+        self.assertGreater(
+            time_all,
+            time_wrapper,
+            "Importing the wrapper sub command is not faster than importing all sub commands!",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
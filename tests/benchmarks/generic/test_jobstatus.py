@@ -0,0 +1,40 @@
+from pyiron_base._tests import TestWithProject
+from pyiron_base.jobs.job.extension.jobstatus import refresh_job_status_lst
+import timeit
+
+
+class TestJobStatus(TestWithProject):
+    def test_cache(self):
+        """Checking cached job statuses in a loop and refreshing them in bulk should be faster than querying each."""
+        jobs = [self.project.create.job.ScriptJob(f"job_{i}") for i in range(100)]
+        for job in jobs:
+            job.save()
+            job.status.running = True
+        status_lst = [job.status for job in jobs]
+
+        def check_uncached():
+            for status in status_lst:
+                status.refresh_from_database()
+            return [status.running for status in status_lst]
+
+        def check_cached():
+            return [status.running for status in status_lst]
+
+        def check_bulk():
+            refresh_job_status_lst(status_lst)
+            return [status.running for status in status_lst]
+
+        self.assertTrue(all(check_bulk()))
+        time_uncached = timeit.timeit(check_uncached, number=3)
+        time_cached = timeit.timeit(check_cached, number=3)
+        time_bulk = timeit.timeit(check_bulk, number=3)
+        self.assertGreater(
+            time_uncached,
+            10 * time_cached,
+            "Checking cached job statuses is not faster than querying the database!",
+        )
+        self.assertGreater(
+            time_uncached,
+            time_bulk,
+            "Refreshing job statuses in bulk is not faster than one by one!",
+        )
@@ -0,0 +1,41 @@
+from pyiron_base._tests import TestWithProject
+from pyiron_base.storage.parameters import GenericParameters
+import timeit
+
+
+class TestGenericParameters(TestWithProject):
+    def test_lookup(self):
+        """Populating and rendering large parameter files should scale linearly with the number of parameters."""
+
+        def populate(n):
+            gp = GenericParameters()
+            gp.set(**{f"key_{i}": i for i in range(n)})
+            gp.modify(**{f"key_{i}": -i for i in range(n)})
+            return gp.get_string_lst()
+
+        self.assertEqual(populate(10)[-1], "key_9 -9\n")
+        time_small = timeit.timeit(lambda: populate(1000), number=3)
+        time_large = timeit.timeit(lambda: populate(10000), number=3)
+        # quadratic scaling would make the large file a hundred times slower
+        self.assertLess(
+            time_large,
+            30 * time_small,
+            "Populating parameters does not scale linearly!",
+        )
+
+    def test_lookup_single(self):
+        """Looking up a single parameter should not take longer in larger parameter files."""
+
+        def lookup(n):
+            gp = GenericParameters()
+            gp.set(**{f"key_{i}": i for i in range(n)})
+            keys = [f"key_{i}" for i in range(0, n, n // 1000)]
+            return timeit.timeit(lambda: [gp[k] for k in keys], number=3)
+
+        time_small = lookup(1000)
+        time_large = lookup(20000)
+        self.assertLess(
+            time_large,
+            3 * time_small,
+            "Looking up a parameter takes longer in larger files!",
+        )
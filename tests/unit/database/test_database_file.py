@@ -129,6 +129,18 @@ class TestDatabaseAccess(PyironTestCase):
         result = self.database.get_item_by_id(key)
         self.assertTrue(par_dict.items() <= result.items())
 
+    def test_get_job_status_dict(self):
+        """
+        Tests get_job_status_dict function
+        Returns:
+        """
+        keys = [self.add_items("BO")["id"] for _ in range(2)]
+        self.database.item_update({"status": "finished"}, keys[1])
+        self.assertEqual(
+            self.database.get_job_status_dict(keys + [-1]),
+            {keys[0]: self.database.get_job_status(keys[0]), keys[1]: "finished"},
+        )
+
     def test_get_items_dict_project(self):
         """
         Tests whether a query for {'project': 'Projecta%'} gives Projecta, Projecta/b/c , but not Projectas
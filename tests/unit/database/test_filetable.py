@@ -10,6 +10,7 @@ from pyiron_base._tests import PyironTestCase, ToyJob
 
 from pyiron_base.database.filetable import FileTable
 from pyiron_base.project.generic import Project
+from pyiron_base.storage.hdfio import JobContainerPolicy
 
 
 class TestFileTable(PyironTestCase):
@@ -93,3 +94,34 @@ class TestFileTable(PyironTestCase):
                 "duplicate jobs in the job table.",
             )
         pr.remove_jobs(recursive=True, progress=False, silently=True)
+
+    def test_job_container(self):
+        pr = Project(dirname(__file__) + "test_filetable_test_job_container")
+        pr.job_container_policy = JobContainerPolicy(max_jobs=2)
+        for i in range(2):
+            pr.create_job(job_type=ToyJob, job_name="toy_{}".format(i)).run()
+
+        ft = FileTable(index_from=pr.path)
+        self.assertEqual(
+            sorted(ft._job_table.subjob),
+            ["/job_container_0/toy_0", "/job_container_0/toy_1"],
+        )
+        self.assertEqual(list(ft._job_table.status), ["finished", "finished"])
+        self.assertEqual(
+            ft.get_job_working_directory(job_id=ft._job_table.id.values[0]),
+            join(pr.path, "job_container_0_hdf5", "job_container_0", "toy_0"),
+        )
+
+        pr.create_job(job_type=ToyJob, job_name="toy_2").run()
+        ft.update()
+        self.assertEqual(
+            sorted(ft._job_table.subjob),
+            [
+                "/job_container_0/toy_0",
+                "/job_container_0/toy_1",
+                "/job_container_1/toy_2",
+            ],
+            msg="Jobs added to container files should be found once.",
+        )
+        pr.remove_jobs(recursive=True, progress=False, silently=True)
+        pr.remove(enable=True)
@@ -0,0 +1,95 @@
+# coding: utf-8
+"""Unit tests for pyiron_base/jobs/job/extension/executable.py"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from pyiron_base.jobs.job.extension import executable
+from pyiron_base.jobs.job.extension.executable import Executable
+from pyiron_base.state import state
+
+
+class TestExecutableCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.resource_path = self.tmp.name
+        self.bin_path = os.path.join(self.resource_path, "code", "bin")
+        os.makedirs(self.bin_path)
+        self.add_executable("1.0_default")
+        cache_patch = patch.dict(executable._executable_cache, clear=True)
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def add_executable(self, version, mtime=1):
+        path = os.path.join(self.bin_path, f"run_code_{version}.sh")
+        with open(path, "w") as f:
+            f.write("#!/bin/bash\n")
+        os.chmod(path, 0o755)
+        # pretend the directory was changed long ago, recently changed directories are not cached
+        os.utime(self.bin_path, ns=(mtime, mtime))
+        return path
+
+    def count_searches(self):
+        return patch.object(
+            executable,
+            "ExecutableResolver",
+            wraps=executable.ExecutableResolver,
+        )
+
+    def test_cache(self):
+        path = os.path.join(self.bin_path, "run_code_1.0_default.sh")
+        with self.count_searches() as resolver:
+            for _ in range(3):
+                exe = Executable(
+                    path_binary_codes=[self.resource_path], codename="code"
+                )
+                self.assertEqual(exe.executable_lst, {"1.0_default": path})
+                self.assertEqual(exe.executable_path, path)
+            self.assertEqual(resolver.call_count, 1)
+            exe.executable_lst["2.0"] = "modified"
+            self.assertEqual(
+                Executable(
+                    path_binary_codes=[self.resource_path], codename="code"
+                ).list_executables(),
+                ["1.0_default"],
+                msg="Modifying the executables of one job changed the cache.",
+            )
+            self.add_executable("2.0", mtime=2)
+            exe = Executable(path_binary_codes=[self.resource_path], codename="code")
+            self.assertEqual(exe.list_executables(), ["1.0_default", "2.0"])
+            self.assertEqual(resolver.call_count, 2)
+
+    def test_recent_changes(self):
+        os.utime(self.bin_path)
+        with self.count_searches() as resolver:
+            for _ in range(2):
+                Executable(path_binary_codes=[self.resource_path], codename="code")
+            self.assertEqual(resolver.call_count, 2)
+
+    def test_cache_file(self):
+        cache_file = os.path.join(self.resource_path, "executables.json")
+        with (
+            patch.dict(
+                state.settings.configuration, {"executable_cache_file": cache_file}
+            ),
+            patch.object(executable, "_executable_cache_file_loaded", None),
+        ):
+            exe = Executable(path_binary_codes=[self.resource_path], codename="code")
+            self.assertTrue(os.path.exists(cache_file))
+            executable._executable_cache.clear()
+            executable._executable_cache_file_loaded = None
+            with self.count_searches() as resolver:
+                self.assertEqual(
+                    Executable(
+                        path_binary_codes=[self.resource_path], codename="code"
+                    ).executable_lst,
+                    exe.executable_lst,
+                )
+                resolver.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
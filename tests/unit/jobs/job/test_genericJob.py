@@ -7,11 +7,12 @@ import unittest
 import os
 from concurrent.futures import Future, ProcessPoolExecutor
 import io
+from unittest.mock import patch
+from pyiron_base.storage.hdfio import JobContainerPolicy, _open_hdf
 from pyiron_base.storage.parameters import GenericParameters
 from pyiron_base.jobs.job.generic import GenericJob
 from pyiron_base._tests import TestWithFilledProject, ToyJob
 
-
 try:
     import jinja2
 
@@ -60,6 +61,61 @@ class TestGenericJob(TestWithFilledProject):
         ham.save()
         ham.remove()
 
+    def test_save_single_open(self):
+        job = self.project.create.job.ScriptJob("job_save_single_open")
+        with patch("pyiron_base.storage.hdfio._open_hdf", wraps=_open_hdf) as opened:
+            job.save()
+        self.assertEqual(
+            opened.call_count, 1, msg="Expected the job file to be opened only once."
+        )
+        self.assertEqual(job.project_hdf5["job_id"], job.job_id)
+        self.assertEqual(job.project_hdf5["NAME"], "ScriptJob")
+        job.remove()
+
+    def test_job_container(self):
+        pr = self.project.open("job_container")
+        pr.job_container_policy = JobContainerPolicy(job_types=["ToyJob"], max_jobs=2)
+        for i in range(3):
+            job = pr.create_job(job_type=ToyJob, job_name="toy_{}".format(i))
+            job.input.data_in = i
+            job.run()
+        self.assertEqual(
+            sorted(f for f in os.listdir(pr.path) if f.endswith(".h5")),
+            ["job_container_0.h5", "job_container_1.h5"],
+        )
+        self.assertEqual(
+            sorted(pr.job_table().subjob),
+            [
+                "/job_container_0/toy_0",
+                "/job_container_0/toy_1",
+                "/job_container_1/toy_2",
+            ],
+        )
+        job = pr.load("toy_1")
+        self.assertEqual(job.job_name, "toy_1")
+        self.assertEqual(pr.load(pr.get_job_id("toy_0")).job_name, "toy_0")
+        self.assertEqual(job.project_hdf5.h5_path, "/job_container_0/toy_1")
+        self.assertEqual(job.output.data_out, 2)
+        self.assertTrue(job.status.finished)
+        self.assertTrue(
+            os.path.exists(job.working_directory)
+            and "job_container_0_hdf5" in job.working_directory
+        )
+        job.job_name = "toy_renamed"
+        self.assertEqual(pr.load("toy_renamed").output.data_out, 2)
+        self.assertEqual(pr.load("toy_0").output.data_out, 1)
+        pr.remove_job("toy_0")
+        self.assertEqual(
+            pr.inspect("toy_renamed").project_hdf5.open("..").list_groups(),
+            ["toy_renamed"],
+        )
+        job = pr.load("toy_2")
+        container = job.project_hdf5.open("..")
+        job.remove()
+        self.assertNotIn("toy_2", container.list_groups())
+        pr.remove_jobs(recursive=True, progress=False, silently=True)
+        self.assertEqual([f for f in os.listdir(pr.path) if f.endswith(".h5")], [])
+
     def test_reload_empty_job(self):
         job_empty = self.project.create_job(
             job_type=GenericJob, job_name="empty_reload"
@@ -4,6 +4,7 @@
 
 import unittest
 import os
+import numpy as np
 from pyiron_base import DataContainer
 from pyiron_base.project.generic import Project
 from pyiron_base._tests import PyironTestCase
@@ -79,6 +80,23 @@ class InspectTest(PyironTestCase):
                         "access to recursive DataContainers"
                     )
 
+    def test_get_many(self):
+        values = self.ham.get_many(
+            ["user/test/my/recursive", "user/test/my/recursive/test", "missing"]
+        )
+        self.assertEqual(values["user/test/my/recursive"], _wrap(*test_keys[2:]))
+        self.assertEqual(values["user/test/my/recursive/test"], "data")
+        self.assertIsNone(values["missing"])
+
+    def test_output_view(self):
+        self.ham.project_hdf5["output/generic/positions"] = np.arange(30).reshape(10, 3)
+        positions = self.ham.output_view["generic/positions"]
+        self.assertEqual(positions.shape, (10, 3))
+        self.assertTrue(np.array_equal(positions[-1], [27, 28, 29]))
+        self.assertTrue(
+            np.array_equal(self.ham.output_view["generic"]["positions"][0], [0, 1, 2])
+        )
+
     def test_setitem(self):
         self.ham["user/output/some_value"] = 0.3
         self.assertEqual(self.ham["user/output/some_value"], 0.3)
@@ -6,8 +6,12 @@ import os
 from datetime import datetime
 from pyiron_base.project.generic import Project
 from pyiron_base.database.generic import DatabaseAccess
-from pyiron_base.jobs.job.extension.jobstatus import JobStatus
+from pyiron_base.jobs.job.extension.jobstatus import (
+    JobStatus,
+    refresh_job_status_lst,
+)
 import unittest
+from unittest.mock import patch
 from pyiron_base._tests import PyironTestCase
 
 
@@ -277,6 +281,67 @@ class TestJobStatus(PyironTestCase):
         self.assertNotEqual(new_status, str(self.jobstatus_database))
         self.assertEqual(finished_status, str(self.jobstatus_database))
 
+    def test_cache(self):
+        par_dict = self.database.get_item_by_id(self.job_id)
+        del par_dict["id"]
+        par_dict["status"] = "submitted"
+        job_id = self.database.add_item_dict(par_dict)
+        status = JobStatus(db=self.database, job_id=job_id)
+        with patch.object(
+            self.database, "get_job_status", wraps=self.database.get_job_status
+        ) as get_job_status:
+            for _ in range(10):
+                self.assertTrue(status.submitted)
+                self.assertEqual(str(status), "submitted")
+            get_job_status.assert_not_called()
+            status.running = True
+            self.assertEqual(self.database.get_job_status(job_id), "running")
+            get_job_status.reset_mock()
+            self.assertTrue(status.running)
+            get_job_status.assert_not_called()
+            with self.subTest("Writes invalidate the cache"):
+                self.database.set_job_status(job_id=job_id, status="collect")
+                self.assertTrue(status.collect)
+                get_job_status.assert_called_once()
+            with self.subTest("Cached statuses expire"):
+                status.cache_ttl_in_s = 0
+                self.assertTrue(status.collect)
+                self.assertEqual(get_job_status.call_count, 2)
+                status.cache_ttl_in_s = JobStatus.cache_ttl_in_s
+            with self.subTest("Explicit refresh"):
+                status.refresh_from_database()
+                self.assertEqual(get_job_status.call_count, 3)
+        with self.subTest("Changes are written through"):
+            status.running = True
+            # another process changes the status without invalidating the cache of this one
+            other = DatabaseAccess("sqlite:///test_job_status.db", "simulation")
+            other.set_job_status(job_id=job_id, status="aborted")
+            status.running = True
+            self.assertEqual(self.database.get_job_status(job_id), "running")
+
+    def test_refresh_job_status_lst(self):
+        par_dict = self.database.get_item_by_id(self.job_id)
+        del par_dict["id"]
+        par_dict["status"] = "running"
+        job_ids = [self.database.add_item_dict(par_dict) for _ in range(3)]
+        status_lst = [JobStatus(db=self.database, job_id=i) for i in job_ids]
+        status_lst.append(JobStatus())
+        self.assertEqual(
+            self.database.get_job_status_dict(job_ids + [-1]),
+            {i: "running" for i in job_ids},
+        )
+        # simulate other processes changing the status without invalidating the cache
+        with patch.object(self.database, "_status_epoch", self.database._status_epoch):
+            self.database.set_job_status(status="finished", job_id=job_ids)
+        self.assertTrue(all(status.running for status in status_lst[:3]))
+        with patch.object(
+            self.database, "get_job_status", wraps=self.database.get_job_status
+        ) as get_job_status:
+            refresh_job_status_lst(status_lst)
+            self.assertTrue(all(status.finished for status in status_lst[:3]))
+            get_job_status.assert_not_called()
+        self.assertTrue(status_lst[-1].initialized)
+
 
 class JobStatusIntegration(PyironTestCase):
     @classmethod
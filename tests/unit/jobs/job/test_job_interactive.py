@@ -2,8 +2,13 @@
 # Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
+import subprocess
+import sys
 import unittest
+import h5py
+import numpy as np
 from pyiron_base.jobs.job.interactive import InteractiveBase
+from pyiron_base.storage.hdfio import _hdf_file_pool
 from pyiron_base._tests import TestWithProject
 
 
@@ -122,6 +127,69 @@ class TestJobInteractive(TestWithProject):
         with self.assertRaises(ValueError):
             job.interactive_open().some_random_method()
 
+    def test_interactive_flush(self):
+        job = self.project.create_job(InteractiveBase, "job_interactive_flush")
+        for i in range(3):
+            job.interactive_cache["energy"] = [float(i), float(i) + 0.5]
+            job.interactive_cache["positions"] = [np.full((2, 3), i)] * 2
+            job.interactive_cache["ragged"] = [[1] * (i + 1), [2]]
+            job.interactive_flush()
+        self.assertEqual(
+            job.project_hdf5["output/interactive/energy"].tolist(),
+            [0.0, 0.5, 1.0, 1.5, 2.0, 2.5],
+        )
+        self.assertEqual(
+            job.project_hdf5["output/interactive/positions"].shape, (6, 2, 3)
+        )
+        self.assertEqual(
+            job.project_hdf5["output/interactive/positions"][-1].tolist(), [[2] * 3] * 2
+        )
+        self.assertEqual(len(job.project_hdf5["output/interactive/ragged"]), 6)
+        with h5py.File(job.project_hdf5.file_name, "r") as f:
+            dataset = f[job.project_hdf5.h5_path + "/output/interactive/positions"]
+            self.assertEqual(dataset.maxshape, (None, 2, 3))
+
+        with self.subTest("extend array written in one piece and upcast"):
+            job.project_hdf5["output/interactive/steps"] = np.arange(3)
+            job._extend_hdf(
+                h5=job.project_hdf5.open("output"),
+                path="interactive",
+                key="steps",
+                data=np.array([3.5]),
+            )
+            self.assertEqual(
+                job.project_hdf5["output/interactive/steps"].tolist(),
+                [0.0, 1.0, 2.0, 3.5],
+            )
+
+    def test_interactive_swmr(self):
+        job = self.project.create_job(InteractiveBase, "job_interactive_swmr")
+        with self.assertRaises(AssertionError):
+            job.interactive_swmr = 1
+        job.interactive_swmr = True
+        job.save()
+        file_name = job.project_hdf5.file_name
+        for i in range(3):
+            job.interactive_cache["energy"] = [float(i)]
+            job.interactive_flush()
+        self.assertTrue(_hdf_file_pool.has_swmr_writer(file_name=file_name))
+        reader = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "from pyiron_base.storage.hdfio import FileHDFio; "
+                f"print(FileHDFio('{file_name}')['{job.project_hdf5.h5_path}/output/interactive/energy'].tolist())",
+            ],
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(reader.stdout.strip(), "[0.0, 1.0, 2.0]", msg=reader.stderr)
+        job.interactive_close()
+        self.assertFalse(_hdf_file_pool.has_swmr_writer(file_name=file_name))
+        job_reload = self.project.create_job(InteractiveBase, "job_interactive_swmr")
+        job_reload.from_hdf()
+        self.assertTrue(job_reload.interactive_swmr)
+
     def test_include_last_step(self):
         job = self.project.create_job(InteractiveBase, "job_include_last_step")
         self.assertEqual(job._include_last_step([1, 2, 3], 2, True), [1, 3])
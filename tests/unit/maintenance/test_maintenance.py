@@ -1,9 +1,10 @@
+import os
 import unittest
+from unittest.mock import patch
 
 import numpy as np
-from pyiron_base._tests import TestWithFilledProject
-from pyiron_base import GenericJob
-
+from pyiron_base._tests import TestWithFilledProject, ToyJob
+from pyiron_base import GenericJob, JobContainerPolicy, StoragePolicy
 
 try:
     import git
@@ -54,6 +55,85 @@ class TestMaintenance(TestWithFilledProject):
         self.project.maintenance.local.defragment_storage()
         self._assert_hdf_rewrite()
 
+    def test_local_defragment_storage_parallel(self):
+        self._assert_setup()
+        self.project.maintenance.local.defragment_storage(progress=False, max_workers=2)
+        self._assert_hdf_rewrite()
+
+    def test_local_defragment_storage_journal(self):
+        journal_file = os.path.join(self.project.path, "journal.jsonl")
+        self.project.maintenance.local.defragment_storage(
+            progress=False, journal_file=journal_file
+        )
+        self._assert_hdf_rewrite()
+        with open(journal_file) as f:
+            self.assertEqual(len(f.readlines()), len(self.project.job_table()))
+        job = self.project.load("toy_1")
+        job["user/some"] = _test_array(5)
+        job["user/some"] = _test_array()
+        size_modified = job.project_hdf5.file_size()
+        with open(journal_file, "a") as f:
+            f.write('{"task": "defragment_storage", "fi')
+        self.project.maintenance.local.defragment_storage(
+            progress=False, journal_file=journal_file
+        )
+        self.assertLess(job.project_hdf5.file_size(), size_modified)
+        with open(journal_file) as f:
+            self.assertEqual(len(f.readlines()), len(self.project.job_table()) + 2)
+        with patch("pyiron_base.maintenance.generic._defragment_file") as defragment:
+            self.project.maintenance.local.defragment_storage(
+                progress=False, journal_file=journal_file
+            )
+        defragment.assert_not_called()
+        os.remove(journal_file)
+
+    def test_local_recompress_storage(self):
+        job = self.project.load("toy_1")
+        job["user/large"] = np.ones((100, 100))
+        size_uncompressed = job.project_hdf5.file_size()
+        self.project.maintenance.local.recompress_storage(
+            storage_policy=StoragePolicy(compression="gzip", threshold=1024),
+            job="toy_1",
+            progress=False,
+        )
+        self.assertLess(job.project_hdf5.file_size(), size_uncompressed)
+        self.assertEqual(job["user/large"], np.ones((100, 100)))
+        self.assertEqual(self.project["toy_1/user/some"], _test_array())
+
+    def test_local_consolidate_jobs(self):
+        pr = self.project.open("consolidate")
+        for i in range(3):
+            job = pr.create_job(job_type=ToyJob, job_name="toy_{}".format(i))
+            job.input.data_in = i
+            job.run()
+        with self.assertRaises(ValueError):
+            pr.maintenance.local.consolidate_jobs(progress=False)
+        pr.maintenance.local.consolidate_jobs(
+            job_container_policy=JobContainerPolicy(max_jobs=2), progress=False
+        )
+        self.assertEqual(
+            sorted(f for f in os.listdir(pr.path) if f.endswith(".h5")),
+            ["job_container_0.h5", "job_container_1.h5"],
+        )
+        self.assertFalse(os.path.exists(os.path.join(pr.path, "toy_0_hdf5")))
+        for i in range(3):
+            job = pr.load("toy_{}".format(i))
+            self.assertTrue(job.status.finished)
+            self.assertEqual(job.output.data_out, i + 1)
+            self.assertTrue(os.path.exists(job.working_directory))
+        self.assertEqual(
+            pr.load("toy_2").project_hdf5.h5_path, "/job_container_1/toy_2"
+        )
+        pr.remove_job("toy_0")
+        self.assertTrue(os.path.exists(os.path.join(pr.path, "job_container_0.h5")))
+        pr.remove_job("toy_1")
+        self.assertEqual(
+            sorted(f for f in os.listdir(pr.path) if f.startswith("job_container_0")),
+            [],
+            "Emptied job container left files behind!",
+        )
+        pr.remove_jobs(recursive=True, progress=False, silently=True)
+
     def test_update_base_to_current(self):
         self._assert_setup()
 
@@ -8,12 +8,14 @@ from pyiron_base.storage.inputlist import InputList
 from collections.abc import Iterator
 import copy
 import os
+import posixpath
 import sys
 import unittest
 import warnings
 import h5py
 import numpy as np
 import pandas as pd
+from unittest.mock import patch
 
 
 class Sub(DataContainer):
@@ -641,6 +643,85 @@ class TestDataContainer(TestWithCleanProject):
         pl2 = self.hdf["pandas"].to_object()
         self.assertEqual(type(pl[0]), type(pl2[0]))
 
+    def test_hdf_incremental(self):
+        """Writing a container again should only write values changed since the last write or read."""
+        pl = DataContainer(
+            {"a": 1, "b": "foo", "c": [1, 2], "d": np.arange(3)}, table_name="inc"
+        )
+        pl.to_hdf(self.hdf)
+
+        def written(container=None):
+            written = []
+            setitem = type(self.hdf).__setitem__
+
+            def record(hdf, key, value):
+                if key != "READ_ONLY":
+                    written.append(posixpath.join(hdf.h5_path, key))
+                return setitem(hdf, key, value)
+
+            with patch.object(type(self.hdf), "__setitem__", record):
+                (container or pl).to_hdf(self.hdf)
+            return written
+
+        def read(lazy=False):
+            container = DataContainer(table_name="inc", lazy=lazy)
+            container.from_hdf(self.hdf)
+            return container
+
+        self.assertEqual(
+            written(), ["/test/inc/d__index_3"], "Only arrays should be written again!"
+        )
+        pl.a = 2
+        pl.c.append(3)
+        self.assertEqual(
+            written(),
+            [
+                "/test/inc/a__index_0",
+                "/test/inc/c__index_2/__index_2",
+                "/test/inc/d__index_3",
+            ],
+        )
+        pl.d[0] = 42
+        del pl["b"]
+        written()
+        self.assertEqual(read().keys(), pl.keys())
+        self.assertEqual(read().d.tolist(), [42, 1, 2])
+        self.assertNotIn("b__index_1", self.hdf["inc"].list_nodes())
+
+        with self.subTest("read"):
+            pl = read(lazy=True)
+            self.assertEqual(written(), [])
+            pl.c[0] = 0
+            self.assertEqual(written(), ["/test/inc/c__index_1/__index_0"])
+            self.assertEqual(read().c.to_builtin(), [0, 2, 3])
+
+        with self.subTest("other container"):
+            pl = read()
+            other = DataContainer({"a": 3}, table_name="inc")
+            other.to_hdf(self.hdf)
+            written()
+            self.assertEqual(read().a, 2, "Overwritten value not written again!")
+            copy = pl.copy()
+            self.assertEqual(len(written(copy)), 5, "Copy not written completely!")
+
+        with self.subTest("changed in file"):
+            pl = read()
+            self.hdf["inc/a__index_0"] = 99
+            self.hdf["inc/c__index_1/__index_0"] = 99
+            written()
+            self.assertEqual(read().a, pl.a, "Value changed in file not written again!")
+            self.assertEqual(read().c.to_builtin(), pl.c.to_builtin())
+
+        with self.subTest("rollback"):
+            pl = read()
+            pl.a = 5
+            with self.assertRaises(RuntimeError):
+                with self.hdf.batch():
+                    written()
+                    raise RuntimeError()
+            written()
+            self.assertEqual(read().a, 5, "Value discarded in batch not written again!")
+
     def test_dict_empty_list(self):
         """HasDict interface should work"""
         with self.subTest("empty list could not use to_dict interface"):
@@ -805,6 +886,17 @@ class TestDataContainer(TestWithCleanProject):
             "Nested values not loaded after force even though recursive==True!",
         )
 
+    def test_lazy_dataset(self):
+        """Arrays in lazy data containers should be partially readable without loading them."""
+        dc = DataContainer({"array": np.arange(10), "nested": {"array": np.ones(5)}})
+        dc.to_hdf(self.hdf, "lazy_dataset")
+        ll = self.hdf["lazy_dataset"].to_object(lazy=True)
+        self.assertEqual(ll.dataset("array")[-3:].tolist(), [7, 8, 9])
+        self.assertIsInstance(ll._store[0], HDFStub, "Array loaded by dataset()!")
+        self.assertEqual(ll.dataset("nested/array").shape, (5,))
+        self.assertEqual(ll.array.tolist(), list(range(10)))
+        self.assertIs(ll.dataset("array"), ll.array)
+
     def test_lazy_copy(self):
         """Copying lazy data containers should not throw an error."""
         try:
@@ -3,17 +3,32 @@
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 import os
 import sys
+import threading
 import warnings
 from io import StringIO
+import h5py
 import numpy as np
 import pandas as pd
 from unittest.mock import MagicMock, patch
 from pyiron_base.storage.hdfio import (
     FileHDFio,
+    DatasetView,
     DummyHDFio,
+    HDFDataset,
+    JobContainerPolicy,
     ProjectHDFio,
+    StoragePolicy,
+    _append_hdf_dataset,
+    _claim_hdf_group,
+    _hdf_file_pool,
+    _hdf_tree_index_cache,
+    _hdf_write_buffer,
     _is_ragged_in_1st_dim_only,
     _import_class,
+    _is_hdf_group_owner,
+    _open_hdf,
+    _recompress_hdf,
+    _refresh_swmr_node,
     _to_object,
     state,
 )
@@ -624,6 +639,13 @@ class TestProjectHDFio(TestWithProject):
     def test_content(self):
         _check_full_hdf_values(self, self.full_hdf5)
 
+    def test_session(self):
+        with self.full_hdf5.session() as hdf:
+            self.assertIs(hdf, self.full_hdf5)
+            _check_full_hdf_values(self, self.full_hdf5)
+            self.assertEqual(len(_hdf_file_pool._handles), 1)
+        self.assertEqual(len(_hdf_file_pool._handles), 0)
+
     def test_rewrite_hdf5(self):
         self.full_hdf5.rewrite_hdf5()
         _check_full_hdf_values(self, self.full_hdf5)
@@ -745,6 +767,16 @@ class TestFileHDFioCoverage(PyironTestCase):
         self.assertNotIn("array", new_hdf.list_nodes())
         new_hdf.remove_file()
 
+        new_hdf = FileHDFio(file_name=new_hdf_file)
+        self.hdf.hd_copy(self.hdf, new_hdf, exclude_nodes=["test_content/array"])
+        self.assertEqual(new_hdf.list_groups(), ["test_content"])
+        self.assertNotIn("array", new_hdf["test_content"].list_nodes())
+        self.assertEqual(
+            sorted(new_hdf["test_content"].list_nodes()),
+            sorted(set(self.hdf["test_content"].list_nodes()) - {"array"}),
+        )
+        new_hdf.remove_file()
+
     def test_read_dict_from_hdf(self):
         test_dict = self.hdf["test_content"].read_dict_from_hdf()
         self.assertEqual(test_dict["array"][0], 1)
@@ -1202,5 +1234,712 @@ class TestDummyHDFio(TestWithProject):
         self.assertIn("grp", la["groups"])
 
 
+class TestFileHDFioSession(PyironTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.current_dir = os.path.dirname(os.path.abspath(__file__)).replace("\\", "/")
+        cls.hdf5_file = os.path.join(cls.current_dir, "test_session.h5")
+        cls.other_file = os.path.join(cls.current_dir, "test_session_other.h5")
+
+    def setUp(self):
+        super().setUp()
+        self.hdf = FileHDFio(file_name=self.hdf5_file)
+        _write_full_hdf_content(self.hdf.create_group("content"))
+
+    def tearDown(self):
+        super().tearDown()
+        for file_name in [self.hdf5_file, self.other_file]:
+            if os.path.exists(file_name):
+                os.remove(file_name)
+
+    def test_single_open(self):
+        with patch("pyiron_base.storage.hdfio._open_hdf", wraps=_open_hdf) as opened:
+            with self.hdf.session():
+                _check_full_hdf_values(self, self.hdf)
+                self.assertEqual(self.hdf["content"].list_groups(), ["group"])
+            self.assertEqual(
+                opened.call_count, 1, msg="Expected the file to be opened only once."
+            )
+        self.assertFalse(_hdf_file_pool.active)
+        self.assertEqual(len(_hdf_file_pool._handles), 0)
+
+    def test_read_write(self):
+        with self.hdf.session():
+            self.assertEqual(self.hdf["content/array"], np.array([1, 2, 3, 4, 5, 6]))
+            self.hdf["content/new"] = 42
+            self.hdf.write_dict(data_dict={"content/more": [1, 2]})
+            self.hdf["content/frame"] = pd.DataFrame({"a": [1, 2]})
+            self.assertEqual(self.hdf["content/new"], 42)
+            self.assertEqual(self.hdf["content/more"], [1, 2])
+            self.assertEqual(self.hdf["content/frame"]["a"].tolist(), [1, 2])
+            del self.hdf["content/new"]
+            self.assertNotIn("new", self.hdf["content"].list_nodes())
+        self.assertEqual(self.hdf["content/more"], [1, 2])
+
+    def test_nested(self):
+        other = FileHDFio(file_name=self.other_file)
+        with self.hdf.session():
+            with other.session():
+                other["value"] = 1
+                self.assertEqual(self.hdf["content/group/some_entry"], "present")
+            self.assertTrue(_hdf_file_pool.active)
+            self.assertEqual(len(_hdf_file_pool._handles), 2)
+        self.assertEqual(len(_hdf_file_pool._handles), 0)
+
+    def test_max_open_files(self):
+        other = FileHDFio(file_name=self.other_file)
+        with self.hdf.session(max_open_files=1):
+            other["value"] = 1
+            self.assertEqual(self.hdf["content/indices"], np.array([1, 1, 1, 1, 6]))
+            self.assertEqual(list(_hdf_file_pool._handles.keys()), [self.hdf.file_name])
+            self.assertEqual(other["value"], 1)
+            self.assertEqual(list(_hdf_file_pool._handles.keys()), [other.file_name])
+        self.assertEqual(_hdf_file_pool.max_size, 16)
+
+    def test_max_open_files_nested(self):
+        other = FileHDFio(file_name=self.other_file)
+        other["value"] = 1
+        with self.hdf.session():
+            self.assertEqual(self.hdf["content/indices"], np.array([1, 1, 1, 1, 6]))
+            self.assertEqual(other["value"], 1)
+            with self.hdf.session(max_open_files=1):
+                self.assertEqual(_hdf_file_pool.max_size, 1)
+                self.assertEqual(len(_hdf_file_pool._handles), 1)
+            self.assertEqual(_hdf_file_pool.max_size, 16)
+            self.assertEqual(other["value"], 1)
+            self.assertEqual(self.hdf["content/indices"], np.array([1, 1, 1, 1, 6]))
+            self.assertEqual(len(_hdf_file_pool._handles), 2)
+        self.assertEqual(_hdf_file_pool.max_size, 16)
+
+    def test_read_many(self):
+        content = self.hdf.open("content")
+        with patch("pyiron_base.storage.hdfio._open_hdf", wraps=_open_hdf) as opened:
+            data = content.read_many(
+                paths=["array", "dict", "group/some_entry", "group"]
+            )
+        self.assertEqual(opened.call_count, 1)
+        self.assertEqual(data["array"], np.array([1, 2, 3, 4, 5, 6]))
+        self.assertEqual(data["dict"], {"key_1": 1, "key_2": "hallo"})
+        self.assertEqual(data["group/some_entry"], "present")
+        self.assertIsInstance(data["group"], FileHDFio)
+        with self.assertRaises(ValueError):
+            self.hdf.read_many(paths=["content/array", "content/missing"])
+        self.assertFalse(_hdf_file_pool.active)
+
+    def test_invalidation(self):
+        with self.hdf.session():
+            self.assertEqual(self.hdf["content/group/some_entry"], "present")
+            self.hdf.remove_file()
+            self.assertFalse(self.hdf.file_exists)
+            self.hdf["value"] = 2
+            self.assertEqual(self.hdf.list_nodes(), ["value"])
+            # replace the file behind the back of the pool
+            os.remove(self.hdf5_file)
+            with h5py.File(self.hdf5_file, "w") as f:
+                f["replaced"] = 3
+            self.assertEqual(self.hdf.list_nodes(), ["replaced"])
+
+
+class TestFileHDFioBatch(PyironTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.current_dir = os.path.dirname(os.path.abspath(__file__)).replace("\\", "/")
+        cls.hdf5_file = os.path.join(cls.current_dir, "test_batch.h5")
+
+    def setUp(self):
+        super().setUp()
+        self.hdf = FileHDFio(file_name=self.hdf5_file)
+        _write_full_hdf_content(self.hdf.create_group("content"))
+
+    def tearDown(self):
+        super().tearDown()
+        if os.path.exists(self.hdf5_file):
+            os.remove(self.hdf5_file)
+
+    def test_single_open(self):
+        def write_opens(opened):
+            return [c for c in opened.call_args_list if c.kwargs["mode"] != "r"]
+
+        with patch("pyiron_base.storage.hdfio._open_hdf", wraps=_open_hdf) as opened:
+            with self.hdf.batch():
+                self.hdf["value"] = 1
+                self.hdf.write_dict(data_dict={"input/a": [1, 2], "input/b": "b"})
+                self.hdf.create_group("empty")
+                del self.hdf["content/array"]
+                self.hdf["content"].remove_group()
+                self.assertEqual(
+                    len(write_opens(opened)),
+                    0,
+                    msg="Expected no write access in the batch.",
+                )
+            self.assertEqual(len(write_opens(opened)), 1)
+        self.assertFalse(_hdf_write_buffer.active)
+        self.assertEqual(self.hdf["value"], 1)
+        self.assertEqual(self.hdf["input/a"], [1, 2])
+        self.assertEqual(self.hdf.list_groups(), ["empty", "input"])
+
+    def test_read_buffered(self):
+        with self.hdf.batch():
+            self.hdf["content/group/new"] = 42
+            self.hdf["new_group/value"] = 1
+            del self.hdf["content/dict"]
+            self.assertEqual(self.hdf["content/group/new"], 42)
+            self.assertEqual(self.hdf["content/group/some_entry"], "present")
+            self.assertEqual(self.hdf["new_group"]["value"], 1)
+            self.assertIn("new_group", self.hdf.list_groups())
+            self.assertNotIn("dict", self.hdf["content"].list_nodes())
+            with self.assertRaises(ValueError):
+                self.hdf["content/dict"]
+            self.hdf["content/group"].remove_group()
+            self.assertEqual(self.hdf["content"].list_groups(), [])
+            with self.assertRaises(ValueError):
+                self.hdf["content/group/some_entry"]
+        self.assertEqual(self.hdf["content"].list_groups(), [])
+        self.assertNotIn("dict", self.hdf["content"].list_nodes())
+
+    def test_rollback(self):
+        with self.assertRaises(RuntimeError):
+            with self.hdf.batch():
+                self.hdf["value"] = 1
+                del self.hdf["content/array"]
+                with self.hdf.batch():
+                    self.hdf["other"] = 2
+                raise RuntimeError()
+        self.assertFalse(_hdf_write_buffer.active)
+        self.assertEqual(self.hdf.list_nodes(), [])
+        _check_full_hdf_values(self, self.hdf)
+
+    def test_nested_rollback(self):
+        with self.hdf.batch():
+            self.hdf["value"] = 1
+            with self.assertRaises(RuntimeError):
+                with self.hdf.batch():
+                    self.hdf["other"] = 2
+                    self.hdf["value"] = 3
+                    del self.hdf["content/array"]
+                    raise RuntimeError()
+            self.assertTrue(_hdf_write_buffer.active)
+            self.assertEqual(self.hdf["value"], 1)
+            self.hdf["last"] = 4
+        self.assertFalse(_hdf_write_buffer.active)
+        self.assertEqual(self.hdf.list_nodes(), ["last", "value"])
+        self.assertEqual(self.hdf["value"], 1)
+        _check_full_hdf_values(self, self.hdf)
+
+    def test_copy_buffered(self):
+        array = np.arange(5)
+        data = {"a": [1, 2]}
+        with self.hdf.batch():
+            self.hdf["array"] = array
+            self.hdf["data"] = data
+            array[0] = 42
+            data["a"].append(3)
+            self.hdf["data"]["a"].append(4)
+            self.assertEqual(self.hdf["array"], np.arange(5))
+            self.assertEqual(self.hdf["data"], {"a": [1, 2]})
+        self.assertEqual(self.hdf["array"], np.arange(5))
+        self.assertEqual(self.hdf["data"], {"a": [1, 2]})
+
+    def test_direct_access(self):
+        with self.hdf.batch():
+            self.hdf["output/array"] = np.arange(5)
+            self.assertEqual(self.hdf.dataset("output/array").read(), np.arange(5))
+            self.hdf["output/value"] = 1
+            with h5py.File(self.hdf5_file, "r") as f:
+                self.assertIn("output/array", f)
+                self.assertNotIn("output/value", f)
+        self.assertEqual(self.hdf["output/value"], 1)
+
+    def test_direct_access_rollback(self):
+        with self.assertRaises(RuntimeError):
+            with self.hdf.batch():
+                self.hdf["output/array"] = np.arange(5)
+                self.hdf.dataset("output/array")
+                self.hdf["output/value"] = 1
+                raise RuntimeError()
+        # written to the file before the direct access, so it is not rolled back
+        self.assertEqual(self.hdf["output"].list_nodes(), ["array"])
+
+
+class TestFileHDFioSWMR(PyironTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.current_dir = os.path.dirname(os.path.abspath(__file__)).replace("\\", "/")
+        cls.hdf5_file = os.path.join(cls.current_dir, "test_swmr.h5")
+
+    def setUp(self):
+        super().setUp()
+        self.hdf = FileHDFio(file_name=self.hdf5_file)
+        self.hdf.write_dict(data_dict={"value": 1})
+
+    def tearDown(self):
+        super().tearDown()
+        self.hdf.remove_file()
+
+    def test_append(self):
+        for i in range(3):
+            self.assertTrue(
+                _append_hdf_dataset(
+                    file_name=self.hdf5_file,
+                    h5_path="/output/energy",
+                    data=np.array([float(i)]),
+                    swmr=True,
+                )
+            )
+        # the dataset is created in regular mode and extended in SWMR mode
+        self.assertTrue(_hdf_file_pool.has_swmr_writer(file_name=self.hdf5_file))
+        self.assertEqual(self.hdf["output/energy"], np.array([0.0, 1.0, 2.0]))
+        self.assertEqual(self.hdf.dataset("output/energy")[-1], 2.0)
+        self.assertEqual(self.hdf["output"].list_nodes(), ["energy"])
+        self.assertTrue(_hdf_file_pool.has_swmr_writer(file_name=self.hdf5_file))
+        self.hdf["other"] = 2
+        self.assertFalse(_hdf_file_pool.has_swmr_writer(file_name=self.hdf5_file))
+        self.assertEqual(self.hdf["other"], 2)
+        self.assertEqual(self.hdf["output/energy"], np.array([0.0, 1.0, 2.0]))
+
+    def test_reader(self):
+        _append_hdf_dataset(
+            file_name=self.hdf5_file, h5_path="/energy", data=np.arange(2.0)
+        )
+        writer = _hdf_file_pool.get_swmr_writer(file_name=self.hdf5_file)
+        with _open_hdf(self.hdf5_file, mode="r", swmr=True) as reader:
+            dataset = reader["energy"]
+            self.assertEqual(dataset.shape, (2,))
+            writer["energy"].resize(3, axis=0)
+            writer["energy"][-1] = 2.0
+            writer.flush()
+            _refresh_swmr_node(node=reader)
+            self.assertEqual(dataset[()], np.arange(3.0))
+        _hdf_file_pool.release(file_name=self.hdf5_file)
+        self.assertFalse(_hdf_file_pool.has_swmr_writer(file_name=self.hdf5_file))
+
+    def test_unsupported_file_format(self):
+        self.hdf.remove_file()
+        with h5py.File(self.hdf5_file, "w", libver="earliest") as f:
+            f.create_dataset("energy", data=np.arange(2.0), maxshape=(None,))
+            f["energy"].attrs["TITLE"] = "ndarray"
+        self.assertIsNone(_hdf_file_pool.get_swmr_writer(file_name=self.hdf5_file))
+        self.assertTrue(
+            _append_hdf_dataset(
+                file_name=self.hdf5_file,
+                h5_path="/energy",
+                data=np.array([2.0]),
+                swmr=True,
+            )
+        )
+        self.assertEqual(self.hdf["energy"], np.arange(3.0))
+
+
+class TestFileHDFioTreeIndex(PyironTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.current_dir = os.path.dirname(os.path.abspath(__file__)).replace("\\", "/")
+        cls.hdf5_file = os.path.join(cls.current_dir, "test_tree_index.h5")
+
+    def setUp(self):
+        super().setUp()
+        self.hdf = FileHDFio(file_name=self.hdf5_file)
+        _write_full_hdf_content(self.hdf.create_group("content"))
+
+    def tearDown(self):
+        super().tearDown()
+        self.hdf.remove_file()
+
+    def test_cached_listing(self):
+        content = self.hdf["content"]
+        self.assertEqual(content.list_groups(), ["group"])
+        self.assertIn("some_entry", content["group"].list_nodes())
+        with patch("pyiron_base.storage.hdfio._open_hdf", wraps=_open_hdf) as opened:
+            self.assertEqual(content.list_groups(), ["group"])
+            self.assertIn("dict", content.list_nodes())
+            self.assertIn("group", content)
+            self.assertNotIn("missing", content)
+            with self.assertRaises(ValueError):
+                content["missing"]
+            with self.assertRaises(ValueError):
+                self.hdf["content/group/missing/value"]
+            self.assertIsInstance(content["group"], FileHDFio)
+        self.assertEqual(
+            opened.call_count,
+            0,
+            msg="Expected the listing to be served from the index.",
+        )
+        self.assertEqual(content["dict"], {"key_1": 1, "key_2": "hallo"})
+        self.assertEqual(self.hdf["content"]["group/some_entry"], "present")
+
+    def test_invalidate(self):
+        self.assertNotIn("new", self.hdf.list_nodes())
+        self.hdf["new"] = 1
+        self.assertIn("new", self.hdf.list_nodes())
+        with self.hdf.session():
+            self.hdf["session/value"] = 2
+            self.assertIn("session", self.hdf.list_groups())
+        del self.hdf["new"]
+        self.assertNotIn("new", self.hdf.list_nodes())
+        self.assertEqual(self.hdf["session/value"], 2)
+
+    def test_lazy(self):
+        self.hdf.write_dict(data_dict={f"group_{i}/value": i for i in range(5)})
+        _hdf_tree_index_cache.invalidate(file_name=self.hdf5_file)
+
+        def count_opens(item):
+            with patch("h5py.h5f.open", wraps=h5py.h5f.open) as opened:
+                try:
+                    self.hdf[item]
+                except ValueError:
+                    pass
+            return opened.call_count
+
+        self.assertEqual(count_opens("group_1/value"), 1)
+        index = _hdf_tree_index_cache.get(file_name=self.hdf5_file)
+        self.assertEqual(index._groups, {}, "Reading a node listed its groups!")
+        self.assertEqual(count_opens("group_1/missing"), 1)
+        self.assertEqual(sorted(index._groups.keys()), ["/", "/group_1"])
+        self.assertEqual(count_opens("group_1/other"), 0)
+        self.assertEqual(count_opens("group_2/value"), 1)
+        with self.assertRaises(ValueError):
+            self.hdf["group_1/missing"]
+
+    def test_incremental_write(self):
+        self.hdf.write_dict(data_dict={f"group_{i}/value": i for i in range(5)})
+        for i in range(5):
+            self.assertEqual(self.hdf["group_{}".format(i)].list_nodes(), ["value"])
+        self.hdf["group_1/other"] = 1
+        index = _hdf_tree_index_cache.get(file_name=self.hdf5_file)
+        self.assertIn("/group_2", index._groups)
+        self.assertEqual(index._stale, {"/group_1": {"other"}})
+        self.assertEqual(self.hdf["group_1"].list_nodes(), ["other", "value"])
+        self.hdf["group_5/value"] = 5
+        del self.hdf["group_0"]
+        self.assertEqual(
+            self.hdf.list_groups(), ["content"] + [f"group_{i}" for i in range(1, 6)]
+        )
+        self.assertIs(_hdf_tree_index_cache.get(file_name=self.hdf5_file), index)
+
+    def test_replaced_file(self):
+        self.assertIn("content", self.hdf.list_groups())
+        os.remove(self.hdf5_file)
+        self.hdf["value"] = 1
+        self.assertEqual(self.hdf.list_all(), {"groups": [], "nodes": ["value"]})
+
+    def test_get_does_not_read(self):
+        # the index cache lock must not be held while waiting for a file handle
+        with patch("pyiron_base.storage.hdfio._open_hdf", wraps=_open_hdf) as opened:
+            _hdf_tree_index_cache.invalidate(file_name=self.hdf5_file)
+            _hdf_tree_index_cache.get(file_name=self.hdf5_file)
+        self.assertEqual(opened.call_count, 0)
+
+    def test_threads(self):
+        values = {}
+
+        def write_read(i):
+            hdf = FileHDFio(file_name=self.hdf5_file)
+            for j in range(20):
+                with hdf.session():
+                    hdf[f"thread_{i}/value"] = j
+                    values[i] = hdf[f"thread_{i}/value"]
+
+        threads = [threading.Thread(target=write_read, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=60)
+        self.assertFalse(any(thread.is_alive() for thread in threads))
+        self.assertEqual(values, {i: 19 for i in range(4)})
+        self.assertEqual(
+            self.hdf.list_groups(), ["content"] + [f"thread_{i}" for i in range(4)]
+        )
+
+    def test_claim(self):
+        def claim(h5_path):
+            return h5_path, _claim_hdf_group(file_name=self.hdf5_file, h5_path=h5_path)
+
+        def owns(claimed):
+            return _is_hdf_group_owner(self.hdf5_file, *claimed)
+
+        content, group = claim("content"), claim("content/group")
+        self.assertTrue(owns(content) and owns(group))
+        self.hdf["other"] = 1
+        self.assertTrue(owns(content) and owns(group), "Claim lost by unrelated write!")
+        self.hdf["content/group/value"] = 1
+        self.assertFalse(owns(content), "Claim kept after write inside group!")
+        self.assertFalse(owns(group), "Claim kept after write inside group!")
+        group = claim("content/group")
+        del self.hdf["content"]
+        self.assertFalse(owns(group), "Claim kept after deleting parent group!")
+        content = claim("content")
+        with h5py.File(self.hdf5_file, "a") as f:
+            f["external"] = 1
+        self.assertFalse(owns(content), "Claim kept after external write!")
+        with self.hdf.batch():
+            self.hdf["batch"] = 1
+            self.assertIsNone(_claim_hdf_group(self.hdf5_file, "content"))
+
+    def test_external_write(self):
+        self.assertNotIn("external", self.hdf.list_groups())
+        with h5py.File(self.hdf5_file, "a") as f:
+            f.create_group("external")
+        self.assertIn("external", self.hdf.list_groups())
+        self.hdf.remove_file()
+        self.assertIsNone(_hdf_tree_index_cache.get(file_name=self.hdf5_file))
+        self.assertEqual(self.hdf.list_all(), {"groups": [], "nodes": []})
+
+
+class TestJobContainerPolicy(PyironTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.current_dir = os.path.dirname(os.path.abspath(__file__)).replace("\\", "/")
+        cls.path = os.path.join(cls.current_dir, "job_container_policy")
+
+    def setUp(self):
+        super().setUp()
+        os.makedirs(self.path)
+
+    def tearDown(self):
+        super().tearDown()
+        for f in os.listdir(self.path):
+            os.remove(os.path.join(self.path, f))
+        os.rmdir(self.path)
+
+    def test_applies_to(self):
+        self.assertTrue(JobContainerPolicy().applies_to(job_type="ToyJob"))
+        policy = JobContainerPolicy(job_types=["PythonFunctionContainerJob"])
+        self.assertTrue(policy.applies_to(job_type="PythonFunctionContainerJob"))
+        self.assertFalse(policy.applies_to(job_type="ToyJob"))
+        with self.assertRaises(ValueError):
+            JobContainerPolicy(max_jobs=0)
+
+    def test_container_name(self):
+        policy = JobContainerPolicy(max_jobs=2)
+        self.assertEqual(policy.get_container_name(path=self.path), "job_container_0")
+        hdf = FileHDFio(file_name=os.path.join(self.path, "job_container_0.h5"))
+        hdf["job_container_0/CONTAINER_VERSION"] = "0.1.0"
+        hdf["job_container_0/job_a/status"] = "finished"
+        self.assertEqual(policy.get_container_name(path=self.path), "job_container_0")
+        hdf["job_container_0/job_b/status"] = "finished"
+        self.assertEqual(policy.get_container_name(path=self.path), "job_container_1")
+        self.assertEqual(
+            JobContainerPolicy(max_jobs=2, max_size=1).get_container_name(
+                path=self.path
+            ),
+            "job_container_1",
+        )
+        # files which only share the name with a container are skipped
+        FileHDFio(file_name=os.path.join(self.path, "job_container_1.h5"))["a"] = 1
+        self.assertEqual(policy.get_container_name(path=self.path), "job_container_2")
+
+
+class TestHDFDataset(TestWithProject):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.hdf = cls.project.create_hdf(cls.project.path, "dataset")
+        cls.array = np.arange(60).reshape(10, 2, 3)
+        cls.hdf["output/array"] = cls.array
+        cls.hdf["output/value"] = 1
+        cls.hdf["output/dict"] = {"a": 1}
+
+    def test_properties(self):
+        dataset = self.hdf.dataset("output/array")
+        self.assertIsInstance(dataset, HDFDataset)
+        self.assertEqual(dataset.shape, (10, 2, 3))
+        self.assertEqual(dataset.dtype, self.array.dtype)
+        self.assertEqual(dataset.ndim, 3)
+        self.assertEqual(dataset.size, 60)
+        self.assertEqual(len(dataset), 10)
+        self.assertEqual(
+            self.hdf["output"].dataset("../output/array").shape, (10, 2, 3)
+        )
+
+    def test_slicing(self):
+        dataset = self.hdf.dataset("output/array")
+        for key in [
+            -1,
+            (slice(2, 5), 1),
+            (Ellipsis, 0),
+            slice(None, None, -2),
+            slice(8, 2, -3),
+            np.array([3, 1]),
+            [3, 3, -1],
+            np.arange(10) % 2 == 0,
+            (slice(None), [1, 0]),
+            (1, slice(None, None, -1), [2, 0, 2]),
+            (Ellipsis, [2, 0]),
+        ]:
+            with self.subTest(key=key):
+                self.assertEqual(dataset[key], self.array[key])
+        self.assertEqual(dataset.read(), self.array)
+        self.assertEqual(np.asarray(dataset), self.array)
+        with self.assertRaises(IndexError):
+            dataset[10]
+
+    def test_slicing_is_lazy(self):
+        dataset = self.hdf.dataset("output/array")
+        read = h5py.Dataset.__getitem__
+        keys = []
+
+        def getitem(self, key):
+            keys.append(key)
+            return read(self, key)
+
+        with patch.object(h5py.Dataset, "__getitem__", getitem):
+            for key in [slice(None, None, -2), [3, 3, 1], (1, slice(None, None, -1))]:
+                with self.subTest(key=key):
+                    self.assertEqual(dataset[key], self.array[key])
+                    self.assertNotEqual(keys[-1], ())
+
+    def test_slicing_unsupported(self):
+        dataset = self.hdf.dataset("output/array")
+        for key in [None, ([1, 2], [0, 1]), 1.5, (0, 0, 0, 0)]:
+            with self.subTest(key=key):
+                with self.assertRaises(IndexError):
+                    dataset[key]
+
+    def test_array_copy(self):
+        dataset = self.hdf.dataset("output/array")
+        array = np.asarray(dataset, copy=False)
+        self.assertFalse(array.flags.owndata)
+        self.assertFalse(array.flags.writeable)
+        self.assertEqual(array, self.array)
+        self.assertTrue(np.array(dataset, copy=True).flags.writeable)
+        self.assertEqual(np.asarray(dataset, dtype=float).dtype, np.float64)
+        with self.assertRaises(ValueError):
+            np.asarray(dataset, dtype=float, copy=False)
+        hdf = ProjectHDFio(project=self.project, file_name="compressed_copy")
+        hdf.project.storage_policy = StoragePolicy(compression="gzip", threshold=0)
+        hdf["array"] = self.array
+        with self.assertRaises(ValueError):
+            np.asarray(hdf.dataset("array"), copy=False)
+        hdf.remove_file()
+
+    def test_single_read(self):
+        dataset = self.hdf.dataset("output/array")
+        with patch("pyiron_base.storage.hdfio._open_hdf", wraps=_open_hdf) as opened:
+            dataset[-1]
+        self.assertEqual(opened.call_count, 1)
+
+    def test_mmap(self):
+        array = self.hdf.get("output/array", mmap=True)
+        self.assertIsInstance(array, np.memmap)
+        self.assertFalse(array.flags.writeable)
+        np.testing.assert_array_equal(array, self.array)
+        self.assertIsInstance(
+            self.hdf.dataset("output/array").read(mmap=True), np.memmap
+        )
+        self.assertEqual(self.hdf.get("output/value", mmap=True), 1)
+        self.assertEqual(self.hdf["output"].get("dict", mmap=True), {"a": 1})
+        self.assertEqual(self.hdf.get("output/missing", default=2, mmap=True), 2)
+        hdf = ProjectHDFio(project=self.project, file_name="compressed")
+        hdf.project.storage_policy = StoragePolicy(compression="gzip", threshold=0)
+        hdf["array"] = self.array
+        array = hdf.get("array", mmap=True)
+        self.assertNotIsInstance(array, np.memmap)
+        self.assertEqual(array, self.array)
+        hdf.remove_file()
+
+    def test_not_an_array(self):
+        for path in ["output/value", "output/dict", "output", "output/missing"]:
+            with self.subTest(path=path):
+                with self.assertRaises(ValueError):
+                    self.hdf.dataset(path)
+
+    def test_dataset_view(self):
+        view = DatasetView(hdf=self.hdf)
+        self.assertIsInstance(view["output/array"], HDFDataset)
+        self.assertIsInstance(view["output"], DatasetView)
+        self.assertEqual(view["output"]["array"][0], self.array[0])
+        self.assertEqual(view["output/value"], 1)
+        self.assertEqual(view["output"].list_nodes(), ["array", "dict", "value"])
+
+
+class TestStoragePolicy(TestWithProject):
+    def test_dataset_kwargs(self):
+        policy = StoragePolicy(compression="gzip", compression_level=6, threshold=800)
+        self.assertIsNone(policy.dataset_kwargs(np.zeros(99)))
+        self.assertIsNone(policy.dataset_kwargs(np.array(["a"] * 1000)))
+        self.assertIsNone(policy.dataset_kwargs([0.0] * 1000))
+        self.assertEqual(
+            policy.dataset_kwargs(np.zeros(100)),
+            {
+                "chunks": True,
+                "compression": "gzip",
+                "compression_opts": 6,
+                "shuffle": True,
+            },
+        )
+        self.assertEqual(
+            StoragePolicy(compression="lzf", threshold=0, shuffle=False).dataset_kwargs(
+                np.zeros(2)
+            ),
+            {"chunks": True, "compression": "lzf", "shuffle": False},
+        )
+        self.assertIsNone(StoragePolicy(threshold=0).dataset_kwargs(np.zeros(2)))
+        with self.assertRaises(ValueError):
+            StoragePolicy(compression="zstd")
+
+    def test_from_settings(self):
+        self.assertIsNone(StoragePolicy.from_settings().compression)
+        try:
+            state.update(
+                {
+                    "hdf_compression": "lzf",
+                    "hdf_compression_threshold": "1024",
+                    "hdf_shuffle": "False",
+                }
+            )
+            policy = StoragePolicy.from_settings()
+            self.assertEqual(policy.compression, "lzf")
+            self.assertEqual(policy.threshold, 1024)
+            self.assertFalse(policy.shuffle)
+            hdf = FileHDFio(
+                file_name=os.path.join(self.project_path, "settings_policy.h5")
+            )
+            hdf["array"] = np.ones(1000)
+            with h5py.File(hdf.file_name, "r") as f:
+                self.assertEqual(f["array"].compression, "lzf")
+            hdf.remove_file()
+        finally:
+            state.update(self._initial_settings_configuration)
+
+    def test_project_policy(self):
+        pr = self.project.open("policy")
+        pr.storage_policy = StoragePolicy(compression="gzip", threshold=1024)
+        hdf = ProjectHDFio(project=pr, file_name="policy", h5_path="/policy")
+        hdf["small"] = np.arange(10)
+        hdf["large"] = np.ones((100, 100))
+        hdf.write_dict(data_dict={"group/large": np.arange(1000.0)})
+        with hdf.open("group") as group:
+            self.assertIs(group.storage_policy, pr.storage_policy)
+        with h5py.File(hdf.file_name, "r") as f:
+            self.assertIsNone(f["policy/small"].compression)
+            self.assertEqual(f["policy/large"].compression, "gzip")
+            self.assertEqual(f["policy/group/large"].compression, "gzip")
+        self.assertEqual(hdf["small"], np.arange(10))
+        self.assertEqual(hdf["large"], np.ones((100, 100)))
+        self.assertEqual(hdf["group/large"], np.arange(1000.0))
+        hdf.remove_file()
+        self.assertIsNone(
+            self.project.create_hdf(pr.path, "x").storage_policy.compression
+        )
+
+    def test_recompress(self):
+        hdf = self.project.create_hdf(self.project.path, "recompress")
+        hdf["large"] = np.ones((100, 100))
+        hdf["small"] = np.ones(10)
+        policy = StoragePolicy(compression="gzip", threshold=1024)
+        with h5py.File(hdf.file_name, "a") as f:
+            self.assertEqual(_recompress_hdf(hdf=f, storage_policy=policy), 1)
+            self.assertEqual(_recompress_hdf(hdf=f, storage_policy=policy), 0)
+            self.assertEqual(f["recompress/large"].compression, "gzip")
+            self.assertEqual(_recompress_hdf(hdf=f, storage_policy=StoragePolicy()), 1)
+            self.assertIsNone(f["recompress/large"].compression)
+        self.assertEqual(hdf["large"], np.ones((100, 100)))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,15 @@
+import importlib.util
+import unittest
 import warnings
+import h5py
 import numpy as np
 
 from pyiron_base._tests import TestWithProject
-from pyiron_base.storage.flattenedstorage import FlattenedStorage, get_dtype_and_fill
+from pyiron_base.storage.flattenedstorage import (
+    FlattenedStorage,
+    _HDFDatasetArray,
+    get_dtype_and_fill,
+)
 
 
 class TestFlattenedStorage(TestWithProject):
@@ -225,6 +232,62 @@ class TestFlattenedStorage(TestWithProject):
         ):
             store.find_chunk("asdf")
 
+        store.add_chunk(1, "fourth", integers=[6])
+        self.assertEqual(
+            store.find_chunk("fourth"),
+            3,
+            "Incorrect chunk index returned for chunk added after lookup!",
+        )
+        store["identifier", 0] = "zeroth"
+        self.assertEqual(
+            store.find_chunk("zeroth"),
+            0,
+            "Incorrect chunk index returned for renamed chunk!",
+        )
+        with self.assertRaises(
+            KeyError, msg="No KeyError raised on identifier of renamed chunk!"
+        ):
+            store.find_chunk("first")
+
+        other = FlattenedStorage()
+        other.add_chunk(1, "fifth", integers=[7])
+        store.extend(other)
+        self.assertEqual(
+            store.find_chunk("fifth"),
+            4,
+            "Incorrect chunk index returned for extended chunk!",
+        )
+        self.assertEqual(
+            store.split(["integers"]).find_chunk("third"),
+            2,
+            "Incorrect chunk index returned for split storage!",
+        )
+        self.assertEqual(
+            store.sample(lambda s, i: i % 2 == 1).find_chunk("fourth"),
+            1,
+            "Incorrect chunk index returned for sampled storage!",
+        )
+
+    def test_find_chunks(self):
+        """find_chunks() should return the indices of all given identifiers."""
+        store = FlattenedStorage()
+        for i in range(10):
+            store.add_chunk(1, f"chunk_{i}", integers=[i])
+        indices = store.find_chunks(["chunk_3", "chunk_0", "chunk_9", "chunk_3"])
+        self.assertEqual(
+            indices.tolist(), [3, 0, 9, 3], "Incorrect chunk indices returned!"
+        )
+        self.assertEqual(
+            store.get_array("integers")[indices].tolist(),
+            [3, 0, 9, 3],
+            "Chunk indices cannot be used to index per chunk arrays!",
+        )
+        self.assertEqual(len(store.find_chunks([])), 0)
+        with self.assertRaises(
+            KeyError, msg="No KeyError raised on non-existing identifier!"
+        ):
+            store.find_chunks(["chunk_1", "asdf"])
+
     def test_add_chunk_add_array(self):
         """Adding arrays via add_chunk and add_array should be equivalent."""
 
@@ -535,6 +598,75 @@ class TestFlattenedStorage(TestWithProject):
                 f"Element array {k} present in sample storage, but wrong dtype!",
             )
 
+    def test_select(self):
+        """Calling select should return a storage with the chunks given by a mask or indices."""
+        store = FlattenedStorage(
+            even=self.even, odd=self.odd, even_sum=self.even_sum, odd_sum=self.odd_sum
+        )
+        masked = store.select(np.array([True, False, True]))
+        self.assertEqual(
+            masked["identifier"].tolist(),
+            ["0", "2"],
+            "select with mask selected wrong chunks!",
+        )
+        self.assertEqual(masked["even"].tolist(), self.even[0] + self.even[2])
+        self.assertEqual(
+            masked["even_sum"].tolist(), [self.even_sum[0], self.even_sum[2]]
+        )
+        indexed = store.select([2, 0])
+        self.assertEqual(
+            indexed["identifier"].tolist(),
+            ["2", "0"],
+            "select with indices did not keep the given order!",
+        )
+        self.assertEqual(indexed.get_array("odd", 0).tolist(), list(self.odd[2]))
+        self.assertEqual(indexed.get_array("odd", 1).tolist(), list(self.odd[0]))
+        self.assertEqual(indexed.find_chunk("0"), 1)
+        empty = store.select([])
+        self.assertEqual(len(empty), 0, "Length not zero after selecting no chunks!")
+        self.assertEqual(empty.list_arrays(), store.list_arrays())
+        with self.assertRaises(
+            ValueError, msg="No ValueError on mask of wrong length!"
+        ):
+            store.select([True, False])
+
+    def test_add_chunks(self):
+        """add_chunks should give the same storage as adding the chunks one by one."""
+        chunks = FlattenedStorage()
+        chunks.add_chunks(
+            [len(e) for e in self.even],
+            even=np.concatenate(self.even),
+            even_sum=self.even_sum,
+        )
+        chunks.add_chunks(
+            [len(o) for o in self.odd],
+            identifiers=["a", "b", "c"],
+            even=np.concatenate(self.odd),
+            even_sum=self.odd_sum,
+        )
+        chunk = FlattenedStorage()
+        for e, s in zip(self.even, self.even_sum):
+            chunk.add_chunk(len(e), even=e, even_sum=s)
+        for i, o, s in zip("abc", self.odd, self.odd_sum):
+            chunk.add_chunk(len(o), identifier=i, even=o, even_sum=s)
+        self.assertEqual(len(chunks), len(chunk))
+        self.assertEqual(chunks.list_arrays(), chunk.list_arrays())
+        for k in chunk.list_arrays():
+            self.assertEqual(
+                chunks[k].tolist(),
+                chunk[k].tolist(),
+                f"Array {k} not equal after adding chunks in bulk!",
+            )
+        self.assertEqual(chunks.has_array("even_sum")["per"], "chunk")
+        self.assertEqual(chunks.get_array("even", "b").tolist(), list(self.odd[1]))
+
+        chunks.add_chunks([], even=[], even_sum=[])
+        self.assertEqual(len(chunks), 6, "Adding no chunks changed the storage!")
+        with self.assertRaises(ValueError, msg="No ValueError on wrong array length!"):
+            chunks.add_chunks([1, 2], even=[1, 2])
+        with self.assertRaises(ValueError, msg="No ValueError on wrong identifiers!"):
+            chunks.add_chunks([1, 2], identifiers=["x"])
+
     def test_join(self):
         """All arrays should be present in joined storage."""
         even_store = FlattenedStorage(even=self.even, even_sum=self.even_sum)
@@ -711,6 +843,145 @@ class TestFlattenedStorage(TestWithProject):
                 "per chunk values not equal after reading from HDF!",
             )
 
+    def test_hdf_strings(self):
+        """String arrays of any shape and content should be read back with the same values and width."""
+        store = FlattenedStorage()
+        store.add_array("ascii", dtype="<2U", per="element")
+        store.add_array("unicode", dtype="<3U", shape=(2,), per="element")
+        store.add_array("label", dtype="<4U", shape=(2, 2), per="chunk")
+        store.add_chunk(
+            2,
+            ascii=["Fe", "Al"],
+            unicode=[["ä", "b"], ["c", "Öl"]],
+            label=[["a", "bb"], ["ccc", "dddd"]],
+        )
+        hdf = self.project.create_hdf(self.project.path, "strings")
+        store.to_hdf(hdf)
+        read = FlattenedStorage()
+        read.from_hdf(hdf)
+        for name in ["ascii", "unicode", "label"]:
+            with self.subTest(name=name):
+                array = store.get_array(name)
+                array_read = read.get_array(name)
+                self.assertEqual(array.dtype, array_read.dtype)
+                self.assertEqual(array.tolist(), array_read.tolist())
+
+    def test_hdf_lazy(self):
+        """Arrays should only be read from HDF on first access, without changing the content of the storage."""
+        store = FlattenedStorage()
+        store.add_array("energy", per="chunk")
+        store.add_array("forces", shape=(3,), per="element")
+        for i in range(3):
+            store.add_chunk(
+                i + 1, identifier=f"chunk_{i}", energy=-i, forces=np.ones((i + 1, 3))
+            )
+        hdf = self.project.create_hdf(self.project.path, "lazy")
+        store.to_hdf(hdf)
+
+        read = FlattenedStorage()
+        read.from_hdf(hdf)
+        self.assertEqual(sorted(read.list_arrays()), sorted(store.list_arrays()))
+        self.assertEqual(len(read), len(store))
+        self.assertEqual(
+            [k for k, _ in read._loaded_arrays(read._per_element_arrays)],
+            [],
+            "Per element arrays read before access!",
+        )
+        self.assertEqual(read.get_array("energy", 2), -2)
+        self.assertEqual(
+            [k for k, _ in read._loaded_arrays(read._per_element_arrays)],
+            [],
+            "Per element arrays read when accessing a per chunk array!",
+        )
+
+        with self.subTest("copy"):
+            copy = read.copy()
+            self.assertTrue(np.array_equal(copy["forces"], store["forces"]))
+        with self.subTest("split"):
+            split = read.split(["forces"])
+            self.assertEqual(
+                split.list_arrays(only_user=True), ["identifier", "forces"]
+            )
+            self.assertTrue(np.array_equal(split["forces", 1], store["forces", 1]))
+        with self.subTest("extend"):
+            extended = FlattenedStorage()
+            extended.from_hdf(hdf)
+            extended.extend(store)
+            self.assertEqual(len(extended), 6)
+            self.assertTrue(np.array_equal(extended["forces", 5], store["forces", 2]))
+        with self.subTest("save"):
+            read = FlattenedStorage()
+            read.from_hdf(hdf)
+            read.add_chunk(1, identifier="chunk_3", energy=-3, forces=np.ones((1, 3)))
+            read.to_hdf(hdf)
+            reread = FlattenedStorage()
+            reread.from_hdf(hdf)
+            self.assertEqual(len(reread), 4)
+            self.assertEqual(reread["identifier", 0], "chunk_0")
+            self.assertTrue(np.array_equal(reread["forces"], np.ones((7, 3))))
+
+    def test_disk(self):
+        """Storages kept on disk should behave like in memory storages and be readable from HDF."""
+        hdf = self.project.create_hdf(self.project.path, "disk")
+        store = FlattenedStorage()
+        store.add_chunk(2, identifier="first", energy=1.0, forces=np.ones((2, 3)))
+        store.to_disk(hdf)
+        self.assertIsInstance(store._per_element_arrays["forces"], _HDFDatasetArray)
+        for i in range(5):
+            store.add_chunk(
+                3, energy=i, forces=np.full((3, 3), i), symbols=["Fe", "Al", "Nickel"]
+            )
+        store.add_array("charges", fill=0.5)
+        self.assertIsInstance(store._per_element_arrays["symbols"], _HDFDatasetArray)
+        self.assertEqual(store["symbols", 3].tolist(), ["Fe", "Al", "Nickel"])
+        self.assertEqual(store["charges", 1].tolist(), [0.5] * 3)
+        self.assertTrue(np.array_equal(store["forces", 4], np.full((3, 3), 3)))
+        store.flush()
+
+        read = FlattenedStorage()
+        read.from_hdf(hdf)
+        self.assertEqual(len(read), 6)
+        self.assertEqual(sorted(read.list_arrays()), sorted(store.list_arrays()))
+        for k in store.list_arrays():
+            self.assertEqual(
+                read[k].tolist(),
+                store[k].tolist(),
+                f"Array {k} not equal after reading storage kept on disk!",
+            )
+
+        with self.subTest("from_disk"):
+            disk = FlattenedStorage.from_disk(hdf)
+            self.assertIsInstance(disk._per_element_arrays["forces"], _HDFDatasetArray)
+            self.assertTrue(np.array_equal(disk["forces", "first"], np.ones((2, 3))))
+            disk.add_chunks(
+                [1, 1], energy=[7, 8], forces=np.zeros((2, 3)), symbols=["H", "He"]
+            )
+            disk.del_array("charges")
+            disk.flush()
+            read = FlattenedStorage.from_disk(hdf)
+            self.assertEqual(len(read), 8)
+            self.assertEqual(read["symbols"][-2:].tolist(), ["H", "He"])
+            self.assertFalse(read.has_array("charges"))
+
+        with self.subTest("copy"):
+            copy = disk.copy()
+            self.assertIsInstance(copy._per_element_arrays["forces"], np.ndarray)
+            copy["forces", 0] = np.zeros((2, 3))
+            self.assertTrue(np.array_equal(disk["forces", 0], np.ones((2, 3))))
+            selected = disk.select(disk["energy"] > 3)
+            self.assertEqual(selected["energy"].tolist(), [4, 7, 8])
+            self.assertIsInstance(selected._per_element_arrays["forces"], np.ndarray)
+
+        with self.subTest("to_hdf"):
+            disk.to_hdf(hdf, "copy")
+            read = FlattenedStorage()
+            read.from_hdf(hdf, "copy")
+            self.assertTrue(np.array_equal(read["forces"], disk["forces"]))
+
+        with self.subTest("flush"):
+            with self.assertRaises(ValueError):
+                FlattenedStorage().flush()
+
     def test_fill_value(self):
         """Test if fill values are correctly assigned when resizing an array and if self._fill_value is correctly read from hdf."""
         # Test for per chunk arrays
@@ -999,6 +1270,75 @@ class TestFlattenedStorage(TestWithProject):
                         "dtype not conserved with explode=True!",
                     )
 
+    def test_reduce(self):
+        """reduce should give the same results as reducing every chunk on its own."""
+        store = FlattenedStorage()
+        store.add_array("forces", shape=(3,))
+        for i, n in enumerate([2, 0, 3, 1]):
+            store.add_chunk(n, energy=np.arange(n) * i, forces=np.full((n, 3), i))
+        # overwrite the first chunk, so that its elements are stored after the others
+        store.current_chunk_index = 0
+        store.add_chunk(2, energy=[5, 7], forces=np.ones((2, 3)))
+        store.current_chunk_index = 4
+        filled = store["length"] > 0
+        for func, reduction in (
+            ("sum", np.sum),
+            ("max", np.max),
+            ("mean", np.mean),
+            (np.minimum, np.min),
+        ):
+            with self.subTest(func=func):
+                reduced = store.reduce("energy", func, empty=-1)
+                self.assertEqual(
+                    reduced[filled].tolist(),
+                    [reduction(e) for e in store.get_array_ragged("energy")[filled]],
+                )
+                self.assertEqual(reduced[~filled].tolist(), [-1])
+        self.assertEqual(store.reduce("energy").tolist(), [12, 0, 6, 0])
+        self.assertTrue(np.isnan(store.reduce("energy", "mean")[1]))
+        self.assertEqual(
+            store.reduce("forces").tolist(), [[2] * 3, [0] * 3, [6] * 3, [3] * 3]
+        )
+        self.assertEqual(
+            store.reduce(store["energy"] > 1, np.logical_or).tolist(),
+            [True, False, True, False],
+        )
+        with self.assertRaises(ValueError, msg="max has no identity for empty chunks"):
+            store.reduce("energy", "max")
+        with self.assertRaises(ValueError):
+            store.reduce("energy", "median")
+        with self.assertRaises(ValueError):
+            store.reduce(np.ones(3))
+        with self.assertRaises(KeyError):
+            store.reduce("identifier")
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("pyarrow") is not None, "pyarrow not installed"
+    )
+    def test_to_arrow(self):
+        """to_arrow should store per element arrays as list columns."""
+        store = FlattenedStorage()
+        store.add_array("forces", shape=(3,))
+        store.add_array("symbols", dtype="U2")
+        store.add_chunk(2, energy=1.0, forces=np.ones((2, 3)), symbols=["Fe", "Al"])
+        store.add_chunk(1, energy=2.0, forces=np.zeros((1, 3)), symbols=["O"])
+        table = store.to_arrow()
+        self.assertEqual(
+            sorted(table.column_names), sorted(store.list_arrays(only_user=True))
+        )
+        for k in table.column_names:
+            with self.subTest(array=k):
+                self.assertEqual(
+                    table[k].to_pylist(),
+                    [np.asarray(a).tolist() for a in store.get_array_ragged(k)],
+                )
+        df = store.to_pandas(dtype_backend="pyarrow")
+        self.assertEqual(df["symbols"].tolist(), [["Fe", "Al"], ["O"]])
+        with self.assertRaises(ValueError):
+            store.to_pandas(explode=True, dtype_backend="pyarrow")
+        with self.assertRaises(ValueError):
+            store.to_pandas(dtype_backend="polars")
+
 
 class TestFlattenedStorageMissingCoverage(TestWithProject):
     """Additional tests to cover missing lines in flattenedstorage.py."""
@@ -1194,3 +1534,122 @@ class TestFlattenedStorageMissingCoverage(TestWithProject):
         store.add_chunk(1, identifier="a")
         with self.assertRaises(ValueError):
             get_dtype_and_fill(store, "bar")
+
+    def test_hdf_append(self):
+        """Writing a storage again should only append new chunks, unless old chunks or arrays changed."""
+        hdf = self.project.create_hdf(self.project.path, "append")
+
+        def resizable(name):
+            with h5py.File(hdf.file_name, "r") as f:
+                return (
+                    f[f"{hdf.h5_path}/{store._get_hdf_group_name()}/{name}"].maxshape[0]
+                    is None
+                )
+
+        def check():
+            read = FlattenedStorage()
+            read.from_hdf(hdf)
+            self.assertEqual(sorted(read.list_arrays()), sorted(store.list_arrays()))
+            for k in store.list_arrays():
+                self.assertEqual(
+                    read[k].tolist(),
+                    store[k].tolist(),
+                    f"Array {k} not equal after writing storage again!",
+                )
+
+        store = FlattenedStorage()
+        store.add_array("symbols", dtype="U2", per="element")
+        store.add_chunk(2, identifier="first", energy=1.0, symbols=["Fe", "Al"])
+        store.to_hdf(hdf)
+        self.assertFalse(resizable("element_arrays/symbols"))
+        store.add_chunks([1, 2], energy=[2.0, 3.0], symbols=["Cu", "Ni", "O"])
+        store.to_hdf(hdf)
+        self.assertTrue(resizable("element_arrays/symbols"))
+        self.assertTrue(resizable("chunk_arrays/energy"))
+        check()
+
+        with self.subTest("schema change"):
+            store.add_array("charges", fill=0.5)
+            store.add_chunk(1, energy=4.0, symbols=["H"], charges=[-1])
+            store.to_hdf(hdf)
+            self.assertTrue(resizable("element_arrays/symbols"))
+            self.assertFalse(resizable("element_arrays/charges"))
+            check()
+            store.add_chunk(1, energy=5.0, symbols=["Helium"], charges=[-2])
+            store.to_hdf(hdf)
+            check()
+
+        with self.subTest("modified"):
+            store["energy", 0] = -1.0
+            store.to_hdf(hdf)
+            self.assertFalse(resizable("chunk_arrays/energy"))
+            check()
+
+        with self.subTest("read"):
+            read = FlattenedStorage()
+            read.from_hdf(hdf)
+            read.add_chunk(1, energy=6.0, symbols=["Li"], charges=[0])
+            read.to_hdf(hdf)
+            self.assertTrue(resizable("chunk_arrays/energy"))
+            store = read
+            check()
+
+        with self.subTest("other storage"):
+            other = FlattenedStorage()
+            other.add_chunk(1, energy=0.0)
+            other.to_hdf(hdf)
+            store.add_chunk(1, energy=7.0, symbols=["Be"], charges=[1])
+            store.to_hdf(hdf)
+            check()
+
+    def test_hdf_append_in_place(self):
+        """Writing a storage again should write arrays changed in place via views in full."""
+        hdf = self.project.create_hdf(self.project.path, "append_in_place")
+
+        def resizable(name):
+            with h5py.File(hdf.file_name, "r") as f:
+                return (
+                    f[f"{hdf.h5_path}/{store._get_hdf_group_name()}/{name}"].maxshape[0]
+                    is None
+                )
+
+        def check():
+            read = FlattenedStorage()
+            read.from_hdf(hdf)
+            for k in store.list_arrays():
+                self.assertEqual(
+                    read[k].tolist(),
+                    store[k].tolist(),
+                    f"Array {k} not equal after writing storage again!",
+                )
+
+        store = FlattenedStorage()
+        store.add_array("pos", shape=(3,), dtype=np.float64, per="element")
+        store.add_chunk(2, pos=np.zeros((2, 3)), energy=1.0)
+        store.add_chunk(1, pos=np.ones((1, 3)), energy=2.0)
+        store.to_hdf(hdf)
+        store["pos"][0] = [7, 7, 7]
+        store["energy"][1] = 5
+        store.to_hdf(hdf)
+        check()
+
+        with self.subTest("read only"):
+            store.add_chunk(1, pos=np.ones((1, 3)), energy=3.0)
+            store.to_hdf(hdf)
+            store.add_chunk(1, pos=np.ones((1, 3)), energy=4.0)
+            store.to_hdf(hdf)
+            self.assertTrue(
+                resizable("element_arrays/pos"),
+                "Reading arrays should not prevent appending to them!",
+            )
+            check()
+
+        with self.subTest("live view"):
+            pos = store["pos", 1]
+            store.to_hdf(hdf)
+            pos[0] = [3, 3, 3]
+            store.to_hdf(hdf)
+            check()
+            self.assertEqual(
+                store["pos"][2].tolist(), [3, 3, 3], "Change via view not written!"
+            )
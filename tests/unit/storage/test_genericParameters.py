@@ -310,6 +310,41 @@ class TestGenericParameters(PyironTestCase):
         with self.assertRaises(AssertionError):
             gp.define_blocks(block_dict)
 
+    def test_key_index(self):
+        """Lookups should stay consistent with the parameters after every kind of modification."""
+        gp = GenericParameters()
+        gp.load_string("a 1\nb 2\nc 3")
+        self.assertEqual(gp._find_line("b"), 1)
+        gp.set(d=4)
+        self.assertEqual(gp._find_line("d"), 3)
+        gp.remove_keys(["a", "c"])
+        self.assertEqual(gp.keys(), ["b", "d"])
+        self.assertEqual(gp._find_line("d"), 1)
+        self.assertEqual(gp._find_line("a"), -1)
+        gp.load_string("x 1\ny 2")
+        self.assertEqual(gp._find_line("y"), 1)
+        self.assertEqual(gp._find_line("b"), -1)
+        gp._dataset["Parameter"][1] = "z"
+        self.assertEqual(
+            gp._find_line("y", verify=True), -1, "Renamed parameter still found!"
+        )
+        self.assertEqual(gp._find_line("z"), 1)
+        gp.set(z=3, u=4)
+        self.assertEqual(gp.keys(), ["x", "z", "u"])
+        self.assertEqual(gp["z"], 3)
+        gp._insert(
+            line_number=0,
+            data_dict={"Parameter": ["w"], "Value": ["0"], "Comment": [""]},
+        )
+        self.assertEqual(gp._find_line("z"), 2)
+        gp._dataset["Parameter"].append("z")
+        gp._dataset["Value"].append("3")
+        gp._dataset["Comment"].append("")
+        with self.assertRaises(ValueError):
+            gp._find_line("z")
+        with self.assertRaises(ValueError):
+            gp._append(w=1)
+
     def test_hdf_from_dict(self):
         pr = Project(self.file_location)
         file_name = os.path.join(self.file_location, "genericpara.h5")
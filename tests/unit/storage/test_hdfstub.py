@@ -32,3 +32,11 @@ class TestHDFStub(TestWithProject):
                 v2,
                 "Data container values read with load() not equal to original container.",
             )
+
+    def test_dataset(self):
+        """Arrays should be partially readable through the stub without loading them."""
+        dataset = HDFStub(self.hdf, "array").dataset()
+        self.assertEqual(dataset.shape, (100,))
+        self.assertTrue(np.all(dataset[-10:] == np.arange(90, 100)))
+        with self.assertRaises(ValueError):
+            HDFStub(self.hdf, "number").dataset()
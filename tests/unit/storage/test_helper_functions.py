@@ -3,7 +3,7 @@ import posixpath
 import numpy as np
 import h5py
 from unittest import TestCase
-from pyiron_base.storage.hdfio import _list_groups_and_nodes
+from pyiron_base.storage.hdfio import _list_all_from_open_hdf, _list_groups_and_nodes
 from h5io_browser import read_nested_dict_from_hdf
 from h5io_browser.base import write_dict_to_hdf, _read_hdf, _write_hdf
 
@@ -113,6 +113,17 @@ class TestWriteHdfIO(TestCase):
         self.assertEqual(list(sorted(groups)), ["c"])
         self.assertEqual(list(sorted(nodes)), ["a", "b"])
 
+    def test_list_all_from_open_hdf(self):
+        with h5py.File(self.file_name, "r") as f:
+            self.assertEqual(
+                _list_all_from_open_hdf(hdf=f, h5_path="data_hierarchical"),
+                {"groups": ["c"], "nodes": ["a", "b"]},
+            )
+            self.assertEqual(
+                _list_all_from_open_hdf(hdf=f, h5_path="does_not_exist"),
+                {"groups": [], "nodes": []},
+            )
+
 
 class TestWriteDictHdfIO(TestCase):
     def setUp(self):
@@ -0,0 +1,53 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+import subprocess
+import sys
+import unittest
+
+import pyiron_base
+
+
+def _loaded_modules(code):
+    """Run code in a fresh interpreter and return the names of the modules it loaded."""
+    output = subprocess.check_output(
+        [sys.executable, "-c", code + "\nimport sys\nprint(' '.join(sys.modules))"],
+        text=True,
+    )
+    return set(output.split())
+
+
+class TestLazyImport(unittest.TestCase):
+    def test_import_is_lean(self):
+        modules = _loaded_modules("import pyiron_base")
+        for name in ["h5py", "pandas", "pysqa", "sqlalchemy", "pyiron_base.project"]:
+            with self.subTest(name):
+                self.assertNotIn(name, modules)
+
+    def test_wrapper_cli_is_lean(self):
+        modules = _loaded_modules(
+            "from pyiron_base.cli.control import _get_cli_modules\n"
+            "_get_cli_modules(['wrapper', '-j', '1'])"
+        )
+        self.assertIn("pyiron_base.cli.wrapper", modules)
+        for name in ["pyiron_base.cli.ls", "pyiron_base.jobs.datamining"]:
+            with self.subTest(name):
+                self.assertNotIn(name, modules)
+
+    def test_api(self):
+        from pyiron_base.project.generic import Project
+
+        self.assertIs(pyiron_base.Project, Project)
+        for name in pyiron_base.__all__:
+            with self.subTest(name):
+                self.assertTrue(hasattr(pyiron_base, name))
+                self.assertIn(name, dir(pyiron_base))
+        self.assertIs(pyiron_base.state, sys.modules["pyiron_base.state"].state)
+        self.assertIs(pyiron_base.storage, sys.modules["pyiron_base.storage"])
+        with self.assertRaises(AttributeError):
+            pyiron_base.does_not_exist
+
+
+if __name__ == "__main__":
+    unittest.main()